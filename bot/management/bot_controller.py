@@ -8,7 +8,8 @@ from django.db.models import QuerySet
 from bot.tg.client import TgClient
 from bot.tg.dc import Message, GetUpdatesResponse
 from bot.models import TelegramUser
-from goals.models.goal import Goal
+from goals.models.board import BoardParticipant
+from goals.models.goal import Goal, visible_goals
 from diploma_project_pd12.settings import RANDOM_STRING_CHARS
 from goals.models.goal_category import GoalCategory
 
@@ -146,13 +147,10 @@ class Controller(object):
         """
         # Return a queryset of goals the user is a participant of
         return (
-            Goal.objects.select_related("category")
+            Goal.objects.select_related("category", "board")
             .filter(
-                category__board__participants__user=user.user,
-                category__board__is_deleted=False,
-                category__is_deleted=False,
+                visible_goals(), board_id__in=BoardParticipant.objects.filter(user=user.user).values("board_id")
             )
-            .exclude(status=Goal.Status.archived)
         )
 
     # ----------------------------------------------------------------
@@ -250,10 +250,10 @@ class BotMachine(object):
                         for goal in goals:
                             self.client.send_message(
                                 chat_id=message.chat.id,
-                                text=f"Ваша цель: <a href='http://{self.host}/boards/{goal.category.board.id}"
-                                     f"/categories/{goal.category.id}/goals?goal={goal.id}'><b>{goal.title}</b></a> \n"
+                                text=f"Ваша цель: <a href='http://{self.host}/boards/{goal.board_id}"
+                                     f"/categories/{goal.category_id}/goals?goal={goal.id}'><b>{goal.title}</b></a> \n"
                                      f"Категория: {goal.category} \n"
-                                     f"Доска: {goal.category.board} \n"
+                                     f"Доска: {goal.board} \n"
                                      f"Подробности: {goal.description if goal.description != '' else 'Нет описания'}",
                                 parse_mode="HTML",
                             )
@@ -435,8 +435,8 @@ class BotMachine(object):
 
                     self.client.send_message(
                         chat_id=message.chat.id,
-                        text=f"Ваша цель <a href='http://just-for.site/boards/{goal.category.board.id}"
-                             f"/categories/{goal.category.id}/goals?goal={goal.id}'><b>{goal.title}</b></a> "
+                        text=f"Ваша цель <a href='http://just-for.site/boards/{goal.board_id}"
+                             f"/categories/{goal.category_id}/goals?goal={goal.id}'><b>{goal.title}</b></a> "
                              f"успешно создана! \n"
                              f"Вы можете посмотреть ее в приложении, перейдя по ссылке \n\n"
                              f"Выберите одну из доступных команд:",
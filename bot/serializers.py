@@ -2,12 +2,13 @@ from rest_framework import serializers
 
 from bot.models import TelegramUser
 from bot.tg.client import TgClient
+from core.timing import TimedSerializerMixin
 from diploma_project_pd12.settings import env
 
 
 # ----------------------------------------------------------------------------------------------------------------------
 # Create serializers
-class TelegramUserVerificationSerializer(serializers.ModelSerializer):
+class TelegramUserVerificationSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for verifying a Telegram user's identity
     and linking their account to their Telegram account
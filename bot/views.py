@@ -9,11 +9,12 @@ from rest_framework.serializers import BaseSerializer
 from bot.models import TelegramUser
 from bot.serializers import TelegramUserVerificationSerializer
 from core.models import User
+from core.timing import TimedViewMixin
 
 
 # ----------------------------------------------------------------------------------------------------------------------
 # Create views
-class TelegramUserVerificationView(UpdateAPIView):
+class TelegramUserVerificationView(TimedViewMixin, UpdateAPIView):
     """
     View for verifying a Telegram user's identity and linking their account to their Telegram account
     """
@@ -0,0 +1,54 @@
+from typing import Any
+
+import msgpack
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+from core.renderers import MSGPACK_MEDIA_TYPE
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create parsers
+class ORJSONParser(BaseParser):
+    """JSON parser built on orjson, rejecting NaN and Infinity like the DRF JSON parser"""
+
+    media_type: str = "application/json"
+
+    def parse(self, stream, media_type=None, parser_context=None) -> Any:
+        """
+        Returns the data of a JSON request body
+
+        Raises:
+            ParseError: If the body is not valid JSON
+        """
+        encoding: str = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        body: bytes = stream.read() if stream is not None else b""
+
+        try:
+            return orjson.loads(body if encoding.lower().replace("-", "") == "utf8" else body.decode(encoding))
+        except (orjson.JSONDecodeError, UnicodeDecodeError) as error:
+            raise ParseError(f"JSON parse error - {error}")
+
+
+# ----------------------------------------------------------------
+class MessagePackParser(BaseParser):
+    """MessagePack parser for request bodies encoded like the responses of the MessagePack renderer"""
+
+    media_type: str = MSGPACK_MEDIA_TYPE
+
+    def parse(self, stream, media_type=None, parser_context=None) -> Any:
+        """
+        Returns the data of a MessagePack request body,
+        timestamps are decoded into datetimes in UTC and integer keys, like the choices of statistics, are kept
+
+        Raises:
+            ParseError: If the body is not valid MessagePack
+        """
+        body: bytes = stream.read() if stream is not None else b""
+
+        try:
+            return msgpack.unpackb(body, raw=False, timestamp=3, strict_map_key=False)
+        except (ValueError, msgpack.UnpackException) as error:
+            raise ParseError(f"MessagePack parse error - {error}")
@@ -0,0 +1,69 @@
+from typing import Any, Optional
+
+import msgpack
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Renderer settings
+# Datetimes, Decimals, lazy strings and other values unknown to orjson are encoded the way the DRF encoder does
+ORJSON_OPTIONS: int = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+LINE_SEPARATORS: tuple = ((b"\xe2\x80\xa8", b"\\u2028"), (b"\xe2\x80\xa9", b"\\u2029"))
+# Media type of MessagePack, the IANA registration is still a draft
+MSGPACK_MEDIA_TYPE: str = "application/msgpack"
+
+_encoder = JSONEncoder()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create renderers
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer built on orjson producing the output of the DRF JSON renderer
+
+    Compact UTF-8 output with the line separators escaped for JavaScript,
+    an indent requested in the Accept header gives two spaces, the only indent of orjson
+    """
+
+    media_type: str = "application/json"
+    format: str = "json"
+    charset: Optional[str] = None
+
+    def render(self, data: Any, accepted_media_type: Optional[str] = None, renderer_context=None) -> bytes:
+        """Returns the data encoded as JSON"""
+        if data is None:
+            return b""
+
+        options: int = ORJSON_OPTIONS
+        if accepted_media_type and "indent" in accepted_media_type:
+            options |= orjson.OPT_INDENT_2
+
+        rendered: bytes = orjson.dumps(data, default=_encoder.default, option=options)
+        for separator, escaped in LINE_SEPARATORS:
+            if separator in rendered:
+                rendered = rendered.replace(separator, escaped)
+
+        return rendered
+
+
+# ----------------------------------------------------------------
+class MessagePackRenderer(BaseRenderer):
+    """
+    MessagePack renderer producing the data of the JSON renderer in binary form
+
+    Values unknown to MessagePack are converted by the DRF encoder, so datetimes, dates and Decimals
+    arrive as the same strings as in JSON and a client decodes them the same way for both formats
+    """
+
+    media_type: str = MSGPACK_MEDIA_TYPE
+    format: str = "msgpack"
+    charset: Optional[str] = None
+    render_style: str = "binary"
+
+    def render(self, data: Any, accepted_media_type: Optional[str] = None, renderer_context=None) -> bytes:
+        """Returns the data encoded as MessagePack"""
+        if data is None:
+            return b""
+
+        return msgpack.packb(data, default=_encoder.default, use_bin_type=True)
@@ -4,11 +4,12 @@ from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
 
 from core.models import User
+from core.timing import TimedSerializerMixin
 
 
 # ----------------------------------------------------------------------------------------------------------------------
 # User serializers
-class UserSignupSerializer(serializers.ModelSerializer):
+class UserSignupSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     Signup serializer for CreateAPIView
     Handles user registration with password validation and hashing
@@ -61,13 +62,13 @@ class UserSignupSerializer(serializers.ModelSerializer):
         """
         new_user: User = User.objects.create(**validated_data)
         new_user.set_password(validated_data["password"])
-        new_user.save()
+        new_user.save(update_fields=("password",))
 
         return new_user
 
 
 # ----------------------------------------------------------------
-class UserLoginSerializer(serializers.Serializer):
+class UserLoginSerializer(TimedSerializerMixin, serializers.Serializer):
     """
     Login serializer for CreateAPIView
     Handles user authentication by checking if the provided username exists in the database
@@ -96,7 +97,7 @@ class UserLoginSerializer(serializers.Serializer):
 
 
 # ----------------------------------------------------------------
-class UserRetrieveUpdateSerializer(serializers.ModelSerializer):
+class UserRetrieveUpdateSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for RetrieveUpdateDestroyAPIView
     Handles user profile retrieval and updates, ensuring that the updated username is unique
@@ -135,7 +136,7 @@ class UserRetrieveUpdateSerializer(serializers.ModelSerializer):
 
 
 # ----------------------------------------------------------------
-class UserPasswordUpdateSerializer(serializers.ModelSerializer):
+class UserPasswordUpdateSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for UpdateAPIView
     Handles user password updates, ensuring that the old password is correct and the new password is different
@@ -0,0 +1,240 @@
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional
+
+from django.conf import settings
+from django.db import connection
+from django.http import HttpRequest, HttpResponse
+from rest_framework.request import Request
+
+logger = logging.getLogger(__name__)
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Timing settings
+SERVER_TIMING_HEADER: str = "X-Server-Timing"
+SLOWEST_QUERY_LENGTH: int = 200
+METRICS: tuple = ("queries", "db", "serializer", "permissions", "total")
+
+_current: ContextVar[Optional["RequestTimings"]] = ContextVar("request_timings", default=None)
+_view_stats: Dict[str, Counter] = defaultdict(Counter)
+_view_stats_lock = threading.Lock()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create request timings
+class RequestTimings:
+    """
+    Queries and times of the sections of a request in milliseconds,
+    times of the sections exclude the SQL they run, which is counted as 'db'
+    """
+
+    def __init__(self) -> None:
+        self.queries: int = 0
+        self.db: float = 0.0
+        self.slowest: float = 0.0
+        self.slowest_sql: str = ""
+        self.sections: Dict[str, float] = defaultdict(float)
+        self.active: set = set()
+        self.total: float = 0.0
+
+    def record_query(self, execute: Callable, sql: str, params: Any, many: bool, context: dict) -> Any:
+        """Runs a query of the request, recording its time"""
+        started: float = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration: float = (time.perf_counter() - started) * 1000
+            self.queries += 1
+            self.db += duration
+            if duration > self.slowest:
+                self.slowest, self.slowest_sql = duration, sql
+
+    def metrics(self) -> Dict[str, float]:
+        """Returns the values of the metrics checked against the budgets"""
+        return {
+            "queries": self.queries,
+            "db": self.db,
+            "serializer": self.sections["serializer"],
+            "permissions": self.sections["permissions"],
+            "total": self.total,
+        }
+
+    def header(self) -> str:
+        """Returns the value of the Server-Timing header"""
+        return ", ".join(
+            (
+                f'db;dur={self.db:.3f};desc="{self.queries} queries"',
+                f"db-slowest;dur={self.slowest:.3f}",
+                f"serializer;dur={self.sections['serializer']:.3f}",
+                f"permissions;dur={self.sections['permissions']:.3f}",
+                f"total;dur={self.total:.3f}",
+            )
+        )
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create helpers
+def timed(section: str) -> Callable[[Callable], Callable]:
+    """
+    Returns a decorator adding the time of a function to a section of the measured request,
+    nested calls of the same section are counted once
+    """
+
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs) -> Any:
+            timings: Optional[RequestTimings] = _current.get()
+            if timings is None or section in timings.active:
+                return function(*args, **kwargs)
+
+            timings.active.add(section)
+            started, db = time.perf_counter(), timings.db
+            try:
+                return function(*args, **kwargs)
+            finally:
+                timings.active.discard(section)
+                timings.sections[section] += (time.perf_counter() - started) * 1000 - (timings.db - db)
+
+        return wrapper
+
+    return decorator
+
+
+def get_budgets(view_name: str) -> Dict[str, float]:
+    """Returns the budgets of a view, the budgets of SERVER_TIMING_VIEW_BUDGETS override the common ones"""
+    return {**settings.SERVER_TIMING_BUDGETS, **settings.SERVER_TIMING_VIEW_BUDGETS.get(view_name, {})}
+
+
+def check_budgets(view_name: str, timings: RequestTimings) -> List[str]:
+    """
+    Adds the request to the statistics of its view and logs a warning when the request exceeds the budgets,
+    the warning carries the averages of every request of the view measured by the current process
+
+    Returns:
+        Exceeded metrics
+    """
+    metrics: Dict[str, float] = timings.metrics()
+    exceeded: List[str] = [
+        metric for metric, budget in get_budgets(view_name).items() if metrics.get(metric, 0) > budget
+    ]
+
+    with _view_stats_lock:
+        stats: Counter = _view_stats[view_name]
+        stats.update({"requests": 1, "over_budget": int(bool(exceeded)), **metrics})
+        averages: Dict[str, float] = {metric: stats[metric] / stats["requests"] for metric in METRICS}
+        requests, over_budget = stats["requests"], stats["over_budget"]
+
+    if exceeded:
+        logger.warning(
+            "%s: превышен бюджет (%s), %s; сверх бюджета %d из %d запросов, в среднем %s; "
+            "самый медленный SQL %.1f мс: %s",
+            view_name,
+            ", ".join(exceeded),
+            ", ".join(f"{metric} {metrics[metric]:.1f}" for metric in METRICS),
+            over_budget,
+            requests,
+            ", ".join(f"{metric} {averages[metric]:.1f}" for metric in METRICS),
+            timings.slowest,
+            " ".join(timings.slowest_sql.split())[:SLOWEST_QUERY_LENGTH],
+        )
+
+    return exceeded
+
+
+def get_view_timing_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Returns the measured requests of every view of the current process
+
+    Returns:
+        Dictionary with view names as keys and the numbers of requests, of requests over budget
+        and the averages of the metrics as values
+    """
+    with _view_stats_lock:
+        return {
+            view_name: {
+                "requests": stats["requests"],
+                "over_budget": stats["over_budget"],
+                **{metric: stats[metric] / stats["requests"] for metric in METRICS},
+            }
+            for view_name, stats in _view_stats.items()
+        }
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create mixins
+class TimedViewMixin:
+    """
+    Mixin for API views adding their permission checks to the 'permissions' section of the measured request,
+    when the request is not measured the checks only read a context variable
+    """
+
+    @timed("permissions")
+    def check_permissions(self, request: Request) -> None:
+        """Checks the permissions of the view"""
+        super().check_permissions(request)  # type: ignore
+
+    @timed("permissions")
+    def check_object_permissions(self, request: Request, obj: Any) -> None:
+        """Checks the permissions of the view for the object"""
+        super().check_object_permissions(request, obj)  # type: ignore
+
+
+# ----------------------------------------------------------------
+class TimedSerializerMixin:
+    """
+    Mixin for serializers adding their representations to the 'serializer' section of the measured request,
+    representations of the nested serializers and of the items of a list are counted once
+    """
+
+    @timed("serializer")
+    def to_representation(self, instance: Any) -> Any:
+        """Returns the representation of the instance"""
+        return super().to_representation(instance)  # type: ignore
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create middleware
+class ServerTimingMiddleware:
+    """
+    Middleware measuring the queries, SQL time, serialization and permission checks of a request
+
+    With SERVER_TIMING every request is measured and answered with a Server-Timing header,
+    otherwise only requests of staff users with the X-Server-Timing header are.
+    The user of the session is checked before the request, so other users cannot make their requests measured.
+    Serialization and permission checks are measured in the views and serializers with the timed mixins.
+    Measured requests are checked against the budgets of their views.
+    Streaming responses, like exports and event streams, run most of their queries after the headers are sent,
+    so they get no header and are left out of the statistics
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        requested: bool = SERVER_TIMING_HEADER in request.headers and request.user.is_staff
+        if not settings.SERVER_TIMING and not requested:
+            return self.get_response(request)
+
+        timings = RequestTimings()
+        token = _current.set(timings)
+        started: float = time.perf_counter()
+        try:
+            with connection.execute_wrapper(timings.record_query):
+                response: HttpResponse = self.get_response(request)
+        finally:
+            _current.reset(token)
+        timings.total = (time.perf_counter() - started) * 1000
+
+        if response.streaming:
+            return response
+
+        response["Server-Timing"] = timings.header()
+
+        if request.resolver_match is not None:
+            check_budgets(request.resolver_match.view_name, timings)
+
+        return response
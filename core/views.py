@@ -12,11 +12,12 @@ from core.models import User
 from core.serializers import UserSignupSerializer, \
     UserLoginSerializer, UserRetrieveUpdateSerializer, \
     UserPasswordUpdateSerializer
+from core.timing import TimedViewMixin
 
 
 # ----------------------------------------------------------------------------------------------------------------------
 # User views
-class UserSignupView(CreateAPIView):
+class UserSignupView(TimedViewMixin, CreateAPIView):
     """Create a new user"""
 
     queryset = User.objects.all()
@@ -24,7 +25,7 @@ class UserSignupView(CreateAPIView):
 
 
 # ----------------------------------------------------------------
-class UserLoginView(CreateAPIView):
+class UserLoginView(TimedViewMixin, CreateAPIView):
     """Login user"""
 
     serializer_class = UserLoginSerializer
@@ -51,7 +52,7 @@ class UserLoginView(CreateAPIView):
 
 
 # ----------------------------------------------------------------
-class UserRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
+class UserRetrieveUpdateDestroyView(TimedViewMixin, RetrieveUpdateDestroyAPIView):
     """View for retrieving user information, updating or logout user"""
 
     serializer_class = UserRetrieveUpdateSerializer
@@ -73,7 +74,7 @@ class UserRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
 
 
 # ----------------------------------------------------------------
-class UserPasswordUpdateView(UpdateAPIView):
+class UserPasswordUpdateView(TimedViewMixin, UpdateAPIView):
     """View for updating user password"""
 
     serializer_class = UserPasswordUpdateSerializer
@@ -32,6 +32,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "social_django",
     "django_filters",
@@ -50,6 +51,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "core.timing.ServerTimingMiddleware",
 ]
 
 # Set the project's root URL configuration
@@ -78,6 +80,47 @@ WSGI_APPLICATION = "diploma_project_pd12.wsgi.application"
 # Set database configuration
 DATABASES = {"default": env.db()}
 
+# Set cache configuration, the cached roles and lists are invalidated through the cache,
+# so it must be shared by every worker and the bot, like Redis
+CACHES = {"default": env.cache("CACHE_URL")}
+
+# Lifetime of the cached board roles of a user in seconds
+BOARD_ROLE_CACHE_TIMEOUT: int = env.int("BOARD_ROLE_CACHE_TIMEOUT", default=300)
+
+# Lifetime of the cached board, category and goal lists in seconds,
+# lists older than LIST_CACHE_STALE_AFTER are served while one request refreshes them
+LIST_CACHE_TIMEOUT: int = env.int("LIST_CACHE_TIMEOUT", default=300)
+LIST_CACHE_STALE_AFTER: int = env.int("LIST_CACHE_STALE_AFTER", default=30)
+
+# Number of goals fetched from the server-side cursor at once by the export
+EXPORT_CHUNK_SIZE: int = env.int("EXPORT_CHUNK_SIZE", default=2000)
+
+# Seconds a sync cursor lags behind the response, changes of transactions still running
+# when the cursor is issued are sent again by the next sync instead of being missed
+SYNC_CURSOR_LAG: int = env.int("SYNC_CURSOR_LAG", default=5)
+
+# Event streams: seconds between heartbeats, seconds a stream stays open before the client reconnects,
+# events queued for a slow client before its stream ends with a resync event,
+# streams of a worker process, every stream holds a thread of the worker,
+# and delivery to every worker through PostgreSQL LISTEN/NOTIFY
+EVENTS_HEARTBEAT: int = env.int("EVENTS_HEARTBEAT", default=15)
+EVENTS_STREAM_TIMEOUT: int = env.int("EVENTS_STREAM_TIMEOUT", default=300)
+EVENTS_QUEUE_SIZE: int = env.int("EVENTS_QUEUE_SIZE", default=100)
+EVENTS_MAX_STREAMS: int = env.int("EVENTS_MAX_STREAMS", default=4)
+EVENTS_NOTIFY: bool = env.bool("EVENTS_NOTIFY", default=True)
+
+# Server-Timing header with the SQL, serialization and permission times of every request,
+# when it is off staff users get it for requests with the X-Server-Timing header.
+# Measured requests exceeding the budgets of their views are logged, budgets of a view
+# in SERVER_TIMING_VIEW_BUDGETS override the common ones, times are in milliseconds
+SERVER_TIMING: bool = env.bool("SERVER_TIMING", default=False)
+SERVER_TIMING_BUDGETS: dict = {
+    "queries": env.int("SERVER_TIMING_MAX_QUERIES", default=20),
+    "db": env.int("SERVER_TIMING_MAX_DB_MS", default=200),
+    "total": env.int("SERVER_TIMING_MAX_TOTAL_MS", default=500),
+}
+SERVER_TIMING_VIEW_BUDGETS: dict = {}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -113,9 +156,21 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # User model settings
 AUTH_USER_MODEL = "core.User"
 
-# Rest framework settings
+# Rest framework settings, JSON is encoded and parsed with orjson, MessagePack is chosen
+# with the Accept and Content-Type headers and the browsable API is only available with DEBUG
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_RENDERER_CLASSES": (
+        "core.renderers.ORJSONRenderer",
+        "core.renderers.MessagePackRenderer",
+        *(("rest_framework.renderers.BrowsableAPIRenderer",) if DEBUG else ()),
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "core.parsers.ORJSONParser",
+        "core.parsers.MessagePackParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
 }
 
 # Spectacular settings
@@ -8,3 +8,7 @@ class GoalsConfig(AppConfig):
 
     default_auto_field: str = "django.db.models.BigAutoField"
     name: str = "goals"
+
+    def ready(self) -> None:
+        """Connects signal receivers of the Goal app"""
+        from goals import signals  # noqa: F401
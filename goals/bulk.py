@@ -0,0 +1,225 @@
+from typing import Dict, Iterable, List, Optional, Tuple, Type
+
+from django.db import connection, transaction
+from django.db.models import Model, QuerySet
+from django.utils import timezone
+from rest_framework import serializers, status
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from core.timing import TimedSerializerMixin, TimedViewMixin
+from goals.events import publish_events
+from goals.list_cache import bump_board_versions
+from goals.models.mixins import SearchVectorModelMixin
+from goals.roles import EDITOR_ROLES, get_board_roles
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create helpers
+def prepare_bulk_create(instances: Iterable[Model]) -> None:
+    """
+    Sets the fields usually set by the save method of the models,
+    since bulk_create does not call it
+
+    All instances get the same creation time and search vectors are built in the INSERT
+    """
+    now = timezone.now()
+    use_vectors: bool = connection.vendor == "postgresql"
+
+    for instance in instances:
+        instance.created = now
+        instance.updated = now
+        if use_vectors and isinstance(instance, SearchVectorModelMixin):
+            instance.search_vector = instance.get_search_vector()
+
+
+def finish_bulk_create(instances: Iterable[Model]) -> None:
+    """Drops the search vector expressions of created instances, the stored vectors are loaded on access"""
+    for instance in instances:
+        instance.__dict__.pop("search_vector", None)
+
+
+def split_editable(
+    rows: Iterable[Tuple[int, int]], ids: Iterable[int], user
+) -> Tuple[List[int], List[dict]]:
+    """
+    Splits the requested objects into the ones the user may edit and per-item errors
+
+    Roles of the user are resolved once for all boards of the objects
+
+    Args:
+        rows: Pairs of id and board id of the found objects
+        ids: Requested ids
+        user: User making the request
+
+    Returns:
+        Editable ids and the errors of the other ids
+    """
+    roles: Dict[int, int] = get_board_roles(user.id)
+    boards: Dict[int, int] = dict(rows)
+
+    editable: List[int] = []
+    errors: List[dict] = []
+    for object_id in dict.fromkeys(ids):
+        role: Optional[int] = roles.get(boards[object_id]) if object_id in boards else None
+        if role is None:
+            errors.append({"id": object_id, "errors": ["Объект не найден"]})
+        elif role not in EDITOR_ROLES:
+            errors.append({"id": object_id, "errors": ["Недостаточно прав"]})
+        else:
+            editable.append(object_id)
+
+    return editable, errors
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create serializers
+class PrefetchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    Primary key field resolving objects from the map loaded once for the whole bulk request,
+    the map is passed in the 'prefetched' context of the serializer
+    """
+
+    def to_internal_value(self, data) -> Model:
+        """Returns the prefetched object with the primary key"""
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+        try:
+            pk: int = int(data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+        instance: Optional[Model] = self.context["prefetched"].get(pk)
+        if instance is None:
+            self.fail("does_not_exist", pk_value=data)
+
+        return instance
+
+
+# ----------------------------------------------------------------
+class BulkIdsSerializer(TimedSerializerMixin, serializers.Serializer):
+    """Serializer for ids of the objects of a bulk request"""
+
+    ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=1000)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create views
+class BulkCreateAPIView(TimedViewMixin, GenericAPIView):
+    """
+    Base API endpoint for creating a list of objects with a single INSERT
+
+    Every item is validated by the serializer on its own and reported with its index on errors,
+    related objects of all items are loaded with a single query
+    """
+
+    permission_classes: tuple = (IsAuthenticated,)
+    result_serializer_class: Type[serializers.Serializer]
+    related_field: str
+    created_event: str
+    max_items: int = 1000
+
+    def get_related_queryset(self) -> QuerySet:
+        """Return a queryset of the related objects referenced by the items"""
+        return self.get_serializer_class()().fields[self.related_field].queryset
+
+    def build_instance(self, validated_data: dict) -> Model:
+        """Return an unsaved instance from the validated data of an item on the board of its related object"""
+        return self.get_serializer_class().Meta.model(
+            **validated_data, board_id=validated_data[self.related_field].board_id
+        )
+
+    def post(self, request: Request, *args, **kwargs) -> Response:
+        """
+        Creates valid items and reports errors of the other ones
+
+        Returns:
+            Response with the created objects and the errors, 201 if anything was created, 400 otherwise
+        """
+        items = request.data
+        if not isinstance(items, list) or not items:
+            raise serializers.ValidationError("Ожидается непустой список")
+        if len(items) > self.max_items:
+            raise serializers.ValidationError(f"Не больше {self.max_items} объектов за запрос")
+
+        related_ids: set = set()
+        for item in items:
+            try:
+                related_ids.add(int(item.get(self.related_field)))
+            except (AttributeError, TypeError, ValueError):
+                continue
+        context: dict = {
+            **self.get_serializer_context(),
+            "prefetched": self.get_related_queryset().in_bulk(related_ids),
+        }
+
+        instances: List[Model] = []
+        errors: List[dict] = []
+        for index, item in enumerate(items):
+            serializer = self.get_serializer_class()(data=item, context=context)
+            if serializer.is_valid():
+                instances.append(self.build_instance(serializer.validated_data))
+            else:
+                errors.append({"index": index, "errors": serializer.errors})
+
+        if instances:
+            prepare_bulk_create(instances)
+            with transaction.atomic():
+                self.get_serializer_class().Meta.model.objects.bulk_create(instances)
+                self.after_bulk_create(instances)
+            finish_bulk_create(instances)
+
+        return Response(
+            {
+                "created": self.result_serializer_class(instances, many=True).data,
+                "errors": errors,
+            },
+            status=status.HTTP_201_CREATED if instances else status.HTTP_400_BAD_REQUEST,
+        )
+
+    def after_bulk_create(self, instances: List[Model]) -> None:
+        """Expires cached lists of the boards of the created objects and publishes their events"""
+        bump_board_versions(instance.board_id for instance in instances)
+        publish_events(self.created_event, ((instance.id, instance.board_id) for instance in instances))
+
+
+# ----------------------------------------------------------------
+class BulkChangeAPIView(TimedViewMixin, GenericAPIView):
+    """
+    Base API endpoint for changing a list of objects with a single query
+
+    Objects the user cannot edit are reported with their ids and skipped,
+    roles are resolved once for all boards of the objects
+    """
+
+    serializer_class = BulkIdsSerializer
+    permission_classes: tuple = (IsAuthenticated,)
+    result_key: str = "updated"
+
+    def change(self, ids: List[int], validated_data: dict) -> None:
+        """Apply the change to the editable objects, the validated fields are updated with a single query"""
+        self.get_queryset().filter(id__in=ids).update(**validated_data)
+
+    def bulk_change(self, request: Request) -> Response:
+        """
+        Changes the editable objects and reports errors of the other ones
+
+        Returns:
+            Response with the changed ids and the errors
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids: List[int] = serializer.validated_data.pop("ids")
+
+        boards: Dict[int, int] = dict(self.get_queryset().filter(id__in=ids).values_list("id", "board_id"))
+        editable, errors = split_editable(boards.items(), ids, request.user)
+
+        if editable:
+            with transaction.atomic():
+                self.change(editable, serializer.validated_data)
+                bump_board_versions(boards[object_id] for object_id in editable)
+
+        return Response({self.result_key: editable, "errors": errors})
@@ -0,0 +1,204 @@
+from datetime import datetime, tzinfo
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import QuerySet
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from core.timing import timed
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Compiled serializer settings
+# Fields whose representation of a database value is the value itself
+IDENTITY_FIELDS: Tuple[Type[serializers.Field], ...] = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.PrimaryKeyRelatedField,
+)
+# Fields that need model instances
+UNSUPPORTED_FIELDS: Tuple[Type[serializers.Field], ...] = (
+    serializers.BaseSerializer,
+    serializers.ManyRelatedField,
+    serializers.RelatedField,
+)
+
+Converter = Callable[[Any], Any]
+# Name, column, field converting the value or None, plan of a nested serializer or None
+FieldPlan = Tuple[str, str, Optional[serializers.Field], Optional[list]]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create converters
+def get_converter(field: serializers.Field, current_timezone: Optional[tzinfo]) -> Optional[Converter]:
+    """
+    Returns the function converting a database value of a field, None if the value is its representation
+
+    ISO 8601 dates and datetimes are converted without the per-value lookups of the fields,
+    datetimes are moved to the timezone resolved once for the whole page
+    """
+    if isinstance(field, IDENTITY_FIELDS):
+        return None
+
+    if isinstance(field, serializers.DateTimeField):
+        output_format: Optional[str] = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        field_timezone: Optional[tzinfo] = getattr(field, "timezone", current_timezone)
+        if output_format is None or output_format.lower() != ISO_8601 or field_timezone is None:
+            return field.to_representation
+
+        def convert_datetime(value: datetime) -> str:
+            """Returns the datetime in the timezone of the field in ISO 8601"""
+            if value.tzinfo is None:
+                return field.to_representation(value)
+            text: str = value.astimezone(field_timezone).isoformat()
+            return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+        return convert_datetime
+
+    if isinstance(field, serializers.DateField):
+        output_format = getattr(field, "format", api_settings.DATE_FORMAT)
+        if output_format is not None and output_format.lower() == ISO_8601:
+            return lambda value: value.isoformat()
+
+    return field.to_representation
+
+
+def build_converter(plan: List[FieldPlan], current_timezone: Optional[tzinfo]) -> Callable[[dict], dict]:
+    """Returns the function turning a row into the representation described by a plan"""
+    steps: List[Tuple[str, str, Optional[Converter], Optional[Callable[[dict], dict]]]] = [
+        (
+            name,
+            column,
+            get_converter(field, current_timezone) if field is not None else None,
+            build_converter(nested, current_timezone) if nested is not None else None,
+        )
+        for name, column, field, nested in plan
+    ]
+
+    def convert(row: dict) -> dict:
+        """Returns the representation of a row"""
+        data: dict = {}
+        for name, column, converter, nested in steps:
+            value: Any = row[column]
+            if value is None:
+                data[name] = None
+            elif nested is not None:
+                data[name] = nested(row)
+            elif converter is None:
+                data[name] = value
+            else:
+                data[name] = converter(value)
+        return data
+
+    return convert
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create compiled serializers
+class CompiledSerializer:
+    """
+    Read-only fast path of a model serializer working on '.values()' rows
+
+    The fields of the serializer are resolved once into the columns to fetch and a converter per field,
+    so a row becomes a dictionary without model instances, field binding or nested serializers.
+    The output is the same as the output of the serializer
+
+    Supports plain model fields, primary key and slug related fields and nested model serializers,
+    other fields raise ImproperlyConfigured when the serializer is compiled
+    """
+
+    def __init__(self, serializer_class: Type[serializers.Serializer]) -> None:
+        self.serializer_class: Type[serializers.Serializer] = serializer_class
+        columns, self.plan = self.compile(serializer_class(), "")
+        self.columns: Tuple[str, ...] = tuple(dict.fromkeys(columns))
+
+    def compile(self, serializer: serializers.Serializer, prefix: str) -> Tuple[List[str], List[FieldPlan]]:
+        """
+        Returns the columns of a serializer and the plan of its representation
+
+        Args:
+            serializer: Serializer to compile
+            prefix: Lookup of the relation of a nested serializer, like 'user__'
+
+        Raises:
+            ImproperlyConfigured: If a field needs model instances
+        """
+        columns: List[str] = []
+        plan: List[FieldPlan] = []
+
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            if field.source == "*" or "." in field.source:
+                raise ImproperlyConfigured(f"{type(serializer).__name__}.{name}: source is not supported")
+
+            column: str = f"{prefix}{field.source}"
+            if isinstance(field, serializers.ModelSerializer):
+                nested_columns, nested_plan = self.compile(field, f"{column}__")
+                columns += [column, *nested_columns]
+                plan.append((name, column, None, nested_plan))
+            elif isinstance(field, serializers.SlugRelatedField):
+                columns.append(f"{column}__{field.slug_field}")
+                plan.append((name, f"{column}__{field.slug_field}", None, None))
+            elif isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field is None:
+                columns.append(column)
+                plan.append((name, column, None, None))
+            elif isinstance(field, UNSUPPORTED_FIELDS):
+                raise ImproperlyConfigured(f"{type(serializer).__name__}.{name}: field is not supported")
+            else:
+                columns.append(column)
+                plan.append((name, column, field, None))
+
+        return columns, plan
+
+    def values(self, queryset: QuerySet, *extra: str) -> QuerySet:
+        """Returns the queryset fetching the columns of the serializer and the extra columns as dictionaries"""
+        return queryset.values(*self.columns, *(column for column in extra if column not in self.columns))
+
+    @timed("serializer")
+    def represent(self, rows: Iterable[dict]) -> List[dict]:
+        """Returns the representations of the rows"""
+        convert: Callable[[dict], dict] = build_converter(
+            self.plan, timezone.get_current_timezone() if settings.USE_TZ else None
+        )
+        return [convert(row) for row in rows]
+
+
+@lru_cache(maxsize=None)
+def compile_serializer(serializer_class: Type[serializers.Serializer]) -> CompiledSerializer:
+    """Returns the compiled serializer of a serializer class, compiled once per process"""
+    return CompiledSerializer(serializer_class)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create view mixins
+class CompiledListMixin:
+    """
+    Mixin for list views serializing pages with the compiled serializer of the view
+
+    Columns of the ordering are fetched along with the serializer columns,
+    so the keyset pagination can build its cursors from the rows
+    """
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        """Returns the page of the list serialized from '.values()' rows"""
+        compiled: CompiledSerializer = compile_serializer(self.get_serializer_class())  # type: ignore
+        queryset: QuerySet = self.filter_queryset(self.get_queryset())  # type: ignore
+        ordering: Dict[str, None] = {
+            field.lstrip("-"): None
+            for field in queryset.query.order_by or getattr(self, "ordering", None) or ()
+            if isinstance(field, str)
+        }
+        rows: QuerySet = compiled.values(queryset, *ordering)
+
+        page: Optional[List[dict]] = self.paginate_queryset(rows)  # type: ignore
+        if page is not None:
+            return self.get_paginated_response(compiled.represent(page))  # type: ignore
+
+        return Response(compiled.represent(rows))
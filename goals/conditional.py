@@ -0,0 +1,104 @@
+import hashlib
+from datetime import datetime
+from typing import Any, Optional
+
+from django.db.models import Count, Max, Model
+from django.http import HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create helpers
+def make_etag(*parts) -> str:
+    """Returns a weak ETag built from the hashed parts of a representation"""
+    digest: str = hashlib.md5(":".join(str(part) for part in parts).encode()).hexdigest()
+
+    return f"W/{quote_etag(digest)}"
+
+
+def conditional_response(
+    request: Request, etag: str, last_modified: Optional[datetime]
+) -> Optional[HttpResponseBase]:
+    """
+    Returns a 304 response if the client already has the representation, None otherwise
+
+    If-None-Match takes precedence over If-Modified-Since
+    """
+    timestamp: Optional[int] = int(last_modified.timestamp()) if last_modified else None
+    response: Optional[HttpResponseBase] = get_conditional_response(
+        request, etag=etag, last_modified=timestamp
+    )
+
+    if response is not None:
+        set_validators(response, etag, last_modified)
+
+    return response
+
+
+def set_validators(response: HttpResponseBase, etag: str, last_modified: Optional[datetime]) -> None:
+    """Sets the ETag and Last-Modified headers of a response"""
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create view mixins
+class ConditionalListMixin:
+    """
+    Mixin for list views answering conditional GET requests
+
+    The validators are computed from MAX(updated) and COUNT over the filtered visible set,
+    so a list that did not change is answered with 304 before pagination and serialization.
+    The COUNT makes the ETag change when objects leave the list without moving the newest update
+    """
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        """Returns 304 for an unchanged list or the list with ETag and Last-Modified headers"""
+        queryset = self.filter_queryset(self.get_queryset())  # type: ignore
+        state: dict = queryset.order_by().aggregate(last_modified=Max("updated"), count=Count("id"))
+
+        etag: str = make_etag(
+            type(self).__name__,
+            request.user.id,
+            request.get_full_path(),
+            state["count"],
+            state["last_modified"].isoformat() if state["last_modified"] else "",
+        )
+
+        not_modified: Optional[HttpResponseBase] = conditional_response(request, etag, state["last_modified"])
+        if not_modified is not None:
+            return not_modified  # type: ignore
+
+        response: Response = super().list(request, *args, **kwargs)  # type: ignore
+        set_validators(response, etag, state["last_modified"])
+
+        return response
+
+
+# ----------------------------------------------------------------
+class ConditionalRetrieveMixin:
+    """Mixin for detail views answering conditional GET requests from the 'updated' field of the object"""
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+        """Returns 304 for an unchanged object or the object with ETag and Last-Modified headers"""
+        instance: Model = self.get_object()  # type: ignore
+        etag: str = make_etag(
+            type(instance).__name__, instance.pk, request.get_full_path(), instance.updated.isoformat()
+        )
+
+        not_modified: Optional[HttpResponseBase] = conditional_response(request, etag, instance.updated)
+        if not_modified is not None:
+            return not_modified  # type: ignore
+
+        response: Response = Response(self.get_retrieve_data(instance))
+        set_validators(response, etag, instance.updated)
+
+        return response
+
+    def get_retrieve_data(self, instance: Model) -> Any:
+        """Returns the serialized object, called only when the client does not have it yet"""
+        return self.get_serializer(instance).data  # type: ignore
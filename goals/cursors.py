@@ -0,0 +1,27 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from rest_framework import serializers
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Cursor settings
+EPOCH: datetime = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create cursor functions
+def encode_cursor(moment: datetime) -> str:
+    """Returns an opaque cursor of a moment, the number of microseconds since the epoch"""
+    return str((moment - EPOCH) // timedelta(microseconds=1))
+
+
+def decode_cursor(cursor: str) -> datetime:
+    """
+    Returns the moment of a cursor
+
+    Raises:
+        ValidationError: If the cursor is not valid
+    """
+    try:
+        return EPOCH + timedelta(microseconds=int(cursor))
+    except (TypeError, ValueError, OverflowError):
+        raise serializers.ValidationError({"since": ["Неверный курсор"]})
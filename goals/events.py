@@ -0,0 +1,300 @@
+import json
+import logging
+import queue
+import select
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set
+
+from django.conf import settings
+from django.db import connection, connections, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.renderers import BaseRenderer
+
+from goals.cursors import encode_cursor
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Event settings
+EVENT_CHANNEL: str = "goals_events"
+# Keeps NOTIFY payloads well under the 8000 bytes limit of PostgreSQL
+EVENT_MAX_IDS: int = 500
+LISTEN_RECONNECT_DELAY: float = 5.0
+STREAM_RETRY: int = 3000
+# Seconds a client refused by the limit of the streams waits before reconnecting
+STREAM_BUSY_RETRY: int = 30
+
+logger = logging.getLogger(__name__)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create exceptions
+class StreamLimitExceeded(APIException):
+    """Raised when the worker already serves EVENTS_MAX_STREAMS streams, answered with 503 and Retry-After"""
+
+    status_code: int = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail: str = "Слишком много открытых потоков событий, повторите позже"
+    default_code: str = "stream_limit_exceeded"
+    wait: int = STREAM_BUSY_RETRY
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create subscriptions
+class Subscription:
+    """
+    Queue of the events of the boards a user belongs to
+
+    A participant event of the user itself adds or removes its board, so the stream follows
+    the membership of the user. When the queue of a slow client is full, the queued events
+    are dropped and the stream ends with a resync event instead of blocking the publishers
+    """
+
+    def __init__(self, user_id: int, board_ids: Iterable[int], size: int) -> None:
+        self.user_id: int = user_id
+        self.board_ids: Set[int] = set(board_ids)
+        self.queue: queue.Queue = queue.Queue(maxsize=size)
+        self.overflowed: bool = False
+        self.lock = threading.Lock()
+
+    def offer(self, event: dict) -> None:
+        """Queues an event of a board of the user"""
+        own: bool = event["type"].startswith("participant.") and self.user_id in event.get("users", ())
+        with self.lock:
+            if own and event["type"] == "participant.changed":
+                self.board_ids.add(event["board"])
+            if event["board"] not in self.board_ids or self.overflowed:
+                return
+            if own and event["type"] == "participant.removed":
+                self.board_ids.discard(event["board"])
+
+            try:
+                self.queue.put_nowait(event)
+            except queue.Full:
+                self._overflow()
+
+    def overflow(self) -> None:
+        """Drops the queued events and wakes up the stream to tell the client to resync"""
+        with self.lock:
+            if not self.overflowed:
+                self._overflow()
+
+    def _overflow(self) -> None:
+        """Replaces the queued events with the end of the stream, the lock must be held"""
+        self.overflowed = True
+        while True:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                break
+        self.queue.put_nowait(None)
+
+
+# ----------------------------------------------------------------
+class EventBroker:
+    """In-process publish/subscribe channel delivering events to the streams of a worker"""
+
+    def __init__(self) -> None:
+        self.subscriptions: Set[Subscription] = set()
+        self.lock = threading.Lock()
+        self.listener: Optional[NotifyListener] = None
+
+    def subscribe(self, user_id: int, board_ids: Iterable[int]) -> Subscription:
+        """
+        Returns a new subscription to the events of the boards
+
+        Every stream holds a thread of the worker, so the streams of a process are limited
+        by EVENTS_MAX_STREAMS and the other threads stay free for the API requests
+
+        Raises:
+            StreamLimitExceeded: The process already serves EVENTS_MAX_STREAMS streams
+        """
+        subscription = Subscription(user_id, board_ids, settings.EVENTS_QUEUE_SIZE)
+        with self.lock:
+            if len(self.subscriptions) >= settings.EVENTS_MAX_STREAMS:
+                raise StreamLimitExceeded()
+            self.subscriptions.add(subscription)
+            if use_notify() and self.listener is None:
+                self.listener = NotifyListener(self)
+                self.listener.start()
+
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Stops delivering events to a subscription"""
+        with self.lock:
+            self.subscriptions.discard(subscription)
+
+    def publish(self, events: Iterable[dict]) -> None:
+        """Delivers events to the subscriptions of their boards"""
+        with self.lock:
+            subscriptions: List[Subscription] = list(self.subscriptions)
+        for event in events:
+            for subscription in subscriptions:
+                subscription.offer(event)
+
+    def reset(self) -> None:
+        """Tells every client to resync, events may have been missed"""
+        with self.lock:
+            subscriptions: List[Subscription] = list(self.subscriptions)
+        for subscription in subscriptions:
+            subscription.overflow()
+
+
+# ----------------------------------------------------------------
+class NotifyListener(threading.Thread):
+    """
+    Thread listening to the PostgreSQL channel of the events on its own connection
+    and passing them to the broker of the worker, so events reach the streams of every worker
+    """
+
+    daemon: bool = True
+
+    def __init__(self, broker: EventBroker) -> None:
+        super().__init__(name="goals-events-listener")
+        self.broker: EventBroker = broker
+        self.stopped = threading.Event()
+        self.connected = threading.Event()
+
+    def run(self) -> None:
+        """Listens to the channel, reconnecting after errors"""
+        reconnect: bool = False
+        while not self.stopped.is_set():
+            try:
+                self.listen(reconnect)
+            except Exception:
+                logger.exception("Соединение для событий потеряно")
+            self.connected.clear()
+            reconnect = True
+            self.stopped.wait(LISTEN_RECONNECT_DELAY)
+
+    def listen(self, reconnect: bool) -> None:
+        """Receives notifications until the connection fails or the listener is stopped"""
+        database = connections["default"]
+        listener = database.get_new_connection(database.get_connection_params())
+        try:
+            listener.autocommit = True
+            with listener.cursor() as cursor:
+                cursor.execute(f"LISTEN {EVENT_CHANNEL}")
+            self.connected.set()
+            if reconnect:
+                self.broker.reset()
+
+            while not self.stopped.is_set():
+                if not select.select([listener], [], [], 1.0)[0]:
+                    continue
+                listener.poll()
+                events: List[dict] = [json.loads(notify.payload) for notify in listener.notifies]
+                listener.notifies.clear()
+                self.broker.publish(events)
+        finally:
+            listener.close()
+
+    def stop(self) -> None:
+        """Stops the listener within a second"""
+        self.stopped.set()
+
+
+broker = EventBroker()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create publishing functions
+def use_notify() -> bool:
+    """Returns True if events are delivered to every worker through PostgreSQL"""
+    return settings.EVENTS_NOTIFY and connection.vendor == "postgresql"
+
+
+def send_events(events: List[dict]) -> None:
+    """Sends events to every worker with a single NOTIFY query or to the streams of this worker"""
+    if not use_notify():
+        broker.publish(events)
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_notify(%s, payload) FROM unnest(%s::text[]) AS payload",
+            [EVENT_CHANNEL, [json.dumps(event, separators=(",", ":")) for event in events]],
+        )
+
+
+def publish_events(event_type: str, rows: Iterable[Sequence[int]]) -> None:
+    """
+    Publishes events of objects grouped by their boards once the transaction commits,
+    events of rolled back changes are never sent
+
+    Args:
+        event_type: Type of the events, like 'goal.created'
+        rows: IDs of the objects and of their boards, followed by the IDs of the users for participants
+    """
+    boards: Dict[int, List[Sequence[int]]] = defaultdict(list)
+    for row in rows:
+        boards[row[1]].append(row)
+    if not boards:
+        return
+
+    cursor: str = encode_cursor(timezone.now())
+    events: List[dict] = []
+    for board_id, board_rows in boards.items():
+        for start in range(0, len(board_rows), EVENT_MAX_IDS):
+            chunk: List[Sequence[int]] = board_rows[start:start + EVENT_MAX_IDS]
+            event: dict = {"type": event_type, "board": board_id, "ids": [row[0] for row in chunk], "cursor": cursor}
+            if len(chunk[0]) > 2:
+                event["users"] = [row[2] for row in chunk]
+            events.append(event)
+
+    transaction.on_commit(lambda: send_events(events))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create streams
+class EventStreamRenderer(BaseRenderer):
+    """Renderer announcing the Server-Sent Events stream to the content negotiation"""
+
+    media_type: str = "text/event-stream"
+    format: str = "sse"
+    charset: str = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        """Renders errors of the stream as a single event"""
+        return f"event: error\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode(self.charset)
+
+
+# ----------------------------------------------------------------
+class EventStream:
+    """
+    Iterable of the Server-Sent Events of a subscription
+
+    Sends a heartbeat comment when no events came for a while, so proxies keep the connection
+    and a disconnected client is noticed, and ends after a while to give the worker back,
+    clients reconnect by themselves. Closing the stream ends the subscription
+    """
+
+    def __init__(self, subscription: Subscription, heartbeat: float, timeout: float) -> None:
+        self.subscription: Subscription = subscription
+        self.heartbeat: float = heartbeat
+        self.timeout: float = timeout
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yields encoded events until the timeout or an overflow of the queue"""
+        yield f"retry: {STREAM_RETRY}\n\n".encode()
+
+        deadline: float = time.monotonic() + self.timeout
+        while time.monotonic() < deadline:
+            try:
+                event: Optional[dict] = self.subscription.queue.get(timeout=self.heartbeat)
+            except queue.Empty:
+                yield b": heartbeat\n\n"
+                continue
+
+            if event is None:
+                yield b"event: resync\ndata: {}\n\n"
+                return
+
+            data: str = json.dumps(event, separators=(",", ":"))
+            yield f"id: {event['cursor']}\nevent: {event['type']}\ndata: {data}\n\n".encode()
+
+    def close(self) -> None:
+        """Ends the subscription"""
+        broker.unsubscribe(self.subscription)
@@ -0,0 +1,168 @@
+import csv
+import io
+import json
+import zlib
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Iterable, Iterator, Tuple
+
+from django.db.models import F
+from rest_framework import serializers
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Export settings
+GOAL_EXPORT_FIELDS: Tuple[str, ...] = (
+    "id",
+    "board",
+    "category",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "due_date",
+    "user",
+    "username",
+    "created",
+    "updated",
+)
+GOAL_EXPORT_EXPRESSIONS: dict = {"username": F("user__username")}
+GOAL_EXPORT_COLUMNS: Tuple[str, ...] = tuple(
+    field for field in GOAL_EXPORT_FIELDS if field not in GOAL_EXPORT_EXPRESSIONS
+)
+
+_datetime_field = serializers.DateTimeField()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create helpers
+def to_representation(value):
+    """Returns datetimes in the current timezone and format of the API responses, other values as they are"""
+    return _datetime_field.to_representation(value) if isinstance(value, datetime) else value
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create renderers
+class ExportRenderer(ABC, BaseRenderer):
+    """
+    Base renderer of exported rows, encodes rows one at a time
+    so the export can be streamed without building the whole document
+    """
+
+    charset: str = "utf-8"
+
+    def header(self, fields: Iterable[str]) -> str:
+        """Return the text written before the rows"""
+        return ""
+
+    @abstractmethod
+    def encode_row(self, row: dict) -> str:
+        """Return the text of a single row"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        """Renders responses that are not streamed, like errors, with the same row encoding"""
+        if data is None:
+            return b""
+
+        rows: list = data if isinstance(data, list) else [data]
+        fields: list = list(rows[0]) if rows and isinstance(rows[0], dict) else []
+
+        return (self.header(fields) + "".join(self.encode_row(row) for row in rows)).encode(self.charset)
+
+
+# ----------------------------------------------------------------
+class NDJSONRenderer(ExportRenderer):
+    """Renderer of newline delimited JSON, one object per line"""
+
+    media_type: str = "application/x-ndjson"
+    format: str = "ndjson"
+
+    def encode_row(self, row: dict) -> str:
+        """Return the row as a JSON object on its own line"""
+        return json.dumps(
+            {field: to_representation(value) for field, value in row.items()}, cls=JSONEncoder, ensure_ascii=False
+        ) + "\n"
+
+
+# ----------------------------------------------------------------
+class CSVRenderer(ExportRenderer):
+    """Renderer of CSV with a header line"""
+
+    media_type: str = "text/csv"
+    format: str = "csv"
+
+    def __init__(self) -> None:
+        self.buffer = io.StringIO()
+        self.writer = csv.writer(self.buffer)
+        self.fields: list = []
+
+    def _write(self, values: Iterable) -> str:
+        """Return a CSV line of the values"""
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        self.writer.writerow(values)
+
+        return self.buffer.getvalue()
+
+    def header(self, fields: Iterable[str]) -> str:
+        """Return the line with the names of the fields, values of the rows are written in the same order"""
+        self.fields = list(fields)
+        return self._write(self.fields)
+
+    def encode_row(self, row: dict) -> str:
+        """Return the line with the values of the row"""
+        return self._write(
+            "" if value is None else to_representation(value) for value in (row.get(field) for field in self.fields)
+        )
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create streaming helpers
+def accepts_gzip(request) -> bool:
+    """Returns True if the client accepts a gzip-compressed response"""
+    return "gzip" in request.META.get("HTTP_ACCEPT_ENCODING", "").lower()
+
+
+def stream_export(
+    renderer: ExportRenderer,
+    rows: Iterator[dict],
+    fields: Iterable[str],
+    batch_size: int,
+    compress: bool = False,
+) -> Iterator[bytes]:
+    """
+    Yields the encoded export in batches of rows
+
+    Only a single batch is held in memory at a time, so memory use does not depend on the number of rows
+
+    Args:
+        renderer: Renderer encoding the rows
+        rows: Rows read from the server-side cursor
+        fields: Names of the exported fields
+        batch_size: Number of rows encoded into a single chunk of the response
+        compress: Compress the chunks into a single gzip stream
+
+    Yields:
+        Chunks of the response body
+    """
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS) if compress else None
+
+    def encode(text: str) -> bytes:
+        data: bytes = text.encode(renderer.charset)
+        return compressor.compress(data) if compressor else data
+
+    batch: list = [renderer.header(fields)]
+    for number, row in enumerate(rows, 1):
+        batch.append(renderer.encode_row(row))
+        if number % batch_size == 0:
+            chunk: bytes = encode("".join(batch))
+            batch.clear()
+            if chunk:
+                yield chunk
+
+    chunk = encode("".join(batch))
+    if compressor:
+        chunk += compressor.flush()
+    if chunk:
+        yield chunk
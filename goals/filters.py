@@ -1,6 +1,12 @@
+import re
+
 import django_filters
-from django.db import models
+from django.contrib.postgres.search import TrigramSimilarity, TrigramWordSimilarity
+from django.db import connection, models
+from django.db.models import FloatField, Q, QuerySet
+from django.db.models.functions import Cast, Greatest
 from django_filters import rest_framework
+from rest_framework.filters import SearchFilter
 
 from goals.models.goal import Goal
 
@@ -22,3 +28,45 @@ class GoalDateFilter(rest_framework.FilterSet):
     filter_overrides = {
         models.DateTimeField: {"filter_class": django_filters.IsoDateTimeFilter},
     }
+
+
+# ----------------------------------------------------------------
+class TrigramSearchFilter(SearchFilter):
+    """
+    Fuzzy search filter based on pg_trgm,
+    matches search fields similar to the query, containing a similar word or the query itself
+    and orders results by the sum of word and whole value similarity
+
+    All lookups are served by the trigram GIN indexes of the search fields,
+    databases other than PostgreSQL fall back to the default case-insensitive search
+    """
+
+    rank_field: str = "search_rank"
+
+    def filter_queryset(self, request, queryset: QuerySet, view) -> QuerySet:
+        """Filter and rank a queryset by the 'search' query parameter"""
+        search_fields = self.get_search_fields(view, request)
+        search_terms: list = self.get_search_terms(request)
+
+        if not search_fields or not search_terms or connection.vendor != "postgresql":
+            return super().filter_queryset(request, queryset, view)
+
+        query: str = " ".join(search_terms)
+        fields: list = [field.lstrip("^=@$") for field in search_fields]
+
+        condition = Q()
+        for field in fields:
+            condition |= Q(**{f"{field}__trigram_similar": query})
+            condition |= Q(**{f"{field}__trigram_word_similar": query})
+            condition |= Q(**{f"{field}__iregex": re.escape(query)})
+
+        similarities: list = [
+            TrigramWordSimilarity(query, field) + TrigramSimilarity(field, query) for field in fields
+        ]
+        rank = Greatest(*similarities) if len(similarities) > 1 else similarities[0]
+
+        return (
+            queryset.filter(condition)
+            .annotate(**{self.rank_field: Cast(rank, FloatField())})
+            .order_by(f"-{self.rank_field}", *queryset.query.order_by)
+        )
@@ -0,0 +1,211 @@
+import csv
+import io
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from goals.bulk import finish_bulk_create, prepare_bulk_create
+from goals.events import publish_events
+from goals.list_cache import bump_board_versions
+from goals.models.goal import Goal
+from goals.models.goal_category import GoalCategory
+from goals.models.mixins import SEARCH_CONFIG
+from goals.serializers.goal import GoalImportSerializer
+from goals.stats import apply_goal_stats
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Import settings
+IMPORT_COLUMNS: Tuple[str, ...] = ("category", "title", "description", "status", "priority", "due_date")
+IMPORT_BATCH_SIZE: int = 1000
+STAGED_COLUMNS: Tuple[str, ...] = (
+    "category_id",
+    "board_id",
+    "user_id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "due_date",
+)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create helpers
+def read_rows(file: Iterable[str]) -> List[dict]:
+    """
+    Returns the rows of a CSV file with a header line,
+    unknown columns are dropped and empty values are treated as missing
+
+    Raises:
+        ValidationError: If the file has no header or no required columns
+    """
+    reader = csv.DictReader(file)
+    missing: set = {"category", "title", "due_date"} - set(reader.fieldnames or ())
+    if missing:
+        raise serializers.ValidationError(f"Нет обязательных столбцов: {', '.join(sorted(missing))}")
+
+    return [
+        {column: value for column, value in row.items() if column in IMPORT_COLUMNS and value not in ("", None)}
+        for row in reader
+    ]
+
+
+def validate_rows(rows: List[dict], user) -> Tuple[List[dict], List[dict]]:
+    """
+    Validates the rows with a single serializer, categories of all rows are loaded with a single query
+
+    Args:
+        rows: Rows of the file
+        user: User importing the goals
+
+    Returns:
+        Validated data of the valid rows and the errors of the other rows with their line numbers
+    """
+    category_ids: set = set()
+    for row in rows:
+        try:
+            category_ids.add(int(row.get("category")))
+        except (TypeError, ValueError):
+            continue
+
+    serializer = GoalImportSerializer(
+        context={"user": user, "prefetched": GoalCategory.objects.in_bulk(category_ids)}
+    )
+
+    valid: List[dict] = []
+    errors: List[dict] = []
+    # The first line of the file is the header
+    for line, row in enumerate(rows, 2):
+        try:
+            valid.append(serializer.run_validation(row))
+        except serializers.ValidationError as error:
+            errors.append({"line": line, "errors": error.detail})
+
+    return valid, errors
+
+
+def copy_goals(rows: List[dict], user) -> List[Tuple[int, int]]:
+    """
+    Stages the goals through COPY into a temporary table
+    and inserts them into the goals table with a single INSERT ... SELECT
+
+    Creation time and search vectors of all goals are set by the INSERT
+
+    Returns:
+        IDs of the created goals and of their boards
+    """
+    table: str = Goal._meta.db_table
+    staged: str = ", ".join(STAGED_COLUMNS)
+    search_vector: str = " || ".join(
+        f"setweight(to_tsvector(%s::regconfig, COALESCE({field}, '')), %s)" for field, _ in Goal.search_weights
+    )
+    params: list = [param for _, weight in Goal.search_weights for param in (SEARCH_CONFIG, weight)]
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        category: GoalCategory = row["category"]
+        writer.writerow(
+            (
+                category.id,
+                category.board_id,
+                user.id,
+                row["title"],
+                row.get("description", ""),
+                row.get("status", Goal.Status.to_do),
+                row.get("priority", Goal.Priority.medium),
+                row["due_date"].isoformat(),
+            )
+        )
+    buffer.seek(0)
+    now = timezone.now()
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "CREATE TEMPORARY TABLE goal_import ("
+            "category_id bigint, board_id bigint, user_id bigint, title varchar(255), description varchar(255), "
+            "status smallint, priority smallint, due_date date)"
+        )
+        cursor.copy_expert(
+            f"COPY goal_import ({staged}) FROM STDIN WITH (FORMAT csv, FORCE_NOT_NULL (title, description))", buffer
+        )
+        cursor.execute(
+            f"INSERT INTO {table} ({staged}, created, updated, search_vector) "
+            f"SELECT {staged}, %s, %s, {search_vector} FROM goal_import RETURNING id, board_id",
+            [now, now, *params],
+        )
+        created: List[Tuple[int, int]] = cursor.fetchall()
+        cursor.execute("DROP TABLE goal_import")
+
+    return created
+
+
+def create_goals(rows: List[dict], user) -> List[Tuple[int, int]]:
+    """
+    Inserts the goals with bulk_create on databases without COPY
+
+    Returns:
+        IDs of the created goals and of their boards
+    """
+    goals: List[Goal] = [Goal(**row, board_id=row["category"].board_id, user_id=user.id) for row in rows]
+    prepare_bulk_create(goals)
+    Goal.objects.bulk_create(goals, batch_size=IMPORT_BATCH_SIZE)
+    finish_bulk_create(goals)
+
+    return [(goal.id, goal.board_id) for goal in goals]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create importer
+def import_goals(file: Iterable[str], user) -> Dict:
+    """
+    Imports goals from a CSV file into categories the user can edit
+
+    Valid rows are imported in a single transaction, invalid rows are reported with their line numbers.
+    Columns: category, title, description, status, priority, due_date
+
+    Args:
+        file: Lines of the CSV file with a header line
+        user: User importing the goals, becomes the author of the goals
+
+    Returns:
+        Dictionary with the number of imported goals, the errors, the elapsed time and the speed
+
+    Raises:
+        ValidationError: If the file has no header or no required columns
+    """
+    started: float = time.perf_counter()
+    valid, errors = validate_rows(read_rows(file), user)
+
+    if valid:
+        with transaction.atomic():
+            if connection.vendor == "postgresql":
+                created: List[Tuple[int, int]] = copy_goals(valid, user)
+            else:
+                created = create_goals(valid, user)
+            bump_board_versions(row["category"].board_id for row in valid)
+            publish_events("goal.created", created)
+            apply_goal_stats(
+                Counter(
+                    (
+                        row["category"].board_id,
+                        row["category"].id,
+                        row.get("status", Goal.Status.to_do),
+                        row.get("priority", Goal.Priority.medium),
+                    )
+                    for row in valid
+                )
+            )
+
+    elapsed: float = time.perf_counter() - started
+
+    return {
+        "imported": len(valid),
+        "errors": errors,
+        "elapsed": round(elapsed, 3),
+        "rows_per_second": round(len(valid) / elapsed) if elapsed else 0,
+    }
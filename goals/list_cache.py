@@ -0,0 +1,149 @@
+import hashlib
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from goals.roles import bump_versions, get_board_roles
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Cache settings
+BOARD_VERSION_KEY: str = "goals:board_version:{board_id}"
+LIST_CACHE_KEY: str = "goals:list:{view}:{user_id}:{params}:{versions}"
+LIST_CACHE_HEADER: str = "X-Cache"
+
+_stats: Counter = Counter()
+_stats_lock = threading.Lock()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create board version functions
+def _count(event: str) -> None:
+    """Increments a counter of the list cache"""
+    with _stats_lock:
+        _stats[event] += 1
+
+
+def bump_board_versions(board_ids: Iterable[int]) -> None:
+    """
+    Increments the versions of the boards, making every cached list with their objects obsolete
+
+    The versions are bumped right away and once more after the transaction commits,
+    so a concurrent request cannot cache a list read before the commit under the new version
+
+    Args:
+        board_ids: IDs of the boards whose boards, categories or goals changed
+    """
+    keys: list = [BOARD_VERSION_KEY.format(board_id=board_id) for board_id in set(board_ids)]
+    if not keys:
+        return
+
+    bump_versions(keys)
+    transaction.on_commit(lambda: bump_versions(keys))
+
+
+def get_board_versions(board_ids: Iterable[int]) -> Dict[int, int]:
+    """
+    Returns the versions of the boards, missing versions are created
+
+    Args:
+        board_ids: IDs of the boards
+
+    Returns:
+        Dictionary with board ids as keys and versions as values
+    """
+    keys: Dict[str, int] = {BOARD_VERSION_KEY.format(board_id=board_id): board_id for board_id in board_ids}
+    versions: dict = cache.get_many(keys)
+
+    for key in keys.keys() - versions.keys():
+        cache.add(key, time.time_ns() // 1000, None)
+        versions[key] = cache.get(key)
+
+    return {board_id: versions[key] for key, board_id in keys.items()}
+
+
+def get_list_cache_stats() -> Dict[str, float]:
+    """
+    Returns hit, stale hit and miss counters of the list cache of the current process
+
+    Returns:
+        Dictionary with hits, stale hits, misses and hit rate
+    """
+    with _stats_lock:
+        hits: int = _stats["hits"]
+        stale: int = _stats["stale"]
+        misses: int = _stats["misses"]
+
+    total: int = hits + stale + misses
+
+    return {
+        "hits": hits,
+        "stale": stale,
+        "misses": misses,
+        "hit_rate": (hits + stale) / total if total else 0.0,
+    }
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create view mixins
+class CachedListMixin:
+    """
+    Mixin for list views caching serialized pages per user and query parameters
+
+    Keys include the versions of every board the user participates in,
+    so any change of these boards, of the participations or of the users shown in the lists
+    moves the lists to new keys.
+    Entries older than LIST_CACHE_STALE_AFTER are revalidated by a single request,
+    while concurrent requests keep getting the stale page until LIST_CACHE_TIMEOUT
+    """
+
+    def get_list_cache_key(self, request: Request) -> str:
+        """Returns the cache key of a page for the user, the query parameters and the board versions"""
+        params: str = "&".join(
+            f"{name}={value}"
+            for name in sorted(request.query_params)
+            for value in sorted(request.query_params.getlist(name))
+        )
+        versions: str = ",".join(
+            f"{board_id}:{version}"
+            for board_id, version in sorted(get_board_versions(get_board_roles(request.user.id)).items())
+        )
+
+        return LIST_CACHE_KEY.format(
+            view=type(self).__name__,
+            user_id=request.user.id,
+            params=hashlib.md5(f"{request.get_host()}?{params}".encode()).hexdigest(),
+            versions=hashlib.md5(versions.encode()).hexdigest(),
+        )
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        """Returns a cached page of the list or caches a new one"""
+        key: str = self.get_list_cache_key(request)
+        entry: Optional[Tuple[object, float]] = cache.get(key)
+
+        if entry is not None:
+            data, stored = entry
+            if time.time() - stored < settings.LIST_CACHE_STALE_AFTER:
+                _count("hits")
+                return Response(data, headers={LIST_CACHE_HEADER: "HIT"})
+
+            # Only the request that takes the lock revalidates the stale page
+            if not cache.add(f"{key}:lock", True, settings.LIST_CACHE_STALE_AFTER):
+                _count("stale")
+                return Response(data, headers={LIST_CACHE_HEADER: "STALE"})
+
+        _count("misses")
+        try:
+            response: Response = super().list(request, *args, **kwargs)  # type: ignore
+            cache.set(key, (response.data, time.time()), settings.LIST_CACHE_TIMEOUT)
+        finally:
+            cache.delete(f"{key}:lock")
+        response[LIST_CACHE_HEADER] = "MISS"
+
+        return response
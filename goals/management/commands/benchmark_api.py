@@ -0,0 +1,354 @@
+import json
+import statistics
+import time
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django.core.cache import cache
+from django.core.management import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+
+from core.models import User
+from goals.models.board import Board
+from goals.models.goal import Goal, visible_goals
+from goals.models.goal_category import GoalCategory
+from goals.models.goal_comment import GoalComment
+from goals.seeding import DatasetSeeder
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Benchmark settings
+# Name of a scenario, HTTP method and the function building the path and the data of the request number 'index'
+Scenario = Tuple[str, str, Callable[[int], Tuple[str, Optional[dict]]]]
+METRICS: Tuple[str, ...] = ("p50_ms", "p95_ms", "p99_ms", "queries", "bytes")
+PAGE_SIZE: int = 50
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create helpers
+def build_dataset(
+    users: int, boards: int, participants: int, categories: int, goals: int, comments: int, seed: int
+) -> Dict[str, array]:
+    """
+    Creates the benchmark dataset with the dataset seeder of the seed command
+
+    The boards are the same size and the first user owns every board,
+    the other participants of a board are drawn from the other users
+
+    Args:
+        users: Number of users
+        boards: Number of boards
+        participants: Participants per board including the owner
+        categories: Categories per board
+        goals: Goals per category
+        comments: Comments per goal
+        seed: Seed of the random choices
+
+    Returns:
+        Ids of the created rows by model
+    """
+    return DatasetSeeder(seed).seed(
+        users,
+        boards,
+        boards * (participants - 1),
+        boards * categories,
+        boards * categories * goals,
+        boards * categories * goals * comments,
+        prefix=f"benchmark_{seed}",
+        password="benchmark",
+        skew=None,
+        single_owner=True,
+    )
+
+
+def get_visible_ids(dataset: Dict[str, array]) -> Dict[str, List[int]]:
+    """Returns the ids of the created boards, categories, goals and comments shown to the participants"""
+    querysets: Dict[str, QuerySet] = {
+        "boards": Board.objects.filter(is_deleted=False),
+        "categories": GoalCategory.objects.filter(is_deleted=False, board__is_deleted=False),
+        "goals": Goal.objects.filter(visible_goals()),
+        "comments": GoalComment.objects.filter(visible_goals("goal__")),
+    }
+
+    return {
+        name: list(
+            queryset.filter(id__range=(dataset[name][0], dataset[name][-1])).order_by("id").values_list("id", flat=True)
+        )
+        for name, queryset in querysets.items()
+    }
+
+
+def get_scenarios(visible: Dict[str, List[int]]) -> List[Scenario]:
+    """
+    Returns the requests of the list, detail, create, update and delete views
+
+    Every request of a scenario works with the next visible object of the dataset, deleted objects are taken
+    from the end of the dataset, so they are not requested again by the other scenarios
+    """
+    boards, categories = visible["boards"], visible["categories"]
+    goals, comments = visible["goals"], visible["comments"]
+    due_date: str = timezone.now().date().isoformat()
+
+    def pick(ids: List[int], index: int, reverse_order: bool = False) -> int:
+        """Returns the id of the object for the request number 'index'"""
+        return ids[-1 - index % len(ids)] if reverse_order else ids[index % len(ids)]
+
+    return [
+        ("boards.list", "get", lambda index: (reverse("board_list"), {"limit": PAGE_SIZE})),
+        (
+            "categories.list",
+            "get",
+            lambda index: (reverse("category_list"), {"board": pick(boards, index), "limit": PAGE_SIZE}),
+        ),
+        (
+            "goals.list",
+            "get",
+            lambda index: (reverse("goal_list"), {"category": pick(categories, index), "limit": PAGE_SIZE}),
+        ),
+        (
+            "comments.list",
+            "get",
+            lambda index: (reverse("comment_list"), {"goal": pick(goals, index), "limit": PAGE_SIZE}),
+        ),
+        ("board.detail", "get", lambda index: (reverse("board", kwargs={"pk": pick(boards, index)}), None)),
+        (
+            "category.detail",
+            "get",
+            lambda index: (reverse("category", kwargs={"pk": pick(categories, index)}), None),
+        ),
+        ("goal.detail", "get", lambda index: (reverse("goal", kwargs={"pk": pick(goals, index)}), None)),
+        ("comment.detail", "get", lambda index: (reverse("comment", kwargs={"pk": pick(comments, index)}), None)),
+        (
+            "category.create",
+            "post",
+            lambda index: (reverse("category_create"), {"board": pick(boards, index), "title": "Категория"}),
+        ),
+        (
+            "goal.create",
+            "post",
+            lambda index: (
+                reverse("goal_create"), {"category": pick(categories, index), "title": "Цель", "due_date": due_date}
+            ),
+        ),
+        (
+            "comment.create",
+            "post",
+            lambda index: (reverse("comment_create"), {"goal": pick(goals, index), "text": "Комментарий"}),
+        ),
+        (
+            "goal.update",
+            "patch",
+            lambda index: (reverse("goal", kwargs={"pk": pick(goals, index)}), {"title": f"Цель {index}"}),
+        ),
+        (
+            "comment.update",
+            "patch",
+            lambda index: (reverse("comment", kwargs={"pk": pick(comments, index)}), {"text": f"Текст {index}"}),
+        ),
+        (
+            "comment.delete",
+            "delete",
+            lambda index: (reverse("comment", kwargs={"pk": pick(comments, index, True)}), None),
+        ),
+        ("goal.delete", "delete", lambda index: (reverse("goal", kwargs={"pk": pick(goals, index, True)}), None)),
+    ]
+
+
+def percentile(timings: List[float], percent: int) -> float:
+    """Returns the percentile of the timings with linear interpolation"""
+    if len(timings) == 1:
+        return timings[0]
+
+    return statistics.quantiles(timings, n=100, method="inclusive")[percent - 1]
+
+
+def run_scenario(
+    client: APIClient, scenario: Scenario, requests: int, warmup: int, use_cache: bool
+) -> Dict[str, float]:
+    """
+    Sends the requests of a scenario and returns the latency percentiles, queries and bytes per request,
+    the cache is cleared before every request unless it is used
+
+    Raises:
+        CommandError: If a request fails
+    """
+    name, method, build = scenario
+    timings: List[float] = []
+    queries: List[int] = []
+    sizes: List[int] = []
+
+    for index in range(warmup + requests):
+        path, data = build(index)
+        if not use_cache:
+            cache.clear()
+
+        with CaptureQueriesContext(connection) as captured:
+            started: float = time.perf_counter()
+            response: Response = (
+                client.get(path, data) if method == "get" else getattr(client, method)(path, data, format="json")
+            )
+            elapsed: float = (time.perf_counter() - started) * 1000
+
+        if response.status_code >= 400:
+            raise CommandError(f"{name}: запрос {path} вернул {response.status_code}")
+        if index >= warmup:
+            timings.append(elapsed)
+            queries.append(len(captured))
+            sizes.append(len(response.content))
+
+    return {
+        "requests": requests,
+        "p50_ms": round(percentile(timings, 50), 3),
+        "p95_ms": round(percentile(timings, 95), 3),
+        "p99_ms": round(percentile(timings, 99), 3),
+        "queries": max(queries),
+        "bytes": round(statistics.mean(sizes)),
+    }
+
+
+def compare_results(results: Dict[str, dict], baseline: Dict[str, dict]) -> Dict[str, Dict[str, float]]:
+    """Returns the relative change of every metric of the scenarios present in both runs"""
+    changes: Dict[str, Dict[str, float]] = {}
+    for name in results.keys() & baseline.keys():
+        changes[name] = {
+            metric: (results[name][metric] - baseline[name][metric]) / baseline[name][metric]
+            if baseline[name][metric]
+            else float(results[name][metric] != baseline[name][metric])
+            for metric in METRICS
+        }
+
+    return changes
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create a new command
+class Command(BaseCommand):
+    help = "Measure the latency, queries and response size of the API views on a generated dataset"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--users", type=int, default=200, help="Number of users")
+        parser.add_argument("--boards", type=int, default=50, help="Number of boards")
+        parser.add_argument("--participants", type=int, default=10, help="Participants per board")
+        parser.add_argument("--categories", type=int, default=5, help="Categories per board")
+        parser.add_argument("--goals", type=int, default=20, help="Goals per category")
+        parser.add_argument("--comments", type=int, default=3, help="Comments per goal")
+        parser.add_argument("--requests", type=int, default=100, help="Measured requests per scenario")
+        parser.add_argument("--warmup", type=int, default=10, help="Requests per scenario before measuring")
+        parser.add_argument("--seed", type=int, default=0, help="Seed of the dataset")
+        parser.add_argument("--scenarios", nargs="+", help="Names of the scenarios to run, all by default")
+        parser.add_argument("--output", help="Path of the JSON results file")
+        parser.add_argument("--baseline", help="Path of the JSON results file of a baseline run to compare with")
+        parser.add_argument(
+            "--max-regression", type=float, help="Fail if p95 grows by more than this share of the baseline"
+        )
+        parser.add_argument("--cache", action="store_true", help="Keep the caches between requests")
+        parser.add_argument("--keep", action="store_true", help="Keep the dataset instead of rolling it back")
+
+    def handle(self, *args, **options) -> None:
+        """
+        The handle method is called when the command is executed.
+        It builds the dataset, sends the requests of every scenario through the API test client,
+        reports the latency percentiles, queries and bytes per request and writes them to the results file.
+        The dataset and the changes of the requests are rolled back unless '--keep' is given
+
+        Return:
+            None
+        """
+        if options["users"] < 1 or min(options["boards"], options["categories"], options["goals"]) < 1:
+            raise CommandError("Нужны хотя бы один пользователь, доска, категория и цель")
+        if options["comments"] < 1 or options["requests"] < 1:
+            raise CommandError("Нужны хотя бы один комментарий и один запрос")
+        # Every delete request needs its own goal and comment
+        goals: int = options["boards"] * options["categories"] * options["goals"]
+        if options["requests"] + options["warmup"] > goals:
+            raise CommandError(f"Запросов на сценарий больше, чем целей: {goals}")
+
+        with transaction.atomic():
+            started: float = time.perf_counter()
+            dataset: Dict[str, array] = build_dataset(
+                options["users"],
+                options["boards"],
+                options["participants"],
+                options["categories"],
+                options["goals"],
+                options["comments"],
+                options["seed"],
+            )
+            self.stdout.write(
+                f"Данные созданы за {time.perf_counter() - started:.1f} с: "
+                + ", ".join(f"{name} {len(objects)}" for name, objects in dataset.items())
+            )
+
+            visible: Dict[str, List[int]] = get_visible_ids(dataset)
+            if options["requests"] + options["warmup"] > min(len(visible["goals"]), len(visible["comments"])):
+                raise CommandError("Запросов на сценарий больше, чем видимых целей или комментариев")
+
+            client = APIClient()
+            client.force_authenticate(user=User.objects.get(id=dataset["users"][0]))
+            scenarios: List[Scenario] = [
+                scenario
+                for scenario in get_scenarios(visible)
+                if not options["scenarios"] or scenario[0] in options["scenarios"]
+            ]
+
+            results: Dict[str, dict] = {}
+            for scenario in scenarios:
+                results[scenario[0]] = run_scenario(
+                    client, scenario, options["requests"], options["warmup"], options["cache"]
+                )
+                self.stdout.write(
+                    f"{scenario[0]:<16} p50 {results[scenario[0]]['p50_ms']:8.2f} мс, "
+                    f"p95 {results[scenario[0]]['p95_ms']:8.2f} мс, p99 {results[scenario[0]]['p99_ms']:8.2f} мс, "
+                    f"запросов {results[scenario[0]]['queries']:>3}, {results[scenario[0]]['bytes']:>8} байт"
+                )
+
+            if not options["keep"]:
+                transaction.set_rollback(True)
+
+        report: dict = {
+            "created": timezone.now().isoformat(),
+            "dataset": {name: len(objects) for name, objects in dataset.items()},
+            "options": {
+                name: options[name]
+                for name in ("participants", "categories", "goals", "comments", "requests", "warmup", "seed", "cache")
+            },
+            "results": results,
+        }
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as file:
+                json.dump(report, file, ensure_ascii=False, indent=2)
+
+        if options["baseline"]:
+            self.compare(results, options["baseline"], options["max_regression"])
+
+    def compare(self, results: Dict[str, dict], path: str, max_regression: Optional[float]) -> None:
+        """
+        Reports the changes against the results file of a baseline run
+
+        Raises:
+            CommandError: If the file cannot be read or p95 of a scenario grew by more than the allowed share
+        """
+        try:
+            with open(path, encoding="utf-8") as file:
+                baseline: Dict[str, dict] = json.load(file)["results"]
+        except (OSError, ValueError, KeyError) as error:
+            raise CommandError(f"Не удалось прочитать базовый замер: {error}")
+
+        changes: Dict[str, Dict[str, float]] = compare_results(results, baseline)
+        regressions: List[str] = []
+        for name in results:
+            if name not in changes:
+                continue
+            self.stdout.write(
+                f"{name:<16} " + ", ".join(f"{metric} {changes[name][metric]:+.0%}" for metric in METRICS)
+            )
+            if max_regression is not None and changes[name]["p95_ms"] > max_regression:
+                regressions.append(name)
+
+        if regressions:
+            raise CommandError(f"p95 вырос больше чем на {max_regression:.0%}: {', '.join(regressions)}")
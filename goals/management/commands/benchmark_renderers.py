@@ -0,0 +1,69 @@
+import io
+from typing import List, Tuple
+
+from django.core.management import BaseCommand, CommandError
+from rest_framework.parsers import BaseParser, JSONParser
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+from core.parsers import MessagePackParser, ORJSONParser
+from core.renderers import MessagePackRenderer, ORJSONRenderer
+from goals.compiled import CompiledSerializer, compile_serializer
+from goals.management.commands.benchmark_serializers import measure
+from goals.models.goal import Goal
+from goals.serializers.goal import GoalSerializer
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create helpers
+def get_renderers() -> List[Tuple[str, BaseRenderer, BaseParser]]:
+    """Returns the renderers to compare with the parsers of their output, the first one is the baseline"""
+    return [
+        ("json", JSONRenderer(), JSONParser()),
+        ("orjson", ORJSONRenderer(), ORJSONParser()),
+        ("msgpack", MessagePackRenderer(), MessagePackParser()),
+    ]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create a new command
+class Command(BaseCommand):
+    help = "Compare the encode time, decode time and payload size of the API formats on pages of the stored goals"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000], help="Page sizes")
+        parser.add_argument("--repeat", type=int, default=20, help="Runs per page size")
+
+    def handle(self, *args, **options) -> None:
+        """
+        The handle method is called when the command is executed.
+        It renders pages of every size with every renderer and parses them back,
+        reports the median times and sizes and fails if a format does not decode into the same page
+
+        Return:
+            None
+        """
+        compiled: CompiledSerializer = compile_serializer(GoalSerializer)
+        renderers: List[Tuple[str, BaseRenderer, BaseParser]] = get_renderers()
+
+        for size in options["sizes"]:
+            page: dict = {
+                "next": None,
+                "previous": None,
+                "results": compiled.represent(compiled.values(Goal.objects.order_by("id")[:size])),
+            }
+            baseline: Tuple[float, float, int] = (0.0, 0.0, 0)
+
+            for name, renderer, parser in renderers:
+                encoded, rendered = measure(lambda: renderer.render(page), options["repeat"])
+                decoded, parsed = measure(lambda: parser.parse(io.BytesIO(rendered)), options["repeat"])
+                baseline = baseline if baseline[2] else (encoded, decoded, len(rendered))
+
+                if parsed != page:
+                    raise CommandError(f"{name}: данные отличаются от исходных")
+
+                self.stdout.write(
+                    f"{name:<8} целей {len(page['results']):>5}: "
+                    f"кодирование {encoded:8.2f} мс (x{baseline[0] / encoded if encoded else 0:.1f}), "
+                    f"декодирование {decoded:8.2f} мс (x{baseline[1] / decoded if decoded else 0:.1f}), "
+                    f"{len(rendered):>9} байт ({len(rendered) / baseline[2] if baseline[2] else 0:.0%})"
+                )
@@ -0,0 +1,82 @@
+import statistics
+import time
+from typing import Any, Callable, List, Tuple, Type
+
+from django.core.management import BaseCommand, CommandError
+from django.db.models import QuerySet
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+
+from goals.compiled import CompiledSerializer, compile_serializer
+from goals.models.board import Board
+from goals.models.goal import Goal
+from goals.models.goal_category import GoalCategory
+from goals.models.goal_comment import GoalComment
+from goals.serializers.board import BoardCreateSerializer
+from goals.serializers.category import GoalCategorySerializer
+from goals.serializers.comment import GoalCommentSerializer
+from goals.serializers.goal import GoalSerializer
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create helpers
+def get_benchmarks() -> List[Tuple[str, Type[serializers.Serializer], QuerySet]]:
+    """Returns the serializers of the list endpoints with the querysets the endpoints serialize"""
+    return [
+        ("goals", GoalSerializer, Goal.objects.select_related("user").order_by("id")),
+        ("categories", GoalCategorySerializer, GoalCategory.objects.select_related("user").order_by("id")),
+        ("comments", GoalCommentSerializer, GoalComment.objects.select_related("user").order_by("id")),
+        ("boards", BoardCreateSerializer, Board.objects.order_by("id")),
+    ]
+
+
+def measure(function: Callable[[], Any], repeat: int) -> Tuple[float, Any]:
+    """Returns the median time of the function in milliseconds and its last result"""
+    timings: List[float] = []
+    result: Any = None
+    for _ in range(repeat):
+        started: float = time.perf_counter()
+        result = function()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return statistics.median(timings), result
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create a new command
+class Command(BaseCommand):
+    help = "Compare the list serializers with their compiled read paths on the stored objects"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--sizes", type=int, nargs="+", default=[100, 250, 500, 1000], help="Page sizes")
+        parser.add_argument("--repeat", type=int, default=20, help="Runs per page size")
+
+    def handle(self, *args, **options) -> None:
+        """
+        The handle method is called when the command is executed.
+        It fetches and serializes pages of every size with the serializer and with its compiled read path,
+        reports the median times and fails if the rendered outputs differ
+
+        Return:
+            None
+        """
+        renderer = JSONRenderer()
+        for name, serializer_class, queryset in get_benchmarks():
+            compiled: CompiledSerializer = compile_serializer(serializer_class)
+
+            for size in options["sizes"]:
+                page: QuerySet = queryset[:size]
+                regular, expected = measure(
+                    lambda: serializer_class(list(page), many=True).data, options["repeat"]
+                )
+                fast, actual = measure(
+                    lambda: compiled.represent(compiled.values(page)), options["repeat"]
+                )
+
+                if renderer.render(expected) != renderer.render(actual):
+                    raise CommandError(f"{name}: вывод скомпилированного сериализатора отличается")
+
+                self.stdout.write(
+                    f"{name:<12} строк {len(actual):>5}: сериализатор {regular:8.2f} мс, "
+                    f"скомпилированный {fast:8.2f} мс, ускорение x{regular / fast if fast else 0:.1f}"
+                )
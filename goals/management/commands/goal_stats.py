@@ -0,0 +1,39 @@
+from django.core.management import BaseCommand, CommandError
+
+from goals.models.goal import Goal
+from goals.stats import rebuild_goal_stats, verify_goal_stats
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create a new command
+class Command(BaseCommand):
+    help = "Verify the goal statistics against a recount of the goals or rebuild them"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("action", choices=("verify", "rebuild"), help="Verify or rebuild the statistics")
+
+    def handle(self, *args, **options) -> None:
+        """
+        The handle method is called when the command is executed.
+        It reports the keys whose stored numbers differ from the recount and fails if there are any,
+        or replaces the statistics with the recount
+
+        Return:
+            None
+        """
+        if options["action"] == "rebuild":
+            keys: int = rebuild_goal_stats(Goal.objects.all())
+            self.stdout.write(f"Статистика пересчитана, ключей: {keys}")
+            return
+
+        mismatches: dict = verify_goal_stats(Goal.objects.all())
+        for (board_id, category_id, status, priority), (stored, counted) in mismatches.items():
+            self.stderr.write(
+                f"Доска {board_id}, категория {category_id}, статус {status}, приоритет {priority}: "
+                f"сохранено {stored}, подсчитано {counted}"
+            )
+
+        if mismatches:
+            raise CommandError(f"Статистика расходится с целями, ключей: {len(mismatches)}")
+
+        self.stdout.write("Статистика совпадает с целями")
@@ -0,0 +1,44 @@
+from django.core.management import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+
+from core.models import User
+from goals.importer import import_goals
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create a new command
+class Command(BaseCommand):
+    help = "Import goals from a CSV file with the columns: category, title, description, status, priority, due_date"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("path", help="Path to the CSV file")
+        parser.add_argument("--user", required=True, help="Username of the author of the goals")
+
+    def handle(self, *args, **options) -> None:
+        """
+        The handle method is called when the command is executed.
+        It imports the goals of the file and reports the errors of the rows and the speed of the import
+
+        Return:
+            None
+        """
+        try:
+            user: User = User.objects.get(username=options["user"])
+        except User.DoesNotExist:
+            raise CommandError(f"Пользователь {options['user']} не найден")
+
+        try:
+            with open(options["path"], encoding="utf-8-sig", newline="") as file:
+                result: dict = import_goals(file, user)
+        except (OSError, UnicodeDecodeError) as error:
+            raise CommandError(f"Не удалось прочитать файл: {error}")
+        except ValidationError as error:
+            raise CommandError(" ".join(str(detail) for detail in error.detail))
+
+        for error in result["errors"]:
+            self.stderr.write(f"Строка {error['line']}: {error['errors']}")
+
+        self.stdout.write(
+            f"Импортировано целей: {result['imported']}, ошибок: {len(result['errors'])}, "
+            f"{result['elapsed']} с, {result['rows_per_second']} строк/с"
+        )
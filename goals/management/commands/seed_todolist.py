@@ -0,0 +1,65 @@
+import time
+
+from django.core.management import BaseCommand, CommandError
+from django.db import transaction
+
+from core.models import User
+from goals.seeding import DatasetSeeder
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create a new command
+class Command(BaseCommand):
+    help = "Fill the database with a large synthetic dataset of users, boards, categories, goals and comments"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--users", type=int, default=100_000, help="Number of users")
+        parser.add_argument("--boards", type=int, default=20_000, help="Number of boards")
+        parser.add_argument("--participants", type=int, default=60_000, help="Participants besides the owners")
+        parser.add_argument("--categories", type=int, default=100_000, help="Number of categories")
+        parser.add_argument("--goals", type=int, default=1_000_000, help="Number of goals")
+        parser.add_argument("--comments", type=int, default=1_000_000, help="Number of comments")
+        parser.add_argument("--days", type=int, default=365, help="Days the creation times are spread over")
+        parser.add_argument("--skew", type=float, default=1.2, help="Pareto shape of board sizes, lower is skewer")
+        parser.add_argument("--chunk-size", type=int, default=5000, help="Rows per INSERT")
+        parser.add_argument("--prefix", default="seed", help="Prefix of the usernames")
+        parser.add_argument("--password", default="seedp@ssword", help="Password of every user")
+        parser.add_argument("--seed", type=int, default=0, help="Seed of the random choices")
+
+    def handle(self, *args, **options) -> None:
+        """
+        The handle method is called when the command is executed.
+        It creates the dataset in a single transaction with chunked bulk INSERTs of the dataset seeder.
+        Board sizes follow a Pareto distribution, so a few boards get most of the participants,
+        categories and goals. Creation times are spread over the last days in the order of the rows,
+        search vectors are built by one UPDATE per model and goals are added to the statistics
+
+        Return:
+            None
+        """
+        if min(options["users"], options["boards"]) < 1:
+            raise CommandError("Нужен хотя бы один пользователь и одна доска")
+        if options["categories"] < options["boards"]:
+            raise CommandError("Категорий должно быть не меньше, чем досок")
+        if options["comments"] and not options["goals"]:
+            raise CommandError("Комментариям нужны цели")
+        if User.objects.filter(username__startswith=f"{options['prefix']}_").exists():
+            raise CommandError(f"Пользователи с префиксом '{options['prefix']}' уже есть")
+
+        seeder = DatasetSeeder(options["seed"], options["days"], options["chunk_size"], self.stdout.write)
+        started: float = time.perf_counter()
+
+        with transaction.atomic():
+            seeder.seed(
+                options["users"],
+                options["boards"],
+                options["participants"],
+                options["categories"],
+                options["goals"],
+                options["comments"],
+                options["prefix"],
+                options["password"],
+                options["skew"],
+            )
+
+        self.stdout.write(f"Данные созданы за {time.perf_counter() - started:.1f} с")
@@ -0,0 +1,36 @@
+# Generated by Django 4.1.7 on 2026-10-17 22:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("goals", "0010_alter_goal_category_alter_goalcomment_goal"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="board",
+            index=models.Index(fields=["title", "id"], name="board_keyset_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="goal",
+            index=models.Index(
+                fields=["-priority", "due_date", "id"], name="goal_keyset_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="goalcategory",
+            index=models.Index(fields=["title", "id"], name="category_keyset_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="goalcomment",
+            index=models.Index(fields=["-created", "id"], name="comment_keyset_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="goalcomment",
+            index=models.Index(
+                fields=["goal", "-created", "id"], name="comment_goal_keyset_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.1.7 on 2026-10-17 22:59
+
+from django.db import migrations, models
+
+from goals.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("goals", "0011_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="boardparticipant",
+            index=models.Index(
+                fields=["board", "user", "role"], name="participant_role_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.1.7 on 2026-10-17 22:59
+
+from django.db import migrations, models
+
+from goals.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("goals", "0012_participant_role_index"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="goal",
+            index=models.Index(
+                condition=models.Q(("status", 4), _negated=True),
+                fields=["category", "-priority", "due_date"],
+                name="goal_active_category_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="goal",
+            index=models.Index(
+                condition=models.Q(("status", 4), _negated=True),
+                fields=["due_date", "status", "priority"],
+                name="goal_active_due_date_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.1.7 on 2026-10-17 22:59
+
+from django.db import migrations, models
+
+from goals.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("goals", "0013_goal_active_indexes"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="board",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["title", "id"],
+                name="board_active_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="goalcategory",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["board", "title"],
+                name="category_active_board_idx",
+            ),
+        ),
+    ]
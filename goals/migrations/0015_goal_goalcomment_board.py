@@ -0,0 +1,60 @@
+# Generated by Django 4.1.7 on 2026-10-17 23:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Max, OuterRef, Subquery
+
+BATCH_SIZE = 10000
+
+
+def backfill_board(apps, schema_editor) -> None:
+    """Copies the board of the category to goals and of the goal to comments in pk batches"""
+    Goal = apps.get_model("goals", "Goal")
+    GoalCategory = apps.get_model("goals", "GoalCategory")
+    GoalComment = apps.get_model("goals", "GoalComment")
+
+    for model, source in (
+        (Goal, GoalCategory.objects.filter(id=OuterRef("category_id"))),
+        (GoalComment, Goal.objects.filter(id=OuterRef("goal_id"))),
+    ):
+        last_id: int = model.objects.aggregate(last_id=Max("id"))["last_id"] or 0
+        for start in range(0, last_id, BATCH_SIZE):
+            model.objects.filter(
+                id__gt=start, id__lte=start + BATCH_SIZE, board__isnull=True
+            ).update(board_id=Subquery(source.values("board_id")[:1]))
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("goals", "0014_board_category_active_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="goal",
+            name="board",
+            field=models.ForeignKey(
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="goals",
+                to="goals.board",
+                verbose_name="Доска",
+            ),
+        ),
+        migrations.AddField(
+            model_name="goalcomment",
+            name="board",
+            field=models.ForeignKey(
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="comments",
+                to="goals.board",
+                verbose_name="Доска",
+            ),
+        ),
+        migrations.RunPython(backfill_board, migrations.RunPython.noop),
+    ]
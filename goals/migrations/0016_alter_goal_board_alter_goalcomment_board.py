@@ -0,0 +1,35 @@
+# Generated by Django 4.1.7 on 2026-10-17 23:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("goals", "0015_goal_goalcomment_board"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="goal",
+            name="board",
+            field=models.ForeignKey(
+                editable=False,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="goals",
+                to="goals.board",
+                verbose_name="Доска",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="goalcomment",
+            name="board",
+            field=models.ForeignKey(
+                editable=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="comments",
+                to="goals.board",
+                verbose_name="Доска",
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.1.7 on 2026-10-17 23:10
+
+from django.db import migrations, models
+
+from goals.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("goals", "0016_alter_goal_board_alter_goalcomment_board"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="goal",
+            index=models.Index(
+                condition=models.Q(("status", 4), _negated=True),
+                fields=["board", "-priority", "due_date"],
+                name="goal_active_board_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.1.7 on 2026-10-17 23:11
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+from goals.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("goals", "0017_goal_active_board_index"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name="goal",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["title"],
+                name="goal_title_trgm_idx",
+                opclasses=("gin_trgm_ops",),
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="goal",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["description"],
+                name="goal_description_trgm_idx",
+                opclasses=("gin_trgm_ops",),
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="goalcategory",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["title"],
+                name="category_title_trgm_idx",
+                opclasses=("gin_trgm_ops",),
+            ),
+        ),
+    ]
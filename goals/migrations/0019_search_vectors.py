@@ -0,0 +1,98 @@
+# Generated by Django 4.1.7 on 2026-10-17 23:15
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import Max
+
+from goals.operations import AddIndexConcurrently
+
+BATCH_SIZE = 10000
+SEARCH_CONFIG = "russian"
+
+
+def backfill_search_vectors(apps, schema_editor) -> None:
+    """Builds the search vectors of existing rows in pk batches"""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for model_name, weights in (
+        ("Board", (("title", "A"),)),
+        ("GoalCategory", (("title", "A"),)),
+        ("Goal", (("title", "A"), ("description", "B"))),
+        ("GoalComment", (("text", "B"),)),
+    ):
+        model = apps.get_model("goals", model_name)
+        field, weight = weights[0]
+        vector = SearchVector(field, config=SEARCH_CONFIG, weight=weight)
+        for field, weight in weights[1:]:
+            vector += SearchVector(field, config=SEARCH_CONFIG, weight=weight)
+
+        last_id: int = model.objects.aggregate(last_id=Max("id"))["last_id"] or 0
+        for start in range(0, last_id, BATCH_SIZE):
+            model.objects.filter(id__gt=start, id__lte=start + BATCH_SIZE).update(search_vector=vector)
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("goals", "0018_trigram_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="board",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True, verbose_name="Поисковый вектор"
+            ),
+        ),
+        migrations.AddField(
+            model_name="goal",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True, verbose_name="Поисковый вектор"
+            ),
+        ),
+        migrations.AddField(
+            model_name="goalcategory",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True, verbose_name="Поисковый вектор"
+            ),
+        ),
+        migrations.AddField(
+            model_name="goalcomment",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True, verbose_name="Поисковый вектор"
+            ),
+        ),
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+        AddIndexConcurrently(
+            model_name="board",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="board_search_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="goal",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="goal_search_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="goalcategory",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="category_search_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="goalcomment",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="comment_search_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 4.1.7 on 2026-10-17 23:47
+
+from django.db import migrations, models
+from django.db.models import Count
+import django.db.models.deletion
+
+
+def build_goal_stats(apps, schema_editor) -> None:
+    """Counts the existing goals into the statistics"""
+    Goal = apps.get_model("goals", "Goal")
+    GoalStat = apps.get_model("goals", "GoalStat")
+
+    GoalStat.objects.bulk_create(
+        GoalStat(board_id=board_id, category_id=category_id, status=status, priority=priority, count=count)
+        for board_id, category_id, status, priority, count in Goal.objects.order_by()
+        .values_list("board_id", "category_id", "status", "priority")
+        .annotate(goals=Count("id"))
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("goals", "0019_search_vectors"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GoalStat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("status", models.PositiveSmallIntegerField(verbose_name="Статус")),
+                (
+                    "priority",
+                    models.PositiveSmallIntegerField(verbose_name="Приоритет"),
+                ),
+                (
+                    "count",
+                    models.IntegerField(default=0, verbose_name="Количество целей"),
+                ),
+                (
+                    "board",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="goal_stats",
+                        to="goals.board",
+                        verbose_name="Доска",
+                    ),
+                ),
+                (
+                    "category",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="goal_stats",
+                        to="goals.goalcategory",
+                        verbose_name="Категория",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Статистика целей",
+                "verbose_name_plural": "Статистика целей",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="goalstat",
+            constraint=models.UniqueConstraint(
+                fields=("board", "category", "status", "priority"), name="goal_stat_key"
+            ),
+        ),
+        migrations.RunPython(build_goal_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,98 @@
+# Generated by Django 4.1.7 on 2026-10-17 23:53
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+from goals.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("goals", "0020_goal_stats"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.PositiveSmallIntegerField(
+                        choices=[(1, "Комментарий"), (2, "Участник")],
+                        verbose_name="Тип",
+                    ),
+                ),
+                ("object_id", models.BigIntegerField(verbose_name="ID объекта")),
+                ("deleted", models.DateTimeField(verbose_name="Дата удаления")),
+            ],
+            options={
+                "verbose_name": "Удаленный объект",
+                "verbose_name_plural": "Удаленные объекты",
+            },
+        ),
+        AddIndexConcurrently(
+            model_name="boardparticipant",
+            index=models.Index(
+                fields=["board", "updated"], name="participant_sync_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="goal",
+            index=models.Index(fields=["board", "updated"], name="goal_sync_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="goalcategory",
+            index=models.Index(fields=["board", "updated"], name="category_sync_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="goalcomment",
+            index=models.Index(fields=["board", "updated"], name="comment_sync_idx"),
+        ),
+        migrations.AddField(
+            model_name="tombstone",
+            name="board",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="tombstones",
+                to="goals.board",
+                verbose_name="Доска",
+            ),
+        ),
+        migrations.AddField(
+            model_name="tombstone",
+            name="user",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="Пользователь участника",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tombstone",
+            index=models.Index(fields=["board", "deleted"], name="tombstone_board_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="tombstone",
+            index=models.Index(
+                condition=models.Q(("user__isnull", False)),
+                fields=["user", "deleted"],
+                name="tombstone_user_idx",
+            ),
+        ),
+    ]
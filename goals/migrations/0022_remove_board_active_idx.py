@@ -0,0 +1,20 @@
+# Generated by Django 4.1.7 on 2026-10-18 02:00
+
+from django.db import migrations
+
+from goals.operations import RemoveIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("goals", "0021_sync_indexes_tombstones"),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name="board",
+            name="board_active_idx",
+        ),
+    ]
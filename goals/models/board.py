@@ -1,20 +1,30 @@
 from typing import Tuple
 
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
 from core.models import User
-from goals.models.mixins import DatesModelMixin
+from goals.models.mixins import DatesModelMixin, SearchVectorModelMixin
 
 
 # ----------------------------------------------------------------------------------------------------------------------
 # Create models
-class Board(DatesModelMixin):
+class Board(SearchVectorModelMixin, DatesModelMixin):
     """Board model"""
 
     title = models.CharField(verbose_name="Название", max_length=255)
     is_deleted = models.BooleanField(verbose_name="Удалена", default=False)
 
+    search_weights: Tuple[Tuple[str, str], ...] = (("title", "A"),)
+
     class Meta:
+        indexes: Tuple[models.Index, ...] = (
+            # Keyset pagination over the default board list ordering,
+            # few boards are deleted, so the visibility filter is served by it as well
+            models.Index(fields=("title", "id"), name="board_keyset_idx"),
+            # Full-text search
+            GinIndex(fields=("search_vector",), name="board_search_idx"),
+        )
         verbose_name: str = "Доска"
         verbose_name_plural: str = "Доски"
 
@@ -51,6 +61,12 @@ class BoardParticipant(DatesModelMixin):
     )
 
     class Meta:
+        indexes: Tuple[models.Index, ...] = (
+            # Participant lookups that also check the role of a user on a board
+            models.Index(fields=("board", "user", "role"), name="participant_role_idx"),
+            # Changes of the participants of a board since a sync cursor
+            models.Index(fields=("board", "updated"), name="participant_sync_idx"),
+        )
         unique_together: Tuple[str, ...] = ("board", "user")
         verbose_name: str = "Участник"
         verbose_name_plural: str = "Участники"
@@ -1,13 +1,19 @@
-from django.db import models
+from typing import Optional, Tuple
+
+from django.contrib.postgres.indexes import GinIndex
+from django.db import models, transaction
 
 from core.models import User
+from goals.models.board import Board
 from goals.models.goal_category import GoalCategory
-from goals.models.mixins import DatesModelMixin
+from goals.list_cache import bump_board_versions
+from goals.models.mixins import DatesModelMixin, SearchVectorModelMixin
+from goals.stats import StatKey, get_saved_stat_key, lock_stat_key, record_goal_change
 
 
 # ----------------------------------------------------------------------------------------------------------------------
 # Create models
-class Goal(DatesModelMixin):
+class Goal(SearchVectorModelMixin, DatesModelMixin):
     """Goal model"""
 
     class Status(models.IntegerChoices):
@@ -33,6 +39,13 @@ class Goal(DatesModelMixin):
         on_delete=models.PROTECT,
         related_name="goals",
     )
+    board = models.ForeignKey(
+        Board,
+        verbose_name="Доска",
+        on_delete=models.PROTECT,
+        related_name="goals",
+        editable=False,
+    )
     title = models.CharField(max_length=255, verbose_name="Название")
     description = models.CharField(max_length=255, verbose_name="Описание", blank=True)
     status = models.PositiveSmallIntegerField(
@@ -43,10 +56,116 @@ class Goal(DatesModelMixin):
     )
     due_date = models.DateField(verbose_name="Дата дедлайна", blank=True)
 
+    search_weights: Tuple[Tuple[str, str], ...] = (("title", "A"), ("description", "B"))
+
     class Meta:
+        indexes: Tuple[models.Index, ...] = (
+            # Keyset pagination over the default goal list ordering
+            models.Index(fields=("-priority", "due_date", "id"), name="goal_keyset_idx"),
+            # Goal lists exclude archived goals and order by '-priority, due_date'
+            models.Index(
+                fields=("category", "-priority", "due_date"),
+                condition=~models.Q(status=4),  # Status.archived
+                name="goal_active_category_idx",
+            ),
+            models.Index(
+                fields=("board", "-priority", "due_date"),
+                condition=~models.Q(status=4),  # Status.archived
+                name="goal_active_board_idx",
+            ),
+            # Range filters on 'due_date' of GoalDateFilter
+            models.Index(
+                fields=("due_date", "status", "priority"),
+                condition=~models.Q(status=4),  # Status.archived
+                name="goal_active_due_date_idx",
+            ),
+            # Changes of the goals of a board since a sync cursor
+            models.Index(fields=("board", "updated"), name="goal_sync_idx"),
+            # Trigram search on titles and descriptions
+            GinIndex(
+                fields=("title",),
+                opclasses=("gin_trgm_ops",),
+                name="goal_title_trgm_idx",
+            ),
+            GinIndex(
+                fields=("description",),
+                opclasses=("gin_trgm_ops",),
+                name="goal_description_trgm_idx",
+            ),
+            # Full-text search
+            GinIndex(fields=("search_vector",), name="goal_search_idx"),
+        )
         verbose_name: str = "Цель"
         verbose_name_plural: str = "Цели"
 
     def __str__(self) -> str:
         """Returns the title of a goal"""
         return self.title
+
+    @classmethod
+    def from_db(cls, db, field_names, values) -> "Goal":
+        """Remembers the category the goal was loaded with"""
+        goal: Goal = super().from_db(db, field_names, values)
+        goal._loaded_category_id = goal.__dict__.get("category_id")
+
+        return goal
+
+    def save(self, *args, **kwargs) -> None:
+        """
+        Overrides the default save method to move the goal between the counters of the statistics
+        in the same transaction, the previous values are read under a lock of the row
+        """
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and not {"category", "category_id", "status", "priority"} & set(update_fields):
+            return self._save_on_board(*args, **kwargs)
+
+        with transaction.atomic():
+            previous: Optional[StatKey] = None if self._state.adding else lock_stat_key(self)
+            self._save_on_board(*args, **kwargs)
+            record_goal_change(previous, get_saved_stat_key(self, previous, update_fields))
+
+    def _save_on_board(self, *args, **kwargs) -> None:
+        """
+        Saves the goal, copying the board of a new category,
+        moving the comments along and expiring cached lists of the previous board
+        when the goal changes its board
+        """
+        update_fields = kwargs.get("update_fields")
+        category_changed: bool = self.category_id != getattr(self, "_loaded_category_id", None)
+
+        if not category_changed or (update_fields is not None and "category" not in update_fields):
+            return super().save(*args, **kwargs)
+
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "board"}
+
+        adding: bool = self._state.adding
+        previous_board_id: Optional[int] = self.board_id
+        board_changed: bool = previous_board_id != self.category.board_id
+        self.board_id = self.category.board_id
+
+        super().save(*args, **kwargs)
+        self._loaded_category_id = self.category_id
+
+        if board_changed and not adding:
+            self.comments.update(board_id=self.board_id, updated=self.updated)
+            bump_board_versions((previous_board_id,))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create filters
+def visible_goals(prefix: str = "") -> models.Q:
+    """
+    Returns the filter of the goals, or of the rows of the goals, shown to the participants of their boards
+
+    Deleting a board or a category archives its goals, the flags of the board and the category are checked as well,
+    so goals written around the views, like by the admin or raw updates, stay hidden.
+    Goals and comments store their board, so the board is joined directly
+
+    Args:
+        prefix: Lookup of the goal from another model, like 'goal__' for comments
+    """
+    return (
+        models.Q(board__is_deleted=False, **{f"{prefix}category__is_deleted": False})
+        & ~models.Q(**{f"{prefix}status": Goal.Status.archived})
+    )
@@ -1,13 +1,16 @@
+from typing import Tuple
+
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
 from core.models import User
 from goals.models.board import Board
-from goals.models.mixins import DatesModelMixin
+from goals.models.mixins import DatesModelMixin, SearchVectorModelMixin
 
 
 # ----------------------------------------------------------------------------------------------------------------------
 # Create models
-class GoalCategory(DatesModelMixin):
+class GoalCategory(SearchVectorModelMixin, DatesModelMixin):
     """Goal category model"""
 
     board = models.ForeignKey(
@@ -17,7 +20,29 @@ class GoalCategory(DatesModelMixin):
     title = models.CharField(verbose_name="Название", max_length=255)
     is_deleted = models.BooleanField(verbose_name="Удалена", default=False)
 
+    search_weights: Tuple[Tuple[str, str], ...] = (("title", "A"),)
+
     class Meta:
+        indexes: Tuple[models.Index, ...] = (
+            # Keyset pagination over the default category list ordering
+            models.Index(fields=("title", "id"), name="category_keyset_idx"),
+            # Visibility filter 'is_deleted=False' of every category read
+            models.Index(
+                fields=("board", "title"),
+                condition=models.Q(is_deleted=False),
+                name="category_active_board_idx",
+            ),
+            # Changes of the categories of a board since a sync cursor
+            models.Index(fields=("board", "updated"), name="category_sync_idx"),
+            # Trigram search on titles
+            GinIndex(
+                fields=("title",),
+                opclasses=("gin_trgm_ops",),
+                name="category_title_trgm_idx",
+            ),
+            # Full-text search
+            GinIndex(fields=("search_vector",), name="category_search_idx"),
+        )
         verbose_name: str = "Категория"
         verbose_name_plural: str = "Категории"
 
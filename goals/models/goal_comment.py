@@ -1,25 +1,56 @@
+from typing import Tuple
+
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
 from core.models import User
+from goals.models.board import Board
 from goals.models.goal import Goal
-from goals.models.mixins import DatesModelMixin
+from goals.models.mixins import DatesModelMixin, SearchVectorModelMixin
 
 
 # ----------------------------------------------------------------------------------------------------------------------
 # Create models
-class GoalComment(DatesModelMixin):
+class GoalComment(SearchVectorModelMixin, DatesModelMixin):
     """Goal comment model"""
 
     goal = models.ForeignKey(
         Goal, verbose_name="Цель", on_delete=models.CASCADE, related_name="comments"
     )
+    board = models.ForeignKey(
+        Board,
+        verbose_name="Доска",
+        on_delete=models.CASCADE,
+        related_name="comments",
+        editable=False,
+    )
     user = models.ForeignKey(User, verbose_name="Автор", on_delete=models.CASCADE)
     text = models.CharField(max_length=1000, verbose_name="Текст")
 
+    search_weights: Tuple[Tuple[str, str], ...] = (("text", "B"),)
+
     class Meta:
+        indexes: Tuple[models.Index, ...] = (
+            # Keyset pagination over the default comment list ordering
+            models.Index(fields=("-created", "id"), name="comment_keyset_idx"),
+            models.Index(
+                fields=("goal", "-created", "id"), name="comment_goal_keyset_idx"
+            ),
+            # Changes of the comments of a board since a sync cursor
+            models.Index(fields=("board", "updated"), name="comment_sync_idx"),
+            # Full-text search
+            GinIndex(fields=("search_vector",), name="comment_search_idx"),
+        )
         verbose_name: str = "Комментарий"
         verbose_name_plural: str = "Комментарии"
 
     def __str__(self) -> str:
         """Returns the text of a comment"""
         return self.text
+
+    def save(self, *args, **kwargs) -> None:
+        """Overrides the default save method to copy the board of the goal"""
+        if self._state.adding:
+            self.board_id = self.goal.board_id
+
+        return super().save(*args, **kwargs)
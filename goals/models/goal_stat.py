@@ -0,0 +1,38 @@
+from typing import Tuple
+
+from django.db import models
+
+from goals.models.board import Board
+from goals.models.goal_category import GoalCategory
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create models
+class GoalStat(models.Model):
+    """
+    Number of goals of a category with a status and a priority,
+    changed in the same transaction as every write of the goals
+    """
+
+    board = models.ForeignKey(
+        Board, verbose_name="Доска", on_delete=models.CASCADE, related_name="goal_stats"
+    )
+    category = models.ForeignKey(
+        GoalCategory, verbose_name="Категория", on_delete=models.CASCADE, related_name="goal_stats"
+    )
+    status = models.PositiveSmallIntegerField(verbose_name="Статус")
+    priority = models.PositiveSmallIntegerField(verbose_name="Приоритет")
+    count = models.IntegerField(verbose_name="Количество целей", default=0)
+
+    class Meta:
+        constraints: Tuple[models.BaseConstraint, ...] = (
+            models.UniqueConstraint(
+                fields=("board", "category", "status", "priority"), name="goal_stat_key"
+            ),
+        )
+        verbose_name: str = "Статистика целей"
+        verbose_name_plural: str = "Статистика целей"
+
+    def __str__(self) -> str:
+        """Returns the key and the number of goals"""
+        return f"{self.board_id}/{self.category_id}/{self.status}/{self.priority}: {self.count}"
@@ -1,6 +1,16 @@
-from django.db import models
+import operator
+from functools import reduce
+from typing import Tuple
+
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.db import connection, models
+from django.db.models import Value
 from django.utils import timezone
 
+# ----------------------------------------------------------------------------------------------------------------------
+# Full-text search settings
+SEARCH_CONFIG: str = "russian"
+
 
 # ----------------------------------------------------------------------------------------------------------------------
 # Create models
@@ -22,3 +32,48 @@ class DatesModelMixin(models.Model):
         self.updated = timezone.now()
 
         return super().save(*args, **kwargs)
+
+
+# ----------------------------------------------------------------
+class SearchVectorModelMixin(models.Model):
+    """
+    Abstract model with a stored full-text search vector,
+    the vector is rebuilt in the same query whenever one of the searchable fields is saved
+    """
+
+    search_vector = SearchVectorField(verbose_name="Поисковый вектор", null=True, editable=False)
+
+    # Searchable fields with their weights, from the most to the least relevant
+    search_weights: Tuple[Tuple[str, str], ...] = ()
+
+    class Meta:
+        abstract: bool = True
+
+    def get_search_vector(self) -> SearchVector:
+        """Returns the search vector expression built from the current field values"""
+        vectors: list = [
+            SearchVector(Value(getattr(self, field)), config=SEARCH_CONFIG, weight=weight)
+            for field, weight in self.search_weights
+        ]
+
+        return reduce(operator.add, vectors)
+
+    def save(self, *args, **kwargs) -> None:
+        """
+        Overrides the default save method to store the search vector of the searchable fields
+        """
+        update_fields = kwargs.get("update_fields")
+        searchable: set = {field for field, _ in self.search_weights}
+
+        if connection.vendor != "postgresql" or (
+            update_fields is not None and not searchable.intersection(update_fields)
+        ):
+            return super().save(*args, **kwargs)
+
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "search_vector"}
+
+        self.search_vector = self.get_search_vector()
+        super().save(*args, **kwargs)
+        # The stored vector is loaded again on access instead of keeping the expression
+        del self.search_vector
@@ -0,0 +1,51 @@
+from typing import Tuple
+
+from django.db import models
+
+from core.models import User
+from goals.models.board import Board
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create models
+class Tombstone(models.Model):
+    """Record of a deleted comment or participant, lets syncing clients remove their copies"""
+
+    class Kind(models.IntegerChoices):
+        """Kind choice"""
+
+        comment = 1, "Комментарий"
+        participant = 2, "Участник"
+
+    kind = models.PositiveSmallIntegerField(verbose_name="Тип", choices=Kind.choices)
+    object_id = models.BigIntegerField(verbose_name="ID объекта")
+    board = models.ForeignKey(
+        Board, verbose_name="Доска", on_delete=models.CASCADE, related_name="tombstones"
+    )
+    user = models.ForeignKey(
+        User,
+        verbose_name="Пользователь участника",
+        on_delete=models.CASCADE,
+        related_name="+",
+        null=True,
+        blank=True,
+    )
+    deleted = models.DateTimeField(verbose_name="Дата удаления")
+
+    class Meta:
+        indexes: Tuple[models.Index, ...] = (
+            # Deletions on the boards of a user since a sync cursor
+            models.Index(fields=("board", "deleted"), name="tombstone_board_idx"),
+            # Revoked access of a user since a sync cursor
+            models.Index(
+                fields=("user", "deleted"),
+                condition=models.Q(user__isnull=False),
+                name="tombstone_user_idx",
+            ),
+        )
+        verbose_name: str = "Удаленный объект"
+        verbose_name_plural: str = "Удаленные объекты"
+
+    def __str__(self) -> str:
+        """Returns the kind and the ID of the deleted object"""
+        return f"{self.get_kind_display()} {self.object_id}"
@@ -0,0 +1,53 @@
+from django.contrib.postgres.indexes import PostgresIndex
+from django.contrib.postgres.operations import AddIndexConcurrently as PostgresAddIndexConcurrently
+from django.contrib.postgres.operations import RemoveIndexConcurrently as PostgresRemoveIndexConcurrently
+from django.db.migrations import AddIndex, RemoveIndex
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create migration operations
+class AddIndexConcurrently(PostgresAddIndexConcurrently):
+    """
+    Operation building an index without locking writes on PostgreSQL
+
+    Other databases build the index with a plain CREATE INDEX
+    and skip PostgreSQL index types they do not have, like GIN
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state) -> None:
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+        elif not isinstance(self.index, PostgresIndex):
+            AddIndex.database_forwards(self, app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state) -> None:
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+        elif not isinstance(self.index, PostgresIndex):
+            AddIndex.database_backwards(self, app_label, schema_editor, from_state, to_state)
+
+
+# ----------------------------------------------------------------
+class RemoveIndexConcurrently(PostgresRemoveIndexConcurrently):
+    """
+    Operation dropping an index without locking writes on PostgreSQL
+
+    Other databases drop the index with a plain DROP INDEX,
+    PostgreSQL index types they skipped are not dropped
+    """
+
+    def is_skipped(self, app_label, state) -> bool:
+        """Returns whether other databases skipped the index, as a PostgreSQL index type"""
+        return isinstance(state.models[app_label, self.model_name_lower].get_index_by_name(self.name), PostgresIndex)
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state) -> None:
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+        elif not self.is_skipped(app_label, from_state):
+            RemoveIndex.database_forwards(self, app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state) -> None:
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+        elif not self.is_skipped(app_label, to_state):
+            RemoveIndex.database_backwards(self, app_label, schema_editor, from_state, to_state)
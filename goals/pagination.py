@@ -0,0 +1,301 @@
+import base64
+import binascii
+import json
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Any, List, Optional, Tuple
+
+from django.db.models import Model, Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, LimitOffsetPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create helpers
+def _encode_value(value: Any) -> Any:
+    """Converts an ordering value to a JSON-compatible form without losing precision"""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, Model):
+        return value.pk
+
+    raise TypeError(f"Cannot encode {type(value).__name__} into a cursor")
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create paginations
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination over the ordering of a queryset
+
+    The cursor stores the ordering values of the last row on a page,
+    the next page is fetched with a 'WHERE (ordering) > (cursor)' condition,
+    so the cost of a page does not depend on its depth and no COUNT(*) is run.
+    The primary key is always appended to the ordering as a tie-breaker
+    """
+
+    cursor_query_param: str = "cursor"
+    limit_query_param: str = "limit"
+    default_limit: int = 50
+    max_limit: int = 1000
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view: Any = None
+    ) -> List[Model]:
+        """
+        Returns a single page of objects positioned after (or before) the cursor
+
+        Raises:
+            NotFound: If the cursor is malformed
+        """
+        self.request = request
+        self.limit: int = self.get_limit(request)
+        self.ordering: List[Tuple[str, bool]] = self.get_ordering(queryset, view)
+
+        position, reverse = self.decode_cursor(request)
+
+        queryset = queryset.order_by(
+            *(
+                f"{'-' if descending != reverse else ''}{field}"
+                for field, descending in self.ordering
+            )
+        )
+        if position is not None:
+            queryset = queryset.filter(self.get_keyset_filter(position, reverse))
+
+        page: List[Model] = list(queryset[: self.limit + 1])
+        has_more: bool = len(page) > self.limit
+        page = page[: self.limit]
+        if reverse:
+            page.reverse()
+
+        has_next: bool = position is not None if reverse else has_more
+        has_previous: bool = has_more if reverse else position is not None
+
+        self.next_position: Optional[list] = None
+        self.previous_position: Optional[list] = None
+
+        if page:
+            if has_next:
+                self.next_position = self.get_position(page[-1])
+            if has_previous:
+                self.previous_position = self.get_position(page[0])
+        elif position is not None:
+            # An empty page still lets the client step back to where it came from
+            if reverse:
+                self.next_position = position
+            else:
+                self.previous_position = position
+
+        return page
+
+    def get_paginated_response(self, data: Any) -> Response:
+        """Returns a response with links to the neighbour pages and without a total count"""
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        """Returns the OpenAPI schema of a paginated response"""
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view: Any) -> List[dict]:
+        """Returns the OpenAPI query parameters of the pagination"""
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Курсор страницы, пустое значение включает курсорную пагинацию",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.limit_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Количество результатов на странице",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+    # ----------------------------------------------------------------
+    def get_limit(self, request: Request) -> int:
+        """Returns the page size requested by the client within the allowed bounds"""
+        try:
+            limit: int = int(request.query_params[self.limit_query_param])
+        except (KeyError, ValueError):
+            return self.default_limit
+
+        return min(limit, self.max_limit) if limit > 0 else self.default_limit
+
+    def get_ordering(self, queryset: QuerySet, view: Any) -> List[Tuple[str, bool]]:
+        """
+        Returns the ordering of the queryset as (field, descending) pairs
+        with the primary key appended as a unique tie-breaker
+        """
+        ordering = queryset.query.order_by or getattr(view, "ordering", None) or ()
+        if isinstance(ordering, str):
+            ordering = (ordering,)
+
+        fields: List[Tuple[str, bool]] = []
+        for item in ordering:
+            if not isinstance(item, str) or item == "?":
+                continue
+            field: str = item.lstrip("-")
+            fields.append(("id" if field == "pk" else field, item.startswith("-")))
+
+        if "id" not in (field for field, _ in fields):
+            fields.append(("id", False))
+
+        return fields
+
+    def get_position(self, instance: Any) -> list:
+        """Returns the ordering values of an object or of a '.values()' row"""
+        if isinstance(instance, dict):
+            return [instance[field] for field, _ in self.ordering]
+
+        position: list = []
+        for field, _ in self.ordering:
+            value: Any = instance
+            for attribute in field.split("__"):
+                value = getattr(value, attribute)
+            position.append(value.pk if isinstance(value, Model) else value)
+
+        return position
+
+    def get_keyset_filter(self, position: list, reverse: bool) -> Q:
+        """
+        Builds a lexicographic 'row comes after the position' condition
+        that respects mixed ascending/descending ordering
+        """
+        keyset_filter = Q()
+        for index, (field, descending) in enumerate(self.ordering):
+            lookup: str = "lt" if descending != reverse else "gt"
+            condition = Q(**{f"{field}__{lookup}": position[index]})
+            for previous_index, (previous_field, _) in enumerate(self.ordering[:index]):
+                condition &= Q(**{previous_field: position[previous_index]})
+            keyset_filter |= condition
+
+        return keyset_filter
+
+    # ----------------------------------------------------------------
+    def decode_cursor(self, request: Request) -> Tuple[Optional[list], bool]:
+        """
+        Decodes the cursor from the query parameters
+
+        Returns:
+            Position of the cursor (None for the first page) and the direction flag
+
+        Raises:
+            NotFound: If the cursor is malformed
+        """
+        encoded: str = request.query_params.get(self.cursor_query_param, "")
+        if not encoded:
+            return None, False
+
+        try:
+            padded: str = encoded + "=" * (-len(encoded) % 4)
+            cursor: dict = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            position: list = cursor["p"]
+            reverse: bool = bool(cursor.get("r", False))
+        except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError):
+            raise NotFound("Неверный курсор")
+
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound("Неверный курсор")
+
+        return position, reverse
+
+    def encode_cursor(self, position: list, reverse: bool) -> str:
+        """Returns a link to the page positioned by the cursor"""
+        cursor: dict = {"p": position}
+        if reverse:
+            cursor["r"] = 1
+
+        encoded: str = (
+            base64.urlsafe_b64encode(
+                json.dumps(cursor, default=_encode_value, separators=(",", ":")).encode()
+            )
+            .decode("ascii")
+            .rstrip("=")
+        )
+        url: str = self.request.build_absolute_uri()
+
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+    def get_next_link(self) -> Optional[str]:
+        """Returns a link to the next page"""
+        if self.next_position is None:
+            return None
+
+        return self.encode_cursor(self.next_position, reverse=False)
+
+    def get_previous_link(self) -> Optional[str]:
+        """Returns a link to the previous page"""
+        if self.previous_position is None:
+            return None
+
+        return self.encode_cursor(self.previous_position, reverse=True)
+
+
+# ----------------------------------------------------------------
+class LimitOffsetKeysetPagination(LimitOffsetPagination):
+    """
+    Limit/offset pagination with an opt-in keyset mode
+
+    Keyset pagination is used when the request carries the 'cursor' parameter,
+    an empty value requests the first page
+    """
+
+    keyset_class = KeysetPagination
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view: Any = None
+    ) -> Optional[List[Model]]:
+        """Paginates the queryset with the keyset pagination if requested"""
+        self.keyset: Optional[KeysetPagination] = None
+
+        if self.keyset_class.cursor_query_param in request.query_params:
+            self.keyset = self.keyset_class()
+            return self.keyset.paginate_queryset(queryset, request, view)
+
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data: Any) -> Response:
+        """Returns a response of the selected pagination mode"""
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+
+        return super().get_paginated_response(data)
+
+    def get_schema_operation_parameters(self, view: Any) -> List[dict]:
+        """Returns the OpenAPI query parameters of both pagination modes"""
+        return super().get_schema_operation_parameters(view) + [
+            self.keyset_class().get_schema_operation_parameters(view)[0]
+        ]
+
+
+# ----------------------------------------------------------------
+class SearchPagination(LimitOffsetPagination):
+    """Limit/offset pagination of the global search, always paginated"""
+
+    default_limit: int = 20
+    max_limit: int = 100
@@ -1,9 +1,27 @@
+from typing import Any, Optional
+
 from rest_framework import permissions
 
 from goals.models.board import BoardParticipant
-from goals.models.goal import Goal
-from goals.models.goal_category import GoalCategory
-from goals.models.goal_comment import GoalComment
+from goals.roles import EDITOR_ROLES, get_board_role
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create helpers
+def get_user_role(request, obj: Any, board_id: int) -> Optional[int]:
+    """
+    Returns the role of the user on the board of an object
+
+    Detail views annotate the role as 'user_role' when fetching the object,
+    roles of objects fetched without the annotation come from the role cache
+
+    Returns:
+        Role of the user or None if the user is not a participant of the board
+    """
+    if hasattr(obj, "user_role"):
+        return obj.user_role
+
+    return get_board_role(request.user, board_id)
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -23,14 +41,12 @@ class BoardPermission(permissions.BasePermission):
         if not request.user.is_authenticated:
             return False
 
+        role: Optional[int] = get_user_role(request, board, board.id)
+
         if request.method in permissions.SAFE_METHODS:
-            return BoardParticipant.objects.filter(
-                user=request.user, board=board
-            ).exists()
+            return role is not None
 
-        return BoardParticipant.objects.filter(
-            user=request.user, board=board, role=BoardParticipant.Role.owner
-        ).exists()
+        return role == BoardParticipant.Role.owner
 
 
 # ----------------------------------------------------------------
@@ -46,19 +62,12 @@ class GoalCategoryPermission(permissions.BasePermission):
         Returns:
             - True if the user has permission to access the category, False otherwise
         """
+        role: Optional[int] = get_user_role(request, category, category.board_id)
+
         if request.method in permissions.SAFE_METHODS:
-            return GoalCategory.objects.filter(
-                board__participants__user=request.user, board=category.board
-            ).exists()
+            return role is not None
 
-        return GoalCategory.objects.filter(
-            board__participants__user=request.user,
-            board=category.board,
-            board__participants__role__in=[
-                BoardParticipant.Role.owner,
-                BoardParticipant.Role.moderator,
-            ],
-        ).exists()
+        return role in EDITOR_ROLES
 
 
 # ----------------------------------------------------------------
@@ -74,20 +83,12 @@ class GoalPermission(permissions.BasePermission):
         Returns:
             - True if the user has permission to access the goal, False otherwise
         """
+        role: Optional[int] = get_user_role(request, goal, goal.board_id)
+
         if request.method in permissions.SAFE_METHODS:
-            return Goal.objects.filter(
-                category__board__participants__user=request.user,
-                category__board=goal.category.board,
-            ).exists()
+            return role is not None
 
-        return Goal.objects.filter(
-            category__board__participants__user=request.user,
-            category__board=goal.category.board,
-            category__board__participants__role__in=[
-                BoardParticipant.Role.owner,
-                BoardParticipant.Role.moderator,
-            ],
-        ).exists()
+        return role in EDITOR_ROLES
 
 
 # ----------------------------------------------------------------
@@ -103,17 +104,9 @@ class GoalCommentPermission(permissions.BasePermission):
         Returns:
             - True if the user has permission to access the comment, False otherwise
         """
+        role: Optional[int] = get_user_role(request, comment, comment.board_id)
+
         if request.method in permissions.SAFE_METHODS:
-            return GoalComment.objects.filter(
-                goal__category__board__participants__user=request.user,
-                goal__category__board=comment.goal.category.board,
-            ).exists()
-
-        return GoalComment.objects.filter(
-            goal__category__board__participants__user=request.user,
-            goal__category__board=comment.goal.category.board,
-            goal__category__board__participants__role__in=[
-                BoardParticipant.Role.owner,
-                BoardParticipant.Role.moderator,
-            ],
-        ).exists()
+            return role is not None
+
+        return role in EDITOR_ROLES
@@ -0,0 +1,190 @@
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Type, Union
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connection
+from django.db.models import Model, Prefetch, QuerySet
+from rest_framework import serializers
+
+logger = logging.getLogger(__name__)
+
+Lookup = Union[str, Prefetch]
+# Lookups for select_related and for prefetch_related
+RelatedPlan = Tuple[Tuple[str, ...], Tuple[Lookup, ...]]
+
+_batched_load: ContextVar[bool] = ContextVar("batched_load", default=False)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create helpers
+def resolve_relation(model: Type[Model], source_attrs: List[str]) -> Tuple[str, Optional[Type[Model]], bool]:
+    """
+    Returns the lookup of the relations a field source goes through, the model it ends on
+    and whether any of the relations is to-many
+
+    The walk stops at the first attribute that is not a relation, like a plain field or a property
+    """
+    path: List[str] = []
+    many: bool = False
+    for attr in source_attrs:
+        try:
+            field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            break
+        if not field.is_relation or field.related_model is None:
+            break
+
+        path.append(attr)
+        many = many or bool(field.one_to_many or field.many_to_many)
+        model = field.related_model
+
+    return "__".join(path), model if path else None, many
+
+
+def collect_related(serializer: serializers.Serializer, model: Type[Model], prefix: str = "") -> RelatedPlan:
+    """
+    Returns the lookups loading every relation a serializer reads from its model
+
+    Forward relations and nested serializers are joined, to-many relations are prefetched
+    with a queryset joining the relations of their own nested serializers
+
+    Args:
+        serializer: Serializer to inspect
+        model: Model the serializer reads
+        prefix: Lookup of the relation of a joined nested serializer, like 'user__'
+    """
+    select: List[str] = []
+    prefetch: List[Lookup] = []
+
+    for field in serializer.fields.values():
+        if field.write_only or isinstance(field, serializers.HiddenField) or field.source == "*":
+            continue
+        # Primary keys of forward relations are read from the column
+        if (
+            isinstance(field, serializers.RelatedField)
+            and field.use_pk_only_optimization()
+            and len(field.source_attrs) == 1
+        ):
+            continue
+
+        lookup, related_model, many = resolve_relation(model, field.source_attrs)
+        if related_model is None:
+            continue
+
+        child: serializers.Field = field.child if isinstance(field, serializers.ListSerializer) else field
+        nested: bool = isinstance(child, serializers.ModelSerializer)
+
+        if many:
+            if nested:
+                nested_select, nested_prefetch = collect_related(child, related_model)
+                prefetch.append(
+                    Prefetch(
+                        f"{prefix}{lookup}",
+                        queryset=related_model._default_manager.select_related(*nested_select).prefetch_related(
+                            *nested_prefetch
+                        ),
+                    )
+                )
+            else:
+                prefetch.append(f"{prefix}{lookup}")
+        else:
+            select.append(f"{prefix}{lookup}")
+            if nested:
+                nested_select, nested_prefetch = collect_related(child, related_model, f"{prefix}{lookup}__")
+                select += nested_select
+                prefetch += nested_prefetch
+
+    return select, prefetch
+
+
+@lru_cache(maxsize=None)
+def plan_related(serializer_class: Type[serializers.BaseSerializer]) -> RelatedPlan:
+    """Returns the related lookups of a model serializer class, planned once per process"""
+    model: Optional[Type[Model]] = getattr(getattr(serializer_class, "Meta", None), "model", None)
+    if model is None:
+        return (), ()
+
+    select, prefetch = collect_related(serializer_class(), model)
+    return tuple(dict.fromkeys(select)), tuple(prefetch)
+
+
+@contextmanager
+def batched_load() -> Iterator[None]:
+    """Marks the queries of the block as batched loads of relations, which are not lazy loads"""
+    token = _batched_load.set(True)
+    try:
+        yield
+    finally:
+        _batched_load.reset(token)
+
+
+def watch_lazy_loads(represent: Callable[[Any], Any], name: str) -> Callable[[Any], Any]:
+    """Returns the representation function logging a warning for the relations it loads lazily"""
+
+    def watched(instance: Any) -> Any:
+        """Returns the representation of an instance, recording the queries it issues"""
+        queries: List[str] = []
+        # An unpaginated list is fetched here, so only the loads of its relations are recorded
+        if isinstance(instance, QuerySet):
+            instance = list(instance)
+
+        def record(execute, sql, params, many, context):
+            """Records a query unless it is a batched load"""
+            if not _batched_load.get():
+                queries.append(sql)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(record):
+            data: Any = represent(instance)
+
+        if queries:
+            logger.warning(
+                "%s: %d ленивых загрузок связей при сериализации, первая: %s", name, len(queries), queries[0]
+            )
+
+        return data
+
+    return watched
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create view mixins
+class RelatedQuerysetMixin:
+    """
+    Mixin for views loading the relations their serializer reads along with the objects
+
+    The select_related and prefetch_related lookups are derived from the field tree of the serializer class,
+    with DEBUG a warning is logged when serialization still loads a relation lazily
+    """
+
+    def filter_queryset(self, queryset: QuerySet) -> QuerySet:
+        """
+        Returns the filtered queryset with the relations of the serializer,
+        views keep their own get_queryset and every object and list lookup passes here
+        """
+        queryset = super().filter_queryset(queryset)  # type: ignore
+        serializer_class: Type[serializers.BaseSerializer] = self.get_serializer_class()  # type: ignore
+        if getattr(getattr(serializer_class, "Meta", None), "model", None) is not queryset.model:
+            return queryset
+
+        select, prefetch = plan_related(serializer_class)
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+
+        return queryset
+
+    def get_serializer(self, *args, **kwargs) -> serializers.BaseSerializer:
+        """Returns the serializer of the view, watching its lazy loads with DEBUG"""
+        serializer: serializers.BaseSerializer = super().get_serializer(*args, **kwargs)  # type: ignore
+        if settings.DEBUG:
+            serializer.to_representation = watch_lazy_loads(  # type: ignore
+                serializer.to_representation, type(self).__name__
+            )
+
+        return serializer
@@ -0,0 +1,133 @@
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from goals.models.board import BoardParticipant
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Cache settings
+ROLE_CACHE_KEY: str = "goals:board_roles:{user_id}:{version}"
+ROLE_VERSION_KEY: str = "goals:board_roles_version:{user_id}"
+
+# Roles allowed to edit categories, goals and comments of a board
+EDITOR_ROLES: tuple = (BoardParticipant.Role.owner, BoardParticipant.Role.moderator)
+
+_stats: Counter = Counter()
+_stats_lock = threading.Lock()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create role resolution functions
+def _count(event: str) -> None:
+    """Increments a counter of the role cache"""
+    with _stats_lock:
+        _stats[event] += 1
+
+
+def bump_versions(keys: Iterable[str]) -> None:
+    """Increments the cached versions, missing versions start from the current time"""
+    for key in keys:
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns() // 1000, None)
+
+
+def get_version(key: str) -> int:
+    """Returns a cached version, a missing version is created"""
+    version: Optional[int] = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns() // 1000, None)
+        version = cache.get(key)
+
+    return version
+
+
+def get_board_roles(user_id: int) -> Dict[int, int]:
+    """
+    Returns a map of board_id to role for every board the user participates in
+
+    The map is read from the cache and loaded with a single query on a miss.
+    It is stored under the roles version of the user read before the query,
+    so a map read before a participant change commits is never stored under the version after it
+
+    Args:
+        user_id: ID of the user
+
+    Returns:
+        Dictionary with board ids as keys and roles as values
+    """
+    key: str = ROLE_CACHE_KEY.format(
+        user_id=user_id, version=get_version(ROLE_VERSION_KEY.format(user_id=user_id))
+    )
+    roles: Optional[Dict[int, int]] = cache.get(key)
+
+    if roles is not None:
+        _count("hits")
+        return roles
+
+    _count("misses")
+    roles = dict(
+        BoardParticipant.objects.filter(user_id=user_id).values_list("board_id", "role")
+    )
+    cache.set(key, roles, settings.BOARD_ROLE_CACHE_TIMEOUT)
+
+    return roles
+
+
+def get_board_role(user, board_id: int) -> Optional[int]:
+    """
+    Returns the role of the user on the board
+
+    Args:
+        user: User instance, may be anonymous
+        board_id: ID of the board
+
+    Returns:
+        Role of the user or None if the user is not a participant of the board
+    """
+    if not user.is_authenticated:
+        return None
+
+    return get_board_roles(user.id).get(board_id)
+
+
+def invalidate_board_roles(user_ids: Iterable[int]) -> None:
+    """
+    Increments the roles versions of the users, making their cached roles obsolete
+
+    The versions are bumped right away and once more after the transaction commits,
+    so roles a concurrent request reads before the commit are cached under an obsolete version
+
+    Args:
+        user_ids: IDs of the users whose participations changed
+    """
+    keys: list = [ROLE_VERSION_KEY.format(user_id=user_id) for user_id in set(user_ids)]
+    if not keys:
+        return
+
+    bump_versions(keys)
+    transaction.on_commit(lambda: bump_versions(keys))
+
+
+def get_role_cache_stats() -> Dict[str, float]:
+    """
+    Returns hit and miss counters of the role cache of the current process
+
+    Returns:
+        Dictionary with hits, misses and hit rate
+    """
+    with _stats_lock:
+        hits: int = _stats["hits"]
+        misses: int = _stats["misses"]
+
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+    }
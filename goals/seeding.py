@@ -0,0 +1,298 @@
+import datetime
+import random
+import time
+from array import array
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Type
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection
+from django.db.models import Model
+from django.utils import timezone
+
+from core.models import User
+from goals.models.board import Board, BoardParticipant
+from goals.models.goal import Goal
+from goals.models.goal_category import GoalCategory
+from goals.models.goal_comment import GoalComment
+from goals.models.mixins import SEARCH_CONFIG
+from goals.stats import record_goals_created
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Seed settings
+WORDS: tuple = (
+    "отчет", "встреча", "релиз", "бюджет", "ремонт", "поездка", "спорт", "книга",
+    "курс", "проект", "клиент", "договор", "отпуск", "покупка", "доклад", "план",
+)
+STATUS_WEIGHTS: tuple = (30, 20, 40, 10)
+PRIORITY_WEIGHTS: tuple = (20, 40, 30, 10)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create helpers
+def chunked(objects: Iterable, size: int) -> Iterator[list]:
+    """Yields lists of at most 'size' objects"""
+    iterator: Iterator = iter(objects)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def distribute(total: int, weights: List[float], generator: random.Random, minimum: int = 0) -> List[int]:
+    """
+    Splits a total between the weights, every share gets at least the minimum
+
+    The rest of the shares rounded down is drawn by the weights
+    """
+    rest: int = max(total - minimum * len(weights), 0)
+    scale: float = rest / sum(weights)
+    shares: List[int] = [int(weight * scale) for weight in weights]
+    for index in generator.choices(range(len(weights)), weights=weights, k=rest - sum(shares)):
+        shares[index] += 1
+
+    return [minimum + share for share in shares]
+
+
+def fill_search_vectors(model: Type[Model], first_id: int, last_id: int) -> None:
+    """Builds the search vectors of the created rows of a model with a single UPDATE"""
+    if connection.vendor != "postgresql" or first_id > last_id:
+        return
+
+    search_vector: str = " || ".join(
+        f"setweight(to_tsvector(%s::regconfig, COALESCE({field}, '')), %s)" for field, _ in model.search_weights
+    )
+    params: list = [param for _, weight in model.search_weights for param in (SEARCH_CONFIG, weight)]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {model._meta.db_table} SET search_vector = {search_vector} WHERE id BETWEEN %s AND %s",
+            [*params, first_id, last_id],
+        )
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create a seeder
+class DatasetSeeder:
+    """
+    Creator of synthetic datasets of users, boards, categories, goals and comments,
+    shared by the seed command and the API benchmark so both measure the same kind of data
+
+    Rows are inserted by chunked bulk INSERTs. Board sizes follow a Pareto distribution,
+    so a few boards get most of the participants, categories and goals. Creation times are spread
+    over the last days in the order of the rows, search vectors are built by one UPDATE per model
+    and goals are added to the statistics
+    """
+
+    def __init__(
+        self, seed: int, days: int = 365, chunk_size: int = 5000, report: Optional[Callable[[str], None]] = None
+    ) -> None:
+        self.generator = random.Random(seed)
+        self.chunk_size: int = chunk_size
+        self.now: datetime.datetime = timezone.now()
+        self.span: datetime.timedelta = datetime.timedelta(days=days)
+        self.report: Optional[Callable[[str], None]] = report
+
+    def moment(self, position: int, total: int) -> datetime.datetime:
+        """Returns the creation time of the row number 'position' of 'total' rows"""
+        return self.now - self.span + self.span * position / total
+
+    def touched(self, created: datetime.datetime) -> datetime.datetime:
+        """Returns a random update time after the creation time"""
+        return created + (self.now - created) * self.generator.random() ** 3
+
+    def insert(self, model: Type[Model], objects: Iterable[Model]) -> array:
+        """Inserts the objects in chunks and returns their ids"""
+        started: float = time.perf_counter()
+        ids: array = array("q")
+        for chunk in chunked(objects, self.chunk_size):
+            model.objects.bulk_create(chunk, batch_size=self.chunk_size)
+            ids.extend(instance.id for instance in chunk)
+            if model is Goal:
+                # Bulk INSERT skips the signals keeping the statistics
+                record_goals_created(chunk)
+
+        if ids and hasattr(model, "search_weights"):
+            fill_search_vectors(model, ids[0], ids[-1])
+        if self.report is not None:
+            self.report(f"{model._meta.verbose_name_plural}: {len(ids)} за {time.perf_counter() - started:.1f} с")
+
+        return ids
+
+    def seed(
+        self,
+        users: int,
+        boards: int,
+        participants: int,
+        categories: int,
+        goals: int,
+        comments: int,
+        prefix: str,
+        password: str,
+        skew: Optional[float] = 1.2,
+        single_owner: bool = False,
+    ) -> Dict[str, array]:
+        """
+        Creates the rows of every model
+
+        Args:
+            users: Number of users
+            boards: Number of boards
+            participants: Participants besides the owners
+            categories: Number of categories, at least one per board
+            goals: Number of goals
+            comments: Number of comments
+            prefix: Prefix of the usernames
+            password: Password of every user
+            skew: Pareto shape of board sizes, lower is skewer, None makes the boards the same size
+            single_owner: Whether the first user owns every board instead of a random one
+
+        Returns:
+            Ids of the created rows by model
+        """
+        generator: random.Random = self.generator
+        # The password is hashed once for all users
+        hashed_password: str = make_password(password)
+
+        user_ids: array = self.insert(
+            User,
+            (
+                User(
+                    username=f"{prefix}_{number}",
+                    password=hashed_password,
+                    email=f"{prefix}_{number}@example.com",
+                    date_joined=self.moment(number, users),
+                )
+                for number in range(users)
+            ),
+        )
+
+        weights: List[float] = [generator.paretovariate(skew) if skew else 1.0 for _ in range(boards)]
+        owners: array = array(
+            "q", (user_ids[0 if single_owner else generator.randrange(users)] for _ in range(boards))
+        )
+        # Flags of the deleted boards and categories, categories of deleted boards are deleted
+        # and goals of deleted categories are archived, the way the API deletes them
+        deleted_boards: bytearray = bytearray(boards)
+        deleted_categories: bytearray = bytearray(categories)
+
+        def build_boards() -> Iterator[Board]:
+            """Yields the boards, a small part of them is deleted"""
+            for number in range(boards):
+                created: datetime.datetime = self.moment(number, boards)
+                deleted_boards[number] = generator.random() < 0.02
+                yield Board(
+                    title=f"Доска {generator.choice(WORDS)} {number}",
+                    is_deleted=deleted_boards[number],
+                    created=created,
+                    updated=self.touched(created),
+                )
+
+        board_ids: array = self.insert(Board, build_boards())
+
+        extras: List[int] = [min(share, users - 1) for share in distribute(participants, weights, generator)]
+
+        def build_participants() -> Iterator[BoardParticipant]:
+            """Yields the owner and the other participants of every board"""
+            for number, board_id in enumerate(board_ids):
+                created: datetime.datetime = self.moment(number, boards)
+                yield BoardParticipant(
+                    board_id=board_id,
+                    user_id=owners[number],
+                    role=BoardParticipant.Role.owner,
+                    created=created,
+                    updated=created,
+                )
+                others: List[int] = [
+                    user_ids[index]
+                    for index in generator.sample(range(users), min(extras[number] + 1, users))
+                    if user_ids[index] != owners[number]
+                ]
+                for user_id in others[:extras[number]]:
+                    moderator: bool = generator.random() < 0.3
+                    yield BoardParticipant(
+                        board_id=board_id,
+                        user_id=user_id,
+                        role=BoardParticipant.Role.moderator if moderator else BoardParticipant.Role.viewer,
+                        created=created,
+                        updated=self.touched(created),
+                    )
+
+        participant_ids: array = self.insert(BoardParticipant, build_participants())
+
+        category_counts: List[int] = distribute(categories, weights, generator, minimum=1)
+        # Categories of the board number 'n' are category_ids[offsets[n]:offsets[n] + category_counts[n]]
+        offsets: List[int] = [0] * boards
+        for number in range(1, boards):
+            offsets[number] = offsets[number - 1] + category_counts[number - 1]
+
+        def build_categories() -> Iterator[GoalCategory]:
+            """Yields the categories of every board"""
+            position: int = 0
+            for number, board_id in enumerate(board_ids):
+                for _ in range(category_counts[number]):
+                    created: datetime.datetime = self.moment(position, categories)
+                    deleted_categories[position] = deleted_boards[number] or generator.random() < 0.02
+                    yield GoalCategory(
+                        board_id=board_id,
+                        user_id=owners[number],
+                        title=f"{generator.choice(WORDS).capitalize()} {position}",
+                        is_deleted=deleted_categories[position],
+                        created=created,
+                        updated=self.touched(created),
+                    )
+                    position += 1
+
+        category_ids: array = self.insert(GoalCategory, build_categories())
+
+        # Boards of the goals in the order of creation
+        goal_boards: array = array("l")
+        for number, share in enumerate(distribute(goals, weights, generator)):
+            goal_boards.extend([number] * share)
+        generator.shuffle(goal_boards)
+
+        def build_goals() -> Iterator[Goal]:
+            """Yields the goals in random categories of their boards, goals of deleted categories are archived"""
+            statuses = generator.choices(Goal.Status.values, weights=STATUS_WEIGHTS, k=goals)
+            priorities = generator.choices(Goal.Priority.values, weights=PRIORITY_WEIGHTS, k=goals)
+            for position, number in enumerate(goal_boards):
+                created: datetime.datetime = self.moment(position, goals)
+                category: int = offsets[number] + generator.randrange(category_counts[number])
+                yield Goal(
+                    board_id=board_ids[number],
+                    category_id=category_ids[category],
+                    user_id=owners[number],
+                    title=f"{generator.choice(WORDS).capitalize()} {generator.choice(WORDS)} {position}",
+                    description=f"Описание: {generator.choice(WORDS)}, {generator.choice(WORDS)}",
+                    status=Goal.Status.archived if deleted_categories[category] else statuses[position],
+                    priority=priorities[position],
+                    due_date=created.date() + datetime.timedelta(days=generator.randint(1, 60)),
+                    created=created,
+                    updated=self.touched(created),
+                )
+
+        goal_ids: array = self.insert(Goal, build_goals())
+
+        def build_comments() -> Iterator[GoalComment]:
+            """Yields the comments of random goals, created after their goals"""
+            for _ in range(comments if goals else 0):
+                position: int = generator.randrange(goals)
+                number: int = goal_boards[position]
+                goal_created: datetime.datetime = self.moment(position, goals)
+                created: datetime.datetime = goal_created + (self.now - goal_created) * generator.random()
+                yield GoalComment(
+                    goal_id=goal_ids[position],
+                    board_id=board_ids[number],
+                    user_id=owners[number],
+                    text=f"Комментарий про {generator.choice(WORDS)}",
+                    created=created,
+                    updated=created,
+                )
+
+        comment_ids: array = self.insert(GoalComment, build_comments())
+
+        return {
+            "users": user_ids,
+            "boards": board_ids,
+            "participants": participant_ids,
+            "categories": category_ids,
+            "goals": goal_ids,
+            "comments": comment_ids,
+        }
@@ -1,39 +1,135 @@
-from typing import Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from django.db import transaction
+from django.db.models import Prefetch, prefetch_related_objects
+from django.utils import timezone
+from django.utils.encoding import smart_str
 from rest_framework import serializers
 
 from core.models import User
+from core.timing import TimedSerializerMixin
+from goals.events import publish_events
+from goals.list_cache import bump_board_versions
 from goals.models.board import Board, BoardParticipant
+from goals.related import batched_load
+from goals.roles import invalidate_board_roles
+from goals.sync import delete_participants
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Context key of the users loaded once for all participants of a request
+PARTICIPANT_USERS: str = "participant_users"
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create helpers
+def load_participant_users(context: dict, usernames: Iterable) -> None:
+    """Loads the users with the usernames into the serializer context with a single query"""
+    if PARTICIPANT_USERS not in context:
+        context[PARTICIPANT_USERS] = User.objects.in_bulk(
+            {username for username in usernames if isinstance(username, str)}, field_name="username"
+        )
+
+
+def apply_participant_changes(
+    board: Board,
+    create: Dict[int, int],
+    update: List[BoardParticipant],
+    delete: List[BoardParticipant],
+) -> None:
+    """
+    Applies a diff of participants with one query per kind of change
+
+    Args:
+        board: Board of the participants
+        create: Roles of the users to add
+        update: Participants with changed roles
+        delete: Participants to remove
+    """
+    now = timezone.now()
+
+    delete_participants(delete)
+
+    if update:
+        for participant in update:
+            participant.updated = now
+        BoardParticipant.objects.bulk_update(update, ("role", "updated"))
+
+    created: List[BoardParticipant] = []
+    if create:
+        created = BoardParticipant.objects.bulk_create(
+            BoardParticipant(board=board, user_id=user_id, role=role, created=now, updated=now)
+            for user_id, role in create.items()
+        )
+
+    # Bulk queries skip the signals of the participants
+    invalidate_board_roles([*create, *(participant.user_id for participant in update)])
+    bump_board_versions((board.id,))
+    publish_events(
+        "participant.changed",
+        ((participant.id, participant.board_id, participant.user_id) for participant in (*created, *update)),
+    )
 
 
 # ----------------------------------------------------------------------------------------------------------------------
 # Create serializers
-class BoardParticipantSerializer(serializers.ModelSerializer):
+class UsernameField(serializers.SlugRelatedField):
+    """Username field resolving users from the map loaded once for all participants when available"""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(slug_field="username", queryset=User.objects.all(), **kwargs)
+
+    def to_internal_value(self, data) -> User:
+        """Returns the user with the username"""
+        users: Optional[Dict[str, User]] = self.context.get(PARTICIPANT_USERS)
+        if users is None:
+            return super().to_internal_value(data)
+
+        user: Optional[User] = users.get(data) if isinstance(data, str) else None
+        if user is None:
+            self.fail("does_not_exist", slug_name=self.slug_field, value=smart_str(data))
+
+        return user
+
+
+# ----------------------------------------------------------------
+class BoardParticipantListSerializer(serializers.ListSerializer):
+    """Serializer for a list of participants, users of all participants are loaded with a single query"""
+
+    def to_internal_value(self, data) -> List[dict]:
+        """Loads the users of the participants before validating them"""
+        if isinstance(data, list):
+            load_participant_users(
+                self.context, (item.get("user") for item in data if isinstance(item, dict))
+            )
+
+        return super().to_internal_value(data)
+
+
+# ----------------------------------------------------------------
+class BoardParticipantSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for participants"""
 
     role = serializers.ChoiceField(
         required=True, choices=BoardParticipant.Role.choices[1:]
     )
-    user = serializers.SlugRelatedField(
-        slug_field="username", queryset=User.objects.all()
-    )
+    user = UsernameField()
 
     class Meta:
         model = BoardParticipant
         fields = "__all__"
         read_only_fields: Tuple[str, ...] = ("id", "created", "updated", "board")
+        list_serializer_class = BoardParticipantListSerializer
 
 
 # ----------------------------------------------------------------
-class BoardCreateSerializer(serializers.ModelSerializer):
+class BoardCreateSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for creating a new board"""
 
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
 
     class Meta:
         model = Board
-        fields = "__all__"
+        exclude: tuple[str, ...] = ("search_vector",)
         read_only_fields: tuple[str, ...] = ("id", "created", "updated")
 
     def create(self, validated_data: dict) -> Board:
@@ -54,7 +150,19 @@ class BoardCreateSerializer(serializers.ModelSerializer):
 
 
 # ----------------------------------------------------------------
-class BoardSerializer(serializers.ModelSerializer):
+class BoardLeanSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    """Serializer for retrieving a board with the counts of participants instead of the list"""
+
+    participants_count = serializers.IntegerField(read_only=True)
+    roles_count = serializers.DictField(child=serializers.IntegerField(), read_only=True)
+
+    class Meta:
+        model = Board
+        exclude: tuple[str, ...] = ("search_vector",)
+
+
+# ----------------------------------------------------------------
+class BoardSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for retrieving/updating/deleting board"""
 
     participants = BoardParticipantSerializer(many=True)
@@ -62,47 +170,160 @@ class BoardSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Board
-        fields = "__all__"
+        exclude: tuple[str, ...] = ("search_vector",)
         read_only_fields: tuple[str, ...] = ("id", "created", "updated")
 
+    def to_representation(self, board: Board) -> dict:
+        """Loads the participants with their users in one query before serializing them"""
+        if "participants" not in getattr(board, "_prefetched_objects_cache", {}):
+            with batched_load():
+                prefetch_related_objects(
+                    [board], Prefetch("participants", queryset=BoardParticipant.objects.select_related("user"))
+                )
+
+        return super().to_representation(board)
+
     def update(self, board: Board, validated_data: dict) -> Board:
         """
-        Update a board with new data and create/delete participants
+        Update a board with new data and replace its participants
+
+        Participants are compared with the new list as sets,
+        so the change takes one query per kind of change however many participants the board has
 
         Returns:
             Updated board
         """
-        # Extract required data from validated_data
-        owner = validated_data.pop("user")
-        new_participants = validated_data.pop("participants")
-        new_by_id: dict = {
-            participant["user"].id: participant for participant in new_participants
-        }
+        owner: User = self.context["request"].user
+        validated_data.pop("user", None)
+        new_participants: Optional[List[dict]] = validated_data.pop("participants", None)
 
-        # Delete participants who are not in new_participants or set a different role
-        old_participants = board.participants.exclude(user=owner)
         with transaction.atomic():
-            for old_participant in old_participants:
-                if old_participant.user_id not in new_by_id:
-                    old_participant.delete()
-
-                elif old_participant.role != new_by_id[old_participant.user_id]["role"]:
-                    old_participant.role = new_by_id[old_participant.user_id]["role"]
-                    old_participant.save()
-
-                    new_by_id.pop(old_participant.user_id)
-
-            # Create new participants
-            for new_participant in new_by_id.values():
-                BoardParticipant.objects.create(
-                    board=board,
-                    user=new_participant["user"],
-                    role=new_participant["role"],
-                )
+            if new_participants is not None:
+                self.replace_participants(board, owner, new_participants)
 
-            # Update board with new data
+            # Update board with new data, saving it anyway marks the participants change
             if "title" in validated_data:
                 board.title = validated_data["title"]
-                board.save()
+            board.save()
+
+        return board
+
+    @staticmethod
+    def replace_participants(board: Board, owner: User, new_participants: List[dict]) -> None:
+        """Replace the participants of a board except the owner with the new list"""
+        new_roles: Dict[int, int] = {
+            participant["user"].id: participant["role"]
+            for participant in new_participants
+            if participant["user"].id != owner.id
+        }
+        old_participants: Dict[int, BoardParticipant] = {
+            participant.user_id: participant for participant in board.participants.exclude(user=owner)
+        }
+
+        update: List[BoardParticipant] = []
+        for user_id, participant in old_participants.items():
+            if user_id in new_roles and participant.role != new_roles[user_id]:
+                participant.role = new_roles[user_id]
+                update.append(participant)
+
+        apply_participant_changes(
+            board,
+            create={
+                user_id: role for user_id, role in new_roles.items() if user_id not in old_participants
+            },
+            update=update,
+            delete=[
+                participant
+                for user_id, participant in old_participants.items()
+                if user_id not in new_roles
+            ],
+        )
+
+
+# ----------------------------------------------------------------
+class BoardParticipantsChangeSerializer(TimedSerializerMixin, serializers.Serializer):
+    """
+    Serializer for adding, removing and changing roles of some participants of a board,
+    users of all operations are loaded with a single query
+    """
+
+    add = BoardParticipantSerializer(many=True, required=False)
+    change_role = BoardParticipantSerializer(many=True, required=False)
+    remove = serializers.ListField(child=UsernameField(), required=False)
+
+    def to_internal_value(self, data) -> dict:
+        """Loads the users of all operations before validating them"""
+        if isinstance(data, dict):
+            usernames: list = [
+                item.get("user")
+                for key in ("add", "change_role")
+                if isinstance(data.get(key), list)
+                for item in data[key]
+                if isinstance(item, dict)
+            ]
+            if isinstance(data.get("remove"), list):
+                usernames += data["remove"]
+            load_participant_users(self.context, usernames)
+
+        return super().to_internal_value(data)
+
+    def validate(self, attrs: dict) -> dict:
+        """Validate if every user is changed once and the owner does not change own role"""
+        users: List[User] = [
+            *(participant["user"] for participant in attrs.get("add", ())),
+            *(participant["user"] for participant in attrs.get("change_role", ())),
+            *attrs.get("remove", ()),
+        ]
+        if not users:
+            raise serializers.ValidationError("Нет изменений участников")
+
+        if len({user.id for user in users}) != len(users):
+            raise serializers.ValidationError("Пользователь указан несколько раз")
+
+        if any(user.id == self.context["request"].user.id for user in users):
+            raise serializers.ValidationError("Вы не можете изменить собственную роль")
+
+        return attrs
+
+    def update(self, board: Board, validated_data: dict) -> Board:
+        """
+        Apply the changes of participants with a single lookup of the current ones
+
+        Returns:
+            Updated board
+        """
+        add: Dict[int, int] = {item["user"].id: item["role"] for item in validated_data.get("add", ())}
+        change: Dict[int, int] = {
+            item["user"].id: item["role"] for item in validated_data.get("change_role", ())
+        }
+        remove: set = {user.id for user in validated_data.get("remove", ())}
+
+        current: Dict[int, BoardParticipant] = {
+            participant.user_id: participant
+            for participant in board.participants.filter(user_id__in=[*add, *change, *remove])
+        }
+
+        errors: dict = {}
+        if current.keys() & add.keys():
+            errors["add"] = ["Пользователь уже является участником"]
+        if change.keys() - current.keys():
+            errors["change_role"] = ["Пользователь не является участником"]
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        update: List[BoardParticipant] = []
+        for user_id, role in change.items():
+            if current[user_id].role != role:
+                current[user_id].role = role
+                update.append(current[user_id])
+
+        with transaction.atomic():
+            apply_participant_changes(
+                board,
+                create=add,
+                update=update,
+                delete=[current[user_id] for user_id in remove if user_id in current],
+            )
+            board.save(update_fields=("updated",))
 
         return board
@@ -3,20 +3,22 @@ from typing import Tuple
 from rest_framework import serializers
 
 from core.serializers import UserRetrieveUpdateSerializer
-from goals.models.board import BoardParticipant, Board
+from core.timing import TimedSerializerMixin
+from goals.models.board import Board
 from goals.models.goal_category import GoalCategory
+from goals.roles import EDITOR_ROLES, get_board_role
 
 
 # ----------------------------------------------------------------------------------------------------------------------
 # Create serializers
-class GoalCategoryCreateSerializer(serializers.ModelSerializer):
+class GoalCategoryCreateSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for creating a new category"""
 
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
 
     class Meta:
         model = GoalCategory
-        fields = "__all__"
+        exclude: Tuple[str, ...] = ("search_vector",)
         read_only_fields: Tuple[str, ...] = ("id", "user", "created", "updated")
 
     def validate_board(self, board: Board) -> Board:
@@ -24,18 +26,14 @@ class GoalCategoryCreateSerializer(serializers.ModelSerializer):
         if board.is_deleted:
             raise serializers.ValidationError("Доска удалена")
 
-        if not BoardParticipant.objects.filter(
-            board=board,
-            user=self.context["request"].user,
-            role__in=[BoardParticipant.Role.owner, BoardParticipant.Role.moderator],
-        ).exists():
+        if get_board_role(self.context["request"].user, board.id) not in EDITOR_ROLES:
             raise serializers.ValidationError("Вы не можете создавать категории")
 
         return board
 
 
 # ----------------------------------------------------------------
-class GoalCategorySerializer(serializers.ModelSerializer):
+class GoalCategorySerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for retrieving/updating/deleting category"""
 
     user = UserRetrieveUpdateSerializer(read_only=True)
@@ -43,7 +41,7 @@ class GoalCategorySerializer(serializers.ModelSerializer):
 
     class Meta:
         model = GoalCategory
-        fields = "__all__"
+        exclude: Tuple[str, ...] = ("search_vector",)
         read_only_fields: Tuple[str, ...] = (
             "id",
             "user",
@@ -3,21 +3,23 @@ from typing import Tuple
 from rest_framework import serializers
 
 from core.serializers import UserRetrieveUpdateSerializer
-from goals.models.board import BoardParticipant
+from core.timing import TimedSerializerMixin
+from goals.bulk import PrefetchedPrimaryKeyRelatedField
 from goals.models.goal import Goal
 from goals.models.goal_comment import GoalComment
+from goals.roles import EDITOR_ROLES, get_board_role
 
 
 # ----------------------------------------------------------------------------------------------------------------------
 # Create serializers
-class GoalCommentCreateSerializer(serializers.ModelSerializer):
+class GoalCommentCreateSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for creating a new comment"""
 
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
 
     class Meta:
         model = GoalComment
-        fields = "__all__"
+        exclude: Tuple[str, ...] = ("board", "search_vector")
         read_only_fields: Tuple[str, ...] = ("id", "user", "created", "updated")
 
     def validate_goal(self, goal: Goal) -> Goal:
@@ -25,18 +27,14 @@ class GoalCommentCreateSerializer(serializers.ModelSerializer):
         if goal.status == Goal.Status.archived:
             raise serializers.ValidationError("Цель удалена")
 
-        if not BoardParticipant.objects.filter(
-            board=goal.category.board,
-            user=self.context["request"].user,
-            role__in=[BoardParticipant.Role.owner, BoardParticipant.Role.moderator],
-        ).exists():
+        if get_board_role(self.context["request"].user, goal.board_id) not in EDITOR_ROLES:
             raise serializers.ValidationError("Вы не можете оставлять комментарии")
 
         return goal
 
 
 # ----------------------------------------------------------------
-class GoalCommentSerializer(serializers.ModelSerializer):
+class GoalCommentSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for retrieving/updating/deleting comment"""
 
     user = UserRetrieveUpdateSerializer(read_only=True)
@@ -44,5 +42,12 @@ class GoalCommentSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = GoalComment
-        fields = "__all__"
+        exclude: Tuple[str, ...] = ("board", "search_vector")
         read_only_fields: Tuple[str, ...] = ("id", "user", "created", "updated", "goal")
+
+
+# ----------------------------------------------------------------
+class GoalCommentBulkCreateSerializer(GoalCommentCreateSerializer):
+    """Serializer for a comment of a bulk create request, goals are prefetched by the view"""
+
+    goal = PrefetchedPrimaryKeyRelatedField(queryset=Goal.objects.all())
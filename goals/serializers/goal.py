@@ -3,21 +3,23 @@ from typing import Tuple
 from rest_framework import serializers
 
 from core.serializers import UserRetrieveUpdateSerializer
-from goals.models.board import BoardParticipant
+from core.timing import TimedSerializerMixin
+from goals.bulk import BulkIdsSerializer, PrefetchedPrimaryKeyRelatedField
 from goals.models.goal import Goal
 from goals.models.goal_category import GoalCategory
+from goals.roles import EDITOR_ROLES, get_board_role
 
 
 # ----------------------------------------------------------------------------------------------------------------------
 # Create serializers
-class GoalCreateSerializer(serializers.ModelSerializer):
+class GoalCreateSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for creating a new goal"""
 
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
 
     class Meta:
         model = Goal
-        fields = "__all__"
+        exclude: Tuple[str, ...] = ("board", "search_vector")
         read_only_fields: Tuple[str, ...] = ("id", "user", "created", "updated")
 
     def validate_category(self, category: GoalCategory) -> GoalCategory:
@@ -25,18 +27,14 @@ class GoalCreateSerializer(serializers.ModelSerializer):
         if category.is_deleted:
             raise serializers.ValidationError("Категория удалена")
 
-        if not BoardParticipant.objects.filter(
-            board=category.board,
-            user=self.context["request"].user,
-            role__in=[BoardParticipant.Role.owner, BoardParticipant.Role.moderator],
-        ).exists():
+        if get_board_role(self.context["request"].user, category.board_id) not in EDITOR_ROLES:
             raise serializers.ValidationError("Вы не можете создавать цели")
 
         return category
 
 
 # ----------------------------------------------------------------
-class GoalSerializer(serializers.ModelSerializer):
+class GoalSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for retrieving/updating/deleting goal"""
 
     user = UserRetrieveUpdateSerializer(read_only=True)
@@ -44,5 +42,81 @@ class GoalSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Goal
-        fields = "__all__"
+        exclude: Tuple[str, ...] = ("board", "search_vector")
         read_only_fields: Tuple[str, ...] = ("id", "user", "created", "updated")
+
+    def validate_category(self, category: GoalCategory) -> GoalCategory:
+        """Validate if the goal is moved to a category that is not deleted and editable by the user"""
+        if self.instance is not None and category.id == self.instance.category_id:
+            return category
+
+        if category.is_deleted:
+            raise serializers.ValidationError("Категория удалена")
+
+        if get_board_role(self.context["request"].user, category.board_id) not in EDITOR_ROLES:
+            raise serializers.ValidationError("Вы не можете перемещать цели в эту категорию")
+
+        return category
+
+
+# ----------------------------------------------------------------
+class GoalBulkCreateSerializer(GoalCreateSerializer):
+    """Serializer for a goal of a bulk create request, categories are prefetched by the view"""
+
+    category = PrefetchedPrimaryKeyRelatedField(queryset=GoalCategory.objects.all())
+
+
+# ----------------------------------------------------------------
+class GoalBulkUpdateSerializer(BulkIdsSerializer):
+    """Serializer for a bulk change of the status and priority of goals"""
+
+    status = serializers.ChoiceField(
+        choices=[choice for choice in Goal.Status.choices if choice[0] != Goal.Status.archived],
+        required=False,
+    )
+    priority = serializers.ChoiceField(choices=Goal.Priority.choices, required=False)
+
+    def validate(self, attrs: dict) -> dict:
+        """Validate if there is anything to change"""
+        if "status" not in attrs and "priority" not in attrs:
+            raise serializers.ValidationError("Укажите статус или приоритет")
+
+        return attrs
+
+
+# ----------------------------------------------------------------
+class GoalImportSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    """
+    Serializer for a row of an imported CSV file, categories are prefetched by the importer
+    and access to every category is checked once for the whole file
+    """
+
+    category = PrefetchedPrimaryKeyRelatedField(queryset=GoalCategory.objects.all())
+
+    class Meta:
+        model = Goal
+        fields: Tuple[str, ...] = ("category", "title", "description", "status", "priority", "due_date")
+        extra_kwargs: dict = {"due_date": {"required": True}}
+
+    def validate_category(self, category: GoalCategory) -> GoalCategory:
+        """Validate if the category is not deleted and the user has permissions to create goals in it"""
+        checked: dict = self.context.setdefault("checked_categories", {})
+
+        if category.id not in checked:
+            checked[category.id] = None
+            if category.is_deleted:
+                checked[category.id] = "Категория удалена"
+            elif get_board_role(self.context["user"], category.board_id) not in EDITOR_ROLES:
+                checked[category.id] = "Вы не можете создавать цели"
+
+        if checked[category.id]:
+            raise serializers.ValidationError(checked[category.id])
+
+        return category
+
+
+# ----------------------------------------------------------------
+class GoalImportFileSerializer(TimedSerializerMixin, serializers.Serializer):
+    """Serializer for an uploaded CSV file with goals"""
+
+    file = serializers.FileField()
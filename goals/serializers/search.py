@@ -0,0 +1,16 @@
+from rest_framework import serializers
+
+from core.timing import TimedSerializerMixin
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create serializers
+class SearchResultSerializer(TimedSerializerMixin, serializers.Serializer):
+    """Serializer for a result of the global search"""
+
+    type = serializers.CharField(source="search_type", read_only=True)
+    id = serializers.IntegerField(read_only=True)
+    board = serializers.IntegerField(source="search_board", read_only=True)
+    goal = serializers.IntegerField(source="search_goal", read_only=True, allow_null=True)
+    title = serializers.CharField(source="search_title", read_only=True)
+    rank = serializers.FloatField(source="search_rank", read_only=True)
@@ -0,0 +1,93 @@
+from typing import Optional
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.models import User
+from core.serializers import UserRetrieveUpdateSerializer
+from goals.events import publish_events
+from goals.list_cache import bump_board_versions
+from goals.models.board import Board, BoardParticipant
+from goals.models.goal import Goal
+from goals.models.goal_category import GoalCategory
+from goals.models.goal_comment import GoalComment
+from goals.roles import invalidate_board_roles
+from goals.stats import get_stat_key, record_goal_change
+
+# Fields of the users nested in the cached lists
+USER_LIST_FIELDS: frozenset = frozenset(UserRetrieveUpdateSerializer.Meta.fields)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create receivers
+@receiver(post_save, sender=BoardParticipant)
+@receiver(post_delete, sender=BoardParticipant)
+def invalidate_participant_roles(sender, instance: BoardParticipant, **kwargs) -> None:
+    """Drops the cached board roles of a participant that was created, updated or deleted"""
+    invalidate_board_roles((instance.user_id,))
+    bump_board_versions((instance.board_id,))
+
+
+@receiver(post_save, sender=Board)
+@receiver(post_delete, sender=Board)
+def expire_board_lists(sender, instance: Board, **kwargs) -> None:
+    """Expires cached lists of a board that was created, updated or deleted"""
+    bump_board_versions((instance.id,))
+
+
+@receiver(post_save, sender=GoalCategory)
+@receiver(post_delete, sender=GoalCategory)
+@receiver(post_save, sender=Goal)
+@receiver(post_delete, sender=Goal)
+def expire_board_object_lists(sender, instance, **kwargs) -> None:
+    """Expires cached lists of the board of a category or a goal that was created, updated or deleted"""
+    bump_board_versions((instance.board_id,))
+
+
+@receiver(post_save, sender=User)
+def expire_user_lists(sender, instance: User, created: bool, update_fields: Optional[frozenset], **kwargs) -> None:
+    """
+    Expires cached lists of the boards showing a user whose profile was updated,
+    saves of other fields, like the last login, keep the lists
+    """
+    if created or (update_fields is not None and not USER_LIST_FIELDS & update_fields):
+        return
+
+    bump_board_versions(
+        BoardParticipant.objects.filter(user=instance)
+        .values_list("board_id", flat=True)
+        .union(
+            GoalCategory.objects.filter(user=instance).values_list("board_id", flat=True),
+            Goal.objects.filter(user=instance).values_list("board_id", flat=True),
+        )
+    )
+
+
+@receiver(post_delete, sender=Goal)
+def remove_goal_stats(sender, instance: Goal, **kwargs) -> None:
+    """Removes a deleted goal from the statistics in the transaction of the delete"""
+    record_goal_change(get_stat_key(instance), None)
+
+
+@receiver(post_save, sender=Goal)
+def publish_goal_event(sender, instance: Goal, created: bool, **kwargs) -> None:
+    """Publishes an event of a goal that was created, updated or archived"""
+    if created:
+        event_type: str = "goal.created"
+    elif instance.status == Goal.Status.archived:
+        event_type = "goal.archived"
+    else:
+        event_type = "goal.updated"
+    publish_events(event_type, ((instance.id, instance.board_id),))
+
+
+@receiver(post_save, sender=GoalComment)
+def publish_comment_event(sender, instance: GoalComment, created: bool, **kwargs) -> None:
+    """Publishes an event of a comment that was added or updated"""
+    publish_events("comment.created" if created else "comment.updated", ((instance.id, instance.board_id),))
+
+
+@receiver(post_save, sender=BoardParticipant)
+def publish_participant_event(sender, instance: BoardParticipant, **kwargs) -> None:
+    """Publishes an event of a participant that was added or changed, the stream of its user follows the board"""
+    publish_events("participant.changed", ((instance.id, instance.board_id, instance.user_id),))
@@ -0,0 +1,237 @@
+from collections import Counter
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from django.db import connection, transaction
+from django.db.models import Count, F, Model, QuerySet
+
+from goals.events import publish_events
+from goals.models.goal_stat import GoalStat
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Statistics settings
+STAT_FIELDS: Tuple[str, ...] = ("board", "category", "status", "priority")
+STAT_COLUMNS: Tuple[str, ...] = ("board_id", "category_id", "status", "priority")
+
+StatKey = Tuple[int, int, int, int]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create helpers
+def get_stat_key(goal: Model) -> StatKey:
+    """Returns the board, category, status and priority of a goal"""
+    return tuple(getattr(goal, column) for column in STAT_COLUMNS)  # type: ignore
+
+
+def get_saved_stat_key(goal: Model, previous: Optional[StatKey], update_fields: Optional[Iterable[str]]) -> StatKey:
+    """
+    Returns the key of a goal after a save, fields left out of 'update_fields' keep their previous values
+
+    Args:
+        goal: Saved goal
+        previous: Key of the goal before the save or None for a new goal
+        update_fields: Fields of the save or None if all fields were saved
+    """
+    current: StatKey = get_stat_key(goal)
+    if previous is None or update_fields is None:
+        return current
+
+    saved: set = {field[:-3] if field.endswith("_id") else field for field in update_fields}
+    if "category" in saved:
+        saved.add("board")
+
+    return tuple(  # type: ignore
+        value if field in saved else old for field, value, old in zip(STAT_FIELDS, current, previous)
+    )
+
+
+def lock_stat_key(goal: Model) -> Optional[StatKey]:
+    """Returns the stored key of a goal and locks its row until the end of the transaction"""
+    return type(goal).objects.select_for_update().filter(pk=goal.pk).values_list(*STAT_COLUMNS).first()
+
+
+def apply_goal_stats(deltas: Mapping[StatKey, int]) -> None:
+    """
+    Adds the changes of the numbers of goals to the statistics
+
+    On PostgreSQL all counters are changed with a single INSERT ... ON CONFLICT,
+    other databases update them one by one
+
+    Args:
+        deltas: Changes of the numbers of goals by their keys
+    """
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    if connection.vendor == "postgresql":
+        table: str = GoalStat._meta.db_table
+        columns: str = ", ".join(STAT_COLUMNS)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}, count) VALUES "
+                + ", ".join(["(%s, %s, %s, %s, %s)"] * len(deltas))
+                + f" ON CONFLICT ({columns}) DO UPDATE SET count = {table}.count + EXCLUDED.count",
+                [value for key, delta in sorted(deltas.items()) for value in (*key, delta)],
+            )
+        return
+
+    for key, delta in sorted(deltas.items()):
+        fields: dict = dict(zip(STAT_COLUMNS, key))
+        if not GoalStat.objects.filter(**fields).update(count=F("count") + delta):
+            GoalStat.objects.create(**fields, count=delta)
+
+
+def record_goal_change(previous: Optional[StatKey], current: Optional[StatKey]) -> None:
+    """Moves a goal between the counters, None stands for a goal that did not exist"""
+    if previous == current:
+        return
+
+    deltas: Counter = Counter()
+    if previous is not None:
+        deltas[previous] -= 1
+    if current is not None:
+        deltas[current] += 1
+
+    apply_goal_stats(deltas)
+
+
+def record_goals_created(goals: Iterable[Model]) -> None:
+    """Adds goals created without the save method to the statistics"""
+    apply_goal_stats(Counter(get_stat_key(goal) for goal in goals))
+
+
+def update_goals(queryset: QuerySet, **changes) -> List[int]:
+    """
+    Updates the goals of a queryset with a single UPDATE, moves them between the counters
+    and publishes their events
+
+    The rows are locked and their keys read before the update,
+    so the statistics stay exact with concurrent writes. Must be called in a transaction
+
+    Args:
+        queryset: Goals to update
+        changes: New values of the fields
+
+    Returns:
+        IDs of the updated goals
+    """
+    rows: list = list(queryset.order_by().select_for_update().values_list("id", *STAT_COLUMNS))
+    if not rows:
+        return []
+
+    ids: List[int] = [row[0] for row in rows]
+    queryset.model.objects.filter(id__in=ids).update(**changes)
+
+    deltas: Counter = Counter()
+    for _, *key in rows:
+        deltas[tuple(key)] -= 1
+        deltas[tuple(changes.get(field, value) for field, value in zip(STAT_FIELDS, key))] += 1
+    apply_goal_stats(deltas)
+    publish_events(
+        "goal.archived" if changes.get("status") == queryset.model.Status.archived else "goal.updated",
+        ((row[0], row[1]) for row in rows),
+    )
+
+    return ids
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create statistics functions
+def get_board_goal_stats(board_id: int, exclude_status: Optional[int] = None) -> dict:
+    """
+    Returns the numbers of goals of a board by status and priority, overall and per category
+
+    Answered from the statistics with a single query, however many goals the board has.
+    Goals of deleted categories are left out, like in the goal lists
+
+    Args:
+        board_id: ID of the board
+        exclude_status: Status of goals left out of the numbers
+
+    Returns:
+        Dictionary with the total, the numbers by status and priority and the same numbers per category
+    """
+    stats = GoalStat.objects.filter(board_id=board_id, category__is_deleted=False, count__gt=0)
+    if exclude_status is not None:
+        stats = stats.exclude(status=exclude_status)
+
+    def empty() -> dict:
+        return {"total": 0, "by_status": {}, "by_priority": {}}
+
+    board: dict = {"board": board_id, **empty(), "categories": {}}
+    for category_id, status, priority, count in stats.values_list("category_id", "status", "priority", "count"):
+        category: dict = board["categories"].setdefault(category_id, {"category": category_id, **empty()})
+        for summary in (board, category):
+            summary["total"] += count
+            summary["by_status"][status] = summary["by_status"].get(status, 0) + count
+            summary["by_priority"][priority] = summary["by_priority"].get(priority, 0) + count
+
+    board["categories"] = sorted(board["categories"].values(), key=lambda category: category["category"])
+
+    return board
+
+
+def count_goal_stats(queryset: QuerySet) -> Counter:
+    """Returns the numbers of goals of a queryset by their keys counted from the goals"""
+    return Counter(
+        {
+            tuple(row[:4]): row[4]
+            for row in queryset.order_by().values_list(*STAT_COLUMNS).annotate(goals=Count("id"))
+        }
+    )
+
+
+def load_goal_stats() -> Counter:
+    """Returns the stored numbers of goals by their keys"""
+    return Counter(
+        {
+            tuple(row[:4]): row[4]
+            for row in GoalStat.objects.exclude(count=0).values_list(*STAT_COLUMNS, "count")
+        }
+    )
+
+
+def verify_goal_stats(queryset: QuerySet) -> Dict[StatKey, Tuple[int, int]]:
+    """
+    Compares the stored statistics with a recount of the goals
+
+    Args:
+        queryset: All goals
+
+    Returns:
+        Stored and counted numbers of the keys that differ
+    """
+    stored: Counter = load_goal_stats()
+    counted: Counter = count_goal_stats(queryset)
+
+    return {
+        key: (stored[key], counted[key])
+        for key in sorted(stored.keys() | counted.keys())
+        if stored[key] != counted[key]
+    }
+
+
+def rebuild_goal_stats(queryset: QuerySet) -> int:
+    """
+    Replaces the statistics with a recount of the goals
+
+    On PostgreSQL writes of the goals wait until the rebuild commits
+
+    Args:
+        queryset: All goals
+
+    Returns:
+        Number of stored keys
+    """
+    with transaction.atomic():
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute(f"LOCK TABLE {queryset.model._meta.db_table} IN SHARE MODE")
+
+        GoalStat.objects.all().delete()
+        stats: List[GoalStat] = GoalStat.objects.bulk_create(
+            GoalStat(**dict(zip(STAT_COLUMNS, key)), count=count)
+            for key, count in count_goal_stats(queryset).items()
+        )
+
+    return len(stats)
@@ -0,0 +1,60 @@
+from typing import Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Model, QuerySet
+from django.utils import timezone
+
+from goals.events import publish_events
+from goals.models.tombstone import Tombstone
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tombstone functions
+def record_tombstones(kind: int, rows: Iterable[Tuple[int, int, Optional[int]]]) -> None:
+    """
+    Records deleted objects with a single INSERT
+
+    Args:
+        kind: Kind of the objects
+        rows: IDs of the objects, of their boards and of the users of deleted participants
+    """
+    now = timezone.now()
+    Tombstone.objects.bulk_create(
+        Tombstone(kind=kind, object_id=object_id, board_id=board_id, user_id=user_id, deleted=now)
+        for object_id, board_id, user_id in rows
+    )
+
+
+def delete_comments(queryset: QuerySet) -> List[int]:
+    """
+    Deletes the comments of a queryset leaving tombstones for syncing clients and publishes their events
+
+    Returns:
+        IDs of the deleted comments
+    """
+    rows: list = list(queryset.order_by().values_list("id", "board_id"))
+    if not rows:
+        return []
+
+    ids: List[int] = [object_id for object_id, _ in rows]
+    with transaction.atomic(savepoint=False):
+        record_tombstones(Tombstone.Kind.comment, ((object_id, board_id, None) for object_id, board_id in rows))
+        queryset.model.objects.filter(id__in=ids).delete()
+        publish_events("comment.deleted", rows)
+
+    return ids
+
+
+def delete_participants(participants: List[Model]) -> None:
+    """
+    Deletes participants leaving tombstones, which also tell their users that the access was revoked,
+    and publishes their events
+    """
+    if not participants:
+        return
+
+    rows: list = [(participant.id, participant.board_id, participant.user_id) for participant in participants]
+    with transaction.atomic(savepoint=False):
+        record_tombstones(Tombstone.Kind.participant, rows)
+        type(participants[0]).objects.filter(id__in=[participant.id for participant in participants]).delete()
+        publish_events("participant.removed", rows)
@@ -2,7 +2,7 @@ from typing import List
 
 from django.urls import path
 
-from goals.views import board, category, goal, comment
+from goals.views import board, category, goal, comment, events, monitoring, search, sync
 
 # ----------------------------------------------------------------------------------------------------------------------
 # Create Goal app urls
@@ -11,6 +11,12 @@ urlpatterns: List = [
     path("board/create", board.BoardCreateView.as_view(), name="board_create"),
     path("board/list", board.BoardListView.as_view(), name="board_list"),
     path("board/<int:pk>", board.BoardView.as_view(), name="board"),
+    path(
+        "board/<int:pk>/participants",
+        board.BoardParticipantsView.as_view(),
+        name="board_participants",
+    ),
+    path("board/<int:pk>/stats", board.BoardStatsView.as_view(), name="board_stats"),
     # Category urls
     path(
         "goal_category/create",
@@ -29,6 +35,11 @@ urlpatterns: List = [
     path("goal/create", goal.GoalCreateView.as_view(), name="goal_create"),
     path("goal/list", goal.GoalListView.as_view(), name="goal_list"),
     path("goal/<int:pk>", goal.GoalView.as_view(), name="goal"),
+    path("goal/export", goal.GoalExportView.as_view(), name="goal_export"),
+    path("goal/import", goal.GoalImportView.as_view(), name="goal_import"),
+    path("goal/bulk_create", goal.GoalBulkCreateView.as_view(), name="goal_bulk_create"),
+    path("goal/bulk_update", goal.GoalBulkUpdateView.as_view(), name="goal_bulk_update"),
+    path("goal/bulk_archive", goal.GoalBulkArchiveView.as_view(), name="goal_bulk_archive"),
     # Comment urls
     path(
         "goal_comment/create",
@@ -39,4 +50,22 @@ urlpatterns: List = [
         "goal_comment/list", comment.GoalCommentListView.as_view(), name="comment_list"
     ),
     path("goal_comment/<int:pk>", comment.GoalCommentView.as_view(), name="comment"),
+    path(
+        "goal_comment/bulk_create",
+        comment.GoalCommentBulkCreateView.as_view(),
+        name="comment_bulk_create",
+    ),
+    path(
+        "goal_comment/bulk_delete",
+        comment.GoalCommentBulkDeleteView.as_view(),
+        name="comment_bulk_delete",
+    ),
+    # Search urls
+    path("search", search.SearchView.as_view(), name="search"),
+    # Sync urls
+    path("sync", sync.SyncView.as_view(), name="sync"),
+    # Event urls
+    path("events", events.EventStreamView.as_view(), name="events"),
+    # Monitoring urls
+    path("cache_stats", monitoring.CacheStatsView.as_view(), name="cache_stats"),
 ]
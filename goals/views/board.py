@@ -1,21 +1,45 @@
 from typing import Any
 
-from django.db.models import QuerySet
+from django.db.models import Count, F, Q, QuerySet
 from django.db.transaction import atomic
-
-from rest_framework.generics import CreateAPIView, ListAPIView, RetrieveUpdateDestroyAPIView
-from rest_framework.pagination import LimitOffsetPagination
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.generics import (
+    CreateAPIView,
+    GenericAPIView,
+    ListAPIView,
+    RetrieveUpdateDestroyAPIView,
+    get_object_or_404,
+)
+from rest_framework.mixins import ListModelMixin
 from rest_framework.permissions import IsAuthenticated
-
-from goals.models.board import Board
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from core.timing import TimedViewMixin
+from goals.compiled import CompiledListMixin
+from goals.conditional import ConditionalListMixin, ConditionalRetrieveMixin
+from goals.list_cache import CachedListMixin
+from goals.models.board import Board, BoardParticipant
 from goals.models.goal import Goal
+from goals.pagination import LimitOffsetKeysetPagination
 from goals.permissions import BoardPermission
-from goals.serializers.board import BoardCreateSerializer, BoardSerializer
+from goals.related import RelatedQuerysetMixin
+from goals.serializers.board import (
+    BoardCreateSerializer,
+    BoardLeanSerializer,
+    BoardParticipantsChangeSerializer,
+    BoardParticipantSerializer,
+    BoardSerializer,
+)
+from goals.stats import get_board_goal_stats, update_goals
 
 
 # ----------------------------------------------------------------------------------------------------------------------
 # Create views
-class BoardCreateView(CreateAPIView):
+class BoardCreateView(TimedViewMixin, CreateAPIView):
     """API endpoint for creating a new board"""
 
     model = Board
@@ -24,12 +48,12 @@ class BoardCreateView(CreateAPIView):
 
 
 # ----------------------------------------------------------------
-class BoardListView(ListAPIView):
+class BoardListView(TimedViewMixin, ConditionalListMixin, CachedListMixin, CompiledListMixin, ListAPIView):
     """API endpoint for retrieving a list of boards"""
 
     serializer_class = BoardCreateSerializer
     permission_classes: tuple = (IsAuthenticated, BoardPermission)
-    pagination_class = LimitOffsetPagination
+    pagination_class = LimitOffsetKeysetPagination
 
     ordering: tuple[str] = ("title",)
 
@@ -39,21 +63,120 @@ class BoardListView(ListAPIView):
 
 
 # ----------------------------------------------------------------
-class BoardView(RetrieveUpdateDestroyAPIView):
-    """API endpoint for retrieving/updating/deleting a board"""
+class BoardView(TimedViewMixin, ConditionalRetrieveMixin, RetrieveUpdateDestroyAPIView):
+    """
+    API endpoint for retrieving/updating/deleting a board
+
+    Retrieving with '?lean=true' returns the counts of participants instead of the list
+    """
 
     serializer_class = BoardSerializer
     permission_classes: tuple = (IsAuthenticated, BoardPermission)
+    lean_query_param: str = "lean"
 
     def get_queryset(self) -> QuerySet[Board]:
-        """Return a queryset of boards the user is a participant of"""
-        return Board.objects.filter(participants__user=self.request.user, is_deleted=False)  # type: ignore
+        """Return a queryset of boards the user is a participant of with the role of the user"""
+        return Board.objects.filter(
+            participants__user=self.request.user, is_deleted=False  # type: ignore
+        ).annotate(user_role=F("participants__role"))
+
+    def get_retrieve_data(self, board: Board) -> Any:
+        """Return a board with the list or with the counts of participants"""
+        if self.request.query_params.get(self.lean_query_param) in ("1", "true"):
+            counts: dict = BoardParticipant.objects.filter(board=board).aggregate(
+                participants_count=Count("id"),
+                **{
+                    role.name: Count("id", filter=Q(role=role))
+                    for role in BoardParticipant.Role  # type: ignore
+                },
+            )
+            board.participants_count = counts.pop("participants_count")
+            board.roles_count = counts
+            return BoardLeanSerializer(board).data
+
+        return super().get_retrieve_data(board)
 
     @atomic()
     def perform_destroy(self, board: Board) -> None:
         """Delete a board with all categories and archive all of its goals"""
+        now = timezone.now()
         board.is_deleted = True
-        board.save(update_fields=("is_deleted",))
-        board.categories.update(is_deleted=True)
-        Goal.objects.filter(category__board=board).update(status=Goal.Status.archived)
+        board.save(update_fields=("is_deleted", "updated"))
+        board.categories.update(is_deleted=True, updated=now)
+        update_goals(board.goals.exclude(status=Goal.Status.archived), status=Goal.Status.archived, updated=now)
         # return board
+
+
+# ----------------------------------------------------------------
+class BoardParticipantsView(TimedViewMixin, RelatedQuerysetMixin, ListModelMixin, GenericAPIView):
+    """
+    API endpoint for retrieving a list of participants of a board searchable by username
+    and for adding, removing and changing roles of some participants
+    """
+
+    permission_classes: tuple = (IsAuthenticated, BoardPermission)
+    pagination_class = LimitOffsetKeysetPagination
+
+    filter_backends: tuple = (OrderingFilter, SearchFilter)
+    ordering_fields: tuple[str, ...] = ("role", "user__username")
+    ordering: tuple[str, ...] = ("role", "user__username")
+    search_fields: tuple[str] = ("user__username",)
+
+    def get_serializer_class(self) -> type:
+        """Return the list serializer for reads and the change serializer for updates"""
+        if self.request.method == "PATCH":
+            return BoardParticipantsChangeSerializer
+
+        return BoardParticipantSerializer
+
+    def get_board(self) -> Board:
+        """Return the board of the url with the role of the user and check the permissions"""
+        board: Board = get_object_or_404(
+            Board.objects.filter(
+                participants__user=self.request.user, is_deleted=False  # type: ignore
+            ).annotate(user_role=F("participants__role")),
+            pk=self.kwargs["pk"],
+        )
+        self.check_object_permissions(self.request, board)
+
+        return board
+
+    def get_queryset(self) -> QuerySet[BoardParticipant]:
+        """Return a queryset of participants of the board"""
+        return BoardParticipant.objects.filter(board=self.board)
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        """Return a page of participants, any participant of the board can see them"""
+        self.board: Board = self.get_board()
+
+        return self.list(request, *args, **kwargs)
+
+    def patch(self, request: Request, *args, **kwargs) -> Response:
+        """Apply the changes of participants, only the owner of the board can change them"""
+        serializer = self.get_serializer(self.get_board(), data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+# ----------------------------------------------------------------
+class BoardStatsView(TimedViewMixin, GenericAPIView):
+    """
+    API endpoint for retrieving the numbers of active goals of a board by status and priority,
+    overall and per category, answered from the goal statistics instead of the goals
+    """
+
+    permission_classes: tuple = (IsAuthenticated, BoardPermission)
+
+    def get_queryset(self) -> QuerySet[Board]:
+        """Return a queryset of boards the user is a participant of with the role of the user"""
+        return Board.objects.filter(
+            participants__user=self.request.user, is_deleted=False  # type: ignore
+        ).annotate(user_role=F("participants__role"))
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        """Return the numbers of goals, any participant of the board can see them"""
+        board: Board = self.get_object()
+
+        return Response(get_board_goal_stats(board.id, exclude_status=Goal.Status.archived))
@@ -1,21 +1,28 @@
-from django.db.models import QuerySet
+from django.db.models import F, QuerySet
 from django.db.transaction import atomic
 from django_filters.rest_framework import DjangoFilterBackend
 
-from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.filters import OrderingFilter
 from rest_framework.generics import CreateAPIView, ListAPIView, RetrieveUpdateDestroyAPIView
-from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.permissions import IsAuthenticated
 
+from core.timing import TimedViewMixin
+from goals.compiled import CompiledListMixin
+from goals.conditional import ConditionalListMixin, ConditionalRetrieveMixin
+from goals.filters import TrigramSearchFilter
+from goals.list_cache import CachedListMixin
 from goals.models.goal import Goal
 from goals.models.goal_category import GoalCategory
+from goals.pagination import LimitOffsetKeysetPagination
 from goals.permissions import GoalCategoryPermission
+from goals.related import RelatedQuerysetMixin
 from goals.serializers.category import GoalCategoryCreateSerializer, GoalCategorySerializer
+from goals.stats import update_goals
 
 
 # ----------------------------------------------------------------------------------------------------------------------
 # Create views
-class GoalCategoryCreateView(CreateAPIView):
+class GoalCategoryCreateView(TimedViewMixin, CreateAPIView):
     """API endpoint for creating a new category"""
 
     model = GoalCategory
@@ -24,14 +31,14 @@ class GoalCategoryCreateView(CreateAPIView):
 
 
 # ----------------------------------------------------------------
-class GoalCategoryListView(ListAPIView):
+class GoalCategoryListView(TimedViewMixin, ConditionalListMixin, CachedListMixin, CompiledListMixin, ListAPIView):
     """API endpoint for retrieving a list of categories"""
 
     serializer_class = GoalCategorySerializer
     permission_classes: tuple = (IsAuthenticated, GoalCategoryPermission)
-    pagination_class = LimitOffsetPagination
+    pagination_class = LimitOffsetKeysetPagination
 
-    filter_backends: tuple = (OrderingFilter, SearchFilter, DjangoFilterBackend)
+    filter_backends: tuple = (OrderingFilter, TrigramSearchFilter, DjangoFilterBackend)
     ordering_fields: tuple[str, ...] = ("title", "created")
     ordering: tuple[str] = ("title",)
     search_fields: tuple[str] = ("title",)
@@ -47,24 +54,26 @@ class GoalCategoryListView(ListAPIView):
 
 
 # ----------------------------------------------------------------
-class GoalCategoryView(RetrieveUpdateDestroyAPIView):
+class GoalCategoryView(TimedViewMixin, RelatedQuerysetMixin, ConditionalRetrieveMixin, RetrieveUpdateDestroyAPIView):
     """API endpoint for retrieving/updating/deleting a category"""
 
     serializer_class = GoalCategorySerializer
     permission_classes: tuple = (IsAuthenticated, GoalCategoryPermission)
 
     def get_queryset(self) -> QuerySet[GoalCategory]:
-        """Return a queryset of categories the user is a participant of"""
-        return GoalCategory.objects.select_related("board").filter(
+        """Return a queryset of categories the user is a participant of with the role of the user"""
+        return GoalCategory.objects.filter(
             board__participants__user=self.request.user,
             board__is_deleted=False,
             is_deleted=False,
-        )
+        ).annotate(user_role=F("board__participants__role"))
 
     @atomic
     def perform_destroy(self, category: GoalCategory) -> None:
         """Delete a category and archive all of its goals"""
         category.is_deleted = True
-        category.save(update_fields=("is_deleted",))
-        category.goals.update(status=Goal.Status.archived)
+        category.save(update_fields=("is_deleted", "updated"))
+        update_goals(
+            category.goals.exclude(status=Goal.Status.archived), status=Goal.Status.archived, updated=category.updated
+        )
         # return category
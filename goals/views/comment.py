@@ -1,20 +1,33 @@
-from django.db.models import QuerySet
+from django.db.models import OuterRef, QuerySet, Subquery
 from django_filters.rest_framework import DjangoFilterBackend
 
 from rest_framework.filters import OrderingFilter
 from rest_framework.generics import CreateAPIView, ListAPIView, RetrieveUpdateDestroyAPIView
-from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
 
-from goals.models.goal import Goal
+from core.timing import TimedViewMixin
+from goals.bulk import BulkChangeAPIView, BulkCreateAPIView
+from goals.compiled import CompiledListMixin
+from goals.conditional import ConditionalListMixin, ConditionalRetrieveMixin
+from goals.models.board import BoardParticipant
+from goals.models.goal import visible_goals
 from goals.models.goal_comment import GoalComment
+from goals.pagination import LimitOffsetKeysetPagination
 from goals.permissions import GoalCommentPermission
-from goals.serializers.comment import GoalCommentCreateSerializer, GoalCommentSerializer
+from goals.related import RelatedQuerysetMixin
+from goals.serializers.comment import (
+    GoalCommentBulkCreateSerializer,
+    GoalCommentCreateSerializer,
+    GoalCommentSerializer,
+)
+from goals.sync import delete_comments
 
 
 # ----------------------------------------------------------------------------------------------------------------------
 # Create views
-class GoalCommentCreateView(CreateAPIView):
+class GoalCommentCreateView(TimedViewMixin, CreateAPIView):
     """API endpoint for creating a new comment"""
 
     model = GoalComment
@@ -23,12 +36,12 @@ class GoalCommentCreateView(CreateAPIView):
 
 
 # ----------------------------------------------------------------
-class GoalCommentListView(ListAPIView):
+class GoalCommentListView(TimedViewMixin, ConditionalListMixin, CompiledListMixin, ListAPIView):
     """API endpoint for retrieving a list of comments"""
 
     serializer_class = GoalCommentSerializer
     permission_classes: tuple = (IsAuthenticated, GoalCommentPermission)
-    pagination_class = LimitOffsetPagination
+    pagination_class = LimitOffsetKeysetPagination
 
     filter_backends: tuple = (OrderingFilter, DjangoFilterBackend)
     ordering_fields: tuple[str, ...] = ("created", "updated")
@@ -37,32 +50,61 @@ class GoalCommentListView(ListAPIView):
 
     def get_queryset(self) -> QuerySet[GoalComment]:
         """Return a queryset of comments the user is a participant of"""
-        return (
-            GoalComment.objects.select_related("goal")
-            .filter(
-                goal__category__board__participants__user=self.request.user,
-                goal__category__board__is_deleted=False,
-                goal__category__is_deleted=False,
-            )
-            .exclude(goal__status=Goal.Status.archived)
+        return GoalComment.objects.filter(
+            visible_goals("goal__"),
+            board_id__in=BoardParticipant.objects.filter(user=self.request.user).values("board_id"),
         )
 
 
 # ----------------------------------------------------------------
-class GoalCommentView(RetrieveUpdateDestroyAPIView):
+class GoalCommentView(TimedViewMixin, RelatedQuerysetMixin, ConditionalRetrieveMixin, RetrieveUpdateDestroyAPIView):
     """API endpoint for retrieving/updating/deleting a comment"""
 
     serializer_class = GoalCommentSerializer
     permission_classes: tuple = (IsAuthenticated, GoalCommentPermission)
 
     def get_queryset(self) -> QuerySet[GoalComment]:
-        """Return a queryset of comments the user is a participant of"""
+        """Return a queryset of comments the user is a participant of with the role of the user"""
         return (
-            GoalComment.objects.select_related("goal")
-            .filter(
-                goal__category__board__participants__user=self.request.user,
-                goal__category__board__is_deleted=False,
-                goal__category__is_deleted=False,
+            GoalComment.objects.annotate(
+                user_role=Subquery(
+                    BoardParticipant.objects.filter(
+                        board_id=OuterRef("board_id"), user=self.request.user
+                    ).values("role")[:1]
+                )
             )
-            .exclude(goal__status=Goal.Status.archived)
+            .filter(visible_goals("goal__"), user_role__isnull=False)
         )
+
+    def perform_destroy(self, comment: GoalComment) -> None:
+        """Delete a comment leaving a tombstone for syncing clients"""
+        delete_comments(GoalComment.objects.filter(id=comment.id))
+
+
+# ----------------------------------------------------------------
+class GoalCommentBulkCreateView(BulkCreateAPIView):
+    """API endpoint for creating a list of comments"""
+
+    serializer_class = GoalCommentBulkCreateSerializer
+    result_serializer_class = GoalCommentSerializer
+    related_field: str = "goal"
+    created_event: str = "comment.created"
+
+
+# ----------------------------------------------------------------
+class GoalCommentBulkDeleteView(BulkChangeAPIView):
+    """API endpoint for deleting a list of comments"""
+
+    result_key: str = "deleted"
+
+    def get_queryset(self) -> QuerySet[GoalComment]:
+        """Return a queryset of comments of visible goals"""
+        return GoalComment.objects.filter(visible_goals("goal__"))
+
+    def change(self, ids: list, validated_data: dict) -> None:
+        """Delete the comments with a single query"""
+        delete_comments(GoalComment.objects.filter(id__in=ids))
+
+    def post(self, request: Request, *args, **kwargs) -> Response:
+        """Delete the comments the user can edit"""
+        return self.bulk_change(request)
@@ -0,0 +1,48 @@
+from django.conf import settings
+from django.db import connection
+from django.http import StreamingHttpResponse
+
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+
+from core.timing import TimedViewMixin
+from goals.events import EventStream, EventStreamRenderer, Subscription, broker
+from goals.models.board import BoardParticipant
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create views
+class EventStreamView(TimedViewMixin, GenericAPIView):
+    """
+    API endpoint streaming Server-Sent Events of goals, comments and participants
+    of the boards the user belongs to
+
+    Events carry the ids of the changed objects and a sync cursor in their id,
+    a resync event asks the client to catch up through the sync endpoint
+    """
+
+    permission_classes: tuple = (IsAuthenticated,)
+    renderer_classes: tuple = (EventStreamRenderer,)
+
+    def get(self, request: Request, *args, **kwargs) -> StreamingHttpResponse:
+        """
+        Stream the events until the client disconnects or the stream times out
+
+        The stream does not use the database, so the connection of the request is closed
+        instead of staying open for the whole stream, unless the request runs in a transaction
+        """
+        subscription: Subscription = broker.subscribe(
+            request.user.id, BoardParticipant.objects.filter(user=request.user).values_list("board_id", flat=True)
+        )
+        if not connection.in_atomic_block:
+            connection.close()
+
+        response = StreamingHttpResponse(
+            EventStream(subscription, settings.EVENTS_HEARTBEAT, settings.EVENTS_STREAM_TIMEOUT),
+            content_type="text/event-stream; charset=utf-8",
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+
+        return response
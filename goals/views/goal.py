@@ -1,21 +1,58 @@
-from django.db.models import QuerySet
+import io
+
+from django.conf import settings
+from django.db.models import OuterRef, QuerySet, Subquery
 from django.db.transaction import atomic
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 
-from rest_framework.filters import OrderingFilter, SearchFilter
-from rest_framework.generics import CreateAPIView, ListAPIView, RetrieveUpdateDestroyAPIView
-from rest_framework.pagination import LimitOffsetPagination
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import OrderingFilter
+from rest_framework.generics import CreateAPIView, GenericAPIView, ListAPIView, RetrieveUpdateDestroyAPIView
+from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
 
-from goals.filters import GoalDateFilter
-from goals.models.goal import Goal
+from core.timing import TimedViewMixin
+from goals.bulk import BulkChangeAPIView, BulkCreateAPIView
+from goals.compiled import CompiledListMixin
+from goals.conditional import ConditionalListMixin, ConditionalRetrieveMixin
+from goals.export import (
+    GOAL_EXPORT_COLUMNS,
+    GOAL_EXPORT_EXPRESSIONS,
+    GOAL_EXPORT_FIELDS,
+    CSVRenderer,
+    ExportRenderer,
+    NDJSONRenderer,
+    accepts_gzip,
+    stream_export,
+)
+from goals.filters import GoalDateFilter, TrigramSearchFilter
+from goals.importer import import_goals
+from goals.list_cache import CachedListMixin
+from goals.models.board import BoardParticipant
+from goals.models.goal import Goal, visible_goals
+from goals.models.goal_comment import GoalComment
+from goals.pagination import LimitOffsetKeysetPagination
 from goals.permissions import GoalPermission
-from goals.serializers.goal import GoalCreateSerializer, GoalSerializer
+from goals.related import RelatedQuerysetMixin
+from goals.serializers.goal import (
+    GoalBulkCreateSerializer,
+    GoalBulkUpdateSerializer,
+    GoalCreateSerializer,
+    GoalImportFileSerializer,
+    GoalSerializer,
+)
+from goals.stats import record_goals_created, update_goals
+from goals.sync import delete_comments
 
 
 # ----------------------------------------------------------------------------------------------------------------------
 # Create views
-class GoalCreateView(CreateAPIView):
+class GoalCreateView(TimedViewMixin, CreateAPIView):
     """API endpoint for creating a new goal"""
 
     model = Goal
@@ -24,56 +61,177 @@ class GoalCreateView(CreateAPIView):
 
 
 # ----------------------------------------------------------------
-class GoalListView(ListAPIView):
-    """API endpoint for retrieving a list of goals"""
+class GoalFilterMixin:
+    """Mixin with the visible goals and the filters shared by the goal list and the export"""
 
-    serializer_class = GoalSerializer
-    permission_classes: tuple = (IsAuthenticated, GoalPermission)
-    pagination_class = LimitOffsetPagination
-
-    filter_backends: tuple = (OrderingFilter, SearchFilter, DjangoFilterBackend)
+    filter_backends: tuple = (OrderingFilter, TrigramSearchFilter, DjangoFilterBackend)
     ordering_fields: tuple[str, ...] = ("priority", "due_date")
     ordering: tuple[str, ...] = ("-priority", "due_date")
-    search_fields: tuple[str] = ("title",)
+    search_fields: tuple[str, ...] = ("title", "description")
     filterset_class = GoalDateFilter
     filterset_fields: tuple[str] = ("category",)
 
     def get_queryset(self) -> QuerySet[Goal]:
         """Return a queryset of goals the user is a participant of"""
-        return (
-            Goal.objects.select_related("category")
-            .filter(
-                category__board__participants__user=self.request.user,
-                category__board__is_deleted=False,
-                category__is_deleted=False,
+        return Goal.objects.filter(
+            visible_goals(), board_id__in=BoardParticipant.objects.filter(user=self.request.user).values("board_id")
+        )
+
+
+# ----------------------------------------------------------------
+class GoalListView(
+    TimedViewMixin, ConditionalListMixin, CachedListMixin, GoalFilterMixin, CompiledListMixin, ListAPIView
+):
+    """API endpoint for retrieving a list of goals"""
+
+    serializer_class = GoalSerializer
+    permission_classes: tuple = (IsAuthenticated, GoalPermission)
+    pagination_class = LimitOffsetKeysetPagination
+
+
+# ----------------------------------------------------------------
+class GoalExportView(TimedViewMixin, GoalFilterMixin, GenericAPIView):
+    """
+    API endpoint for streaming every goal the user can see as NDJSON or CSV
+
+    Accepts the filters, search and ordering of the goal list, the format is chosen
+    by the Accept header or the 'format' parameter. Rows are read from a server-side cursor
+    and encoded batch by batch, gzip-compressed if the client accepts it
+    """
+
+    permission_classes: tuple = (IsAuthenticated,)
+    renderer_classes: tuple = (NDJSONRenderer, CSVRenderer)
+
+    def get(self, request: Request, *args, **kwargs) -> StreamingHttpResponse:
+        """Stream the filtered goals"""
+        renderer: ExportRenderer = request.accepted_renderer
+        rows = (
+            self.filter_queryset(self.get_queryset())
+            .values(*GOAL_EXPORT_COLUMNS, **GOAL_EXPORT_EXPRESSIONS)
+            .iterator(chunk_size=settings.EXPORT_CHUNK_SIZE)
+        )
+        compress: bool = accepts_gzip(request)
+
+        response = StreamingHttpResponse(
+            stream_export(renderer, rows, GOAL_EXPORT_FIELDS, settings.EXPORT_CHUNK_SIZE, compress),
+            content_type=f"{renderer.media_type}; charset={renderer.charset}",
+        )
+        response["Content-Disposition"] = f'attachment; filename="goals.{renderer.format}"'
+        response["Vary"] = "Accept, Accept-Encoding"
+        if compress:
+            response["Content-Encoding"] = "gzip"
+
+        return response
+
+
+# ----------------------------------------------------------------
+class GoalImportView(TimedViewMixin, GenericAPIView):
+    """
+    API endpoint for importing goals from an uploaded CSV file
+
+    Rows are validated against categories loaded once for the whole file
+    and inserted with COPY on PostgreSQL, invalid rows are reported with their line numbers
+    """
+
+    serializer_class = GoalImportFileSerializer
+    permission_classes: tuple = (IsAuthenticated,)
+    parser_classes: tuple = (MultiPartParser,)
+
+    def post(self, request: Request, *args, **kwargs) -> Response:
+        """Import the goals of the file"""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            result: dict = import_goals(
+                io.TextIOWrapper(serializer.validated_data["file"], encoding="utf-8-sig"), request.user
             )
-            .exclude(status=Goal.Status.archived)
+        except UnicodeDecodeError:
+            raise ValidationError({"file": ["Файл должен быть в кодировке UTF-8"]})
+
+        return Response(
+            result, status=status.HTTP_201_CREATED if result["imported"] else status.HTTP_400_BAD_REQUEST
         )
 
 
 # ----------------------------------------------------------------
-class GoalView(RetrieveUpdateDestroyAPIView):
+class GoalView(TimedViewMixin, RelatedQuerysetMixin, ConditionalRetrieveMixin, RetrieveUpdateDestroyAPIView):
     """API endpoint for retrieving/updating/deleting a goal"""
 
     serializer_class = GoalSerializer
     permission_classes: tuple = (IsAuthenticated, GoalPermission)
 
     def get_queryset(self) -> QuerySet[Goal]:
-        """Return a queryset of goals the user is a participant of"""
+        """Return a queryset of goals the user is a participant of with the role of the user"""
         return (
-            Goal.objects.select_related("category")
-            .filter(
-                category__board__participants__user=self.request.user,
-                category__board__is_deleted=False,
-                category__is_deleted=False,
+            Goal.objects.annotate(
+                user_role=Subquery(
+                    BoardParticipant.objects.filter(
+                        board_id=OuterRef("board_id"), user=self.request.user
+                    ).values("role")[:1]
+                )
             )
-            .exclude(status=Goal.Status.archived)
+            .filter(visible_goals(), user_role__isnull=False)
         )
 
     @atomic()
     def perform_destroy(self, goal: Goal) -> None:
         """Archive a goal and delete all of its comments"""
         goal.status = Goal.Status.archived
-        goal.save(update_fields=("status",))
-        goal.comments.all().delete()
+        goal.save(update_fields=("status", "updated"))
+        delete_comments(goal.comments.all())
         # return goal
+
+
+# ----------------------------------------------------------------
+class GoalBulkCreateView(BulkCreateAPIView):
+    """API endpoint for creating a list of goals"""
+
+    serializer_class = GoalBulkCreateSerializer
+    result_serializer_class = GoalSerializer
+    related_field: str = "category"
+    created_event: str = "goal.created"
+
+    def after_bulk_create(self, instances: list) -> None:
+        """Expires cached lists of the boards and adds the goals to the statistics"""
+        super().after_bulk_create(instances)
+        record_goals_created(instances)
+
+
+# ----------------------------------------------------------------
+class GoalBulkUpdateView(BulkChangeAPIView):
+    """API endpoint for changing the status and priority of a list of goals"""
+
+    serializer_class = GoalBulkUpdateSerializer
+
+    def get_queryset(self) -> QuerySet[Goal]:
+        """Return a queryset of visible goals"""
+        return Goal.objects.filter(visible_goals())
+
+    def change(self, ids: list, validated_data: dict) -> None:
+        """Update the status and priority of the goals with a single query"""
+        update_goals(Goal.objects.filter(id__in=ids), **validated_data, updated=timezone.now())
+
+    def patch(self, request: Request, *args, **kwargs) -> Response:
+        """Change the status and priority of the goals the user can edit"""
+        return self.bulk_change(request)
+
+
+# ----------------------------------------------------------------
+class GoalBulkArchiveView(BulkChangeAPIView):
+    """API endpoint for archiving a list of goals"""
+
+    result_key: str = "archived"
+
+    def get_queryset(self) -> QuerySet[Goal]:
+        """Return a queryset of visible goals"""
+        return Goal.objects.filter(visible_goals())
+
+    def change(self, ids: list, validated_data: dict) -> None:
+        """Archive the goals and delete all of their comments"""
+        update_goals(Goal.objects.filter(id__in=ids), status=Goal.Status.archived, updated=timezone.now())
+        delete_comments(GoalComment.objects.filter(goal_id__in=ids))
+
+    def post(self, request: Request, *args, **kwargs) -> Response:
+        """Archive the goals the user can edit"""
+        return self.bulk_change(request)
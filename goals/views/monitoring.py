@@ -0,0 +1,31 @@
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.timing import TimedViewMixin, get_view_timing_stats
+from goals.list_cache import get_list_cache_stats
+from goals.roles import get_role_cache_stats
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create views
+class CacheStatsView(TimedViewMixin, APIView):
+    """API endpoint for monitoring the caches and the measured requests of the current worker process"""
+
+    permission_classes: tuple = (IsAdminUser,)
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        """
+        Returns hit and miss counters of the caches and the averages of the measured requests of every view
+
+        Returns:
+            Response with the counters of every cache and the timings of the views
+        """
+        return Response(
+            {
+                "board_roles": get_role_cache_stats(),
+                "lists": get_list_cache_stats(),
+                "views": get_view_timing_stats(),
+            }
+        )
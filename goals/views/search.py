@@ -0,0 +1,116 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection
+from django.db.models import BigIntegerField, CharField, F, FloatField, Q, QuerySet, Value
+from django.db.models.functions import Cast
+
+from rest_framework.generics import ListAPIView
+from rest_framework.permissions import IsAuthenticated
+
+from core.timing import TimedViewMixin
+from goals.models.board import Board, BoardParticipant
+from goals.models.goal import Goal, visible_goals
+from goals.models.goal_category import GoalCategory
+from goals.models.goal_comment import GoalComment
+from goals.models.mixins import SEARCH_CONFIG
+from goals.pagination import SearchPagination
+from goals.serializers.search import SearchResultSerializer
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create views
+class SearchView(TimedViewMixin, ListAPIView):
+    """API endpoint for searching boards, categories, goals and comments the user is a participant of"""
+
+    serializer_class = SearchResultSerializer
+    permission_classes: tuple = (IsAuthenticated,)
+    pagination_class = SearchPagination
+
+    search_param: str = "search"
+    result_fields: tuple[str, ...] = (
+        "id",
+        "search_type",
+        "search_board",
+        "search_goal",
+        "search_title",
+        "search_rank",
+    )
+
+    def get_sources(self) -> tuple:
+        """
+        Returns the searchable querysets visible to the user
+
+        Returns:
+            Tuples of the result type, the queryset, the text fields with the title first
+            and the fields with board and goal ids
+        """
+        board_ids: QuerySet = BoardParticipant.objects.filter(user=self.request.user).values("board_id")
+
+        return (
+            (
+                "board",
+                Board.objects.filter(id__in=board_ids, is_deleted=False),
+                ("title",),
+                "id",
+                None,
+            ),
+            (
+                "category",
+                GoalCategory.objects.filter(board_id__in=board_ids, is_deleted=False),
+                ("title",),
+                "board_id",
+                None,
+            ),
+            (
+                "goal",
+                Goal.objects.filter(visible_goals(), board_id__in=board_ids),
+                ("title", "description"),
+                "board_id",
+                "id",
+            ),
+            (
+                "comment",
+                GoalComment.objects.filter(visible_goals("goal__"), board_id__in=board_ids),
+                ("text",),
+                "board_id",
+                "goal_id",
+            ),
+        )
+
+    def get_queryset(self) -> QuerySet:
+        """
+        Return a union of matching objects of every type ordered by rank
+
+        PostgreSQL matches the stored search vectors with a web search query,
+        other databases fall back to a case-insensitive search of the text fields,
+        SQLite folds the case of ASCII letters only
+        """
+        text: str = self.request.query_params.get(self.search_param, "").strip()
+        if not text:
+            return Board.objects.none()
+
+        use_vectors: bool = connection.vendor == "postgresql"
+        query = SearchQuery(text, config=SEARCH_CONFIG, search_type="websearch")
+
+        results: list = []
+        for result_type, queryset, text_fields, board_field, goal_field in self.get_sources():
+            if use_vectors:
+                queryset = queryset.filter(search_vector=query)
+                rank = Cast(SearchRank(F("search_vector"), query), FloatField())
+            else:
+                condition = Q()
+                for field in text_fields:
+                    condition |= Q(**{f"{field}__icontains": text})
+                queryset = queryset.filter(condition)
+                rank = Value(0.0, output_field=FloatField())
+
+            results.append(
+                queryset.annotate(
+                    search_type=Value(result_type, output_field=CharField()),
+                    search_board=F(board_field),
+                    search_goal=F(goal_field) if goal_field else Cast(None, BigIntegerField()),
+                    search_title=F(text_fields[0]),
+                    search_rank=rank,
+                ).values(*self.result_fields)
+            )
+
+        return results[0].union(*results[1:], all=True).order_by("-search_rank", "search_type", "id")
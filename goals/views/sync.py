@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Set
+
+from django.conf import settings
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from core.timing import TimedViewMixin
+from goals.models.board import Board, BoardParticipant
+from goals.models.goal import Goal, visible_goals
+from goals.models.goal_category import GoalCategory
+from goals.models.goal_comment import GoalComment
+from goals.models.tombstone import Tombstone
+from goals.serializers.board import BoardCreateSerializer, BoardParticipantSerializer
+from goals.serializers.category import GoalCategorySerializer
+from goals.serializers.comment import GoalCommentSerializer
+from goals.serializers.goal import GoalSerializer
+from goals.compiled import CompiledSerializer, compile_serializer
+from goals.cursors import decode_cursor, encode_cursor
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create views
+class SyncView(TimedViewMixin, GenericAPIView):
+    """
+    API endpoint for syncing boards, categories, goals, comments and participants
+    changed since a cursor, with the deleted comments and participants and the revoked boards
+
+    Without a cursor returns everything the user can see. Boards the user joined after the cursor
+    are returned in full, the other boards only with rows updated after the cursor,
+    so the work is proportional to the changes rather than to the data
+    """
+
+    permission_classes: tuple = (IsAuthenticated,)
+    since_query_param: str = "since"
+
+    def get_since(self) -> Optional[datetime]:
+        """Return the moment of the cursor of the request or None for a full sync"""
+        cursor: Optional[str] = self.request.query_params.get(self.since_query_param)
+
+        return decode_cursor(cursor) if cursor else None
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        """
+        Returns the changes since the cursor and the cursor of the next sync
+
+        Returns:
+            Response with the changed objects by type, the deleted objects, the revoked boards and the cursor
+        """
+        cursor: str = encode_cursor(timezone.now() - timedelta(seconds=settings.SYNC_CURSOR_LAG))
+        since: Optional[datetime] = self.get_since()
+
+        joined: Dict[int, datetime] = dict(
+            BoardParticipant.objects.filter(user=request.user).values_list("board_id", "created")
+        )
+        new: Set[int] = {board_id for board_id, created in joined.items() if since is None or created > since}
+        known: Set[int] = joined.keys() - new
+
+        def updated(field: str = "board_id") -> Q:
+            """Rows of the known boards updated after the cursor"""
+            return Q(**{f"{field}__in": known, "updated__gt": since}) if known else Q(pk__in=())
+
+        def changes(queryset: QuerySet, current: Q = Q()) -> QuerySet:
+            """Current rows of the new boards and changed rows of the known boards"""
+            return queryset.filter(Q(current, board_id__in=new) | updated()).order_by("id")
+
+        def represent(serializer_class, queryset: QuerySet) -> list:
+            """Serialized rows of a queryset"""
+            compiled: CompiledSerializer = compile_serializer(serializer_class)
+            return compiled.represent(compiled.values(queryset))
+
+        boards: list = represent(
+            BoardCreateSerializer, Board.objects.filter(Q(id__in=new, is_deleted=False) | updated("id")).order_by("id")
+        )
+        # Deleted boards the user joined after the cursor are left out with all of their objects
+        new &= {board["id"] for board in boards}
+
+        data: dict = {
+            "cursor": cursor,
+            "boards": boards,
+            "categories": represent(GoalCategorySerializer, changes(GoalCategory.objects, Q(is_deleted=False))),
+            "goals": represent(GoalSerializer, changes(Goal.objects, visible_goals())),
+            "comments": represent(GoalCommentSerializer, changes(GoalComment.objects)),
+            "participants": represent(BoardParticipantSerializer, changes(BoardParticipant.objects)),
+            "deleted": {"comments": [], "participants": []},
+            "revoked_boards": [],
+        }
+
+        if since is not None:
+            for kind, object_id in (
+                Tombstone.objects.filter(board_id__in=known, deleted__gt=since)
+                .order_by("id")
+                .values_list("kind", "object_id")
+            ):
+                data["deleted"][Tombstone.Kind(kind).name + "s"].append(object_id)
+
+            data["revoked_boards"] = sorted(
+                set(
+                    Tombstone.objects.filter(
+                        kind=Tombstone.Kind.participant, user=request.user, deleted__gt=since
+                    )
+                    .exclude(board_id__in=joined.keys())
+                    .values_list("board_id", flat=True)
+                )
+            )
+
+        return Response(data)
@@ -0,0 +1,174 @@
+import datetime
+import io
+import json
+from decimal import Decimal
+
+import msgpack
+import pytest
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework import status
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from core.parsers import MessagePackParser, ORJSONParser
+from core.renderers import MessagePackRenderer, ORJSONRenderer
+from tests.factories import BoardParticipantFactory, GoalCategoryFactory
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create fixtures
+@pytest.fixture
+def payload() -> dict:
+    """A fixture that builds data with the values the DRF encoder handles"""
+    return {
+        "created": datetime.datetime(2023, 5, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+        "due_date": datetime.date(2023, 5, 2),
+        "amount": Decimal("10.50"),
+        "title": gettext_lazy("Название"),
+        "by_status": {1: 3, 2: 1},
+        "text": "строка\u2028с разделителем",
+        "items": [None, True, 1.5],
+    }
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tests
+def test_renderer_matches_drf(payload) -> None:
+    """
+    Test to check that the orjson renderer encodes the same bytes as the DRF JSON renderer
+
+    Args:
+        payload: A fixture that builds data with the values the DRF encoder handles
+
+    Checks:
+        - Datetimes, dates, Decimals, lazy strings, integer keys and line separators are encoded alike
+        - Empty data is rendered as an empty body
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError
+    """
+    assert ORJSONRenderer().render(payload) == JSONRenderer().render(payload), "Вывод отличается"
+    assert ORJSONRenderer().render(None) == b"", "Пустые данные не пусты"
+
+
+def test_parser_matches_drf() -> None:
+    """
+    Test to check that the orjson parser reads the data of the DRF JSON parser and rejects invalid bodies
+
+    Checks:
+        - Parsed data is the same
+        - Malformed JSON and NaN raise ParseError
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError
+    """
+    body: bytes = json.dumps({"title": "Цель", "ids": [1, 2], "done": False}, ensure_ascii=False).encode()
+
+    assert ORJSONParser().parse(io.BytesIO(body)) == JSONParser().parse(io.BytesIO(body)), "Данные отличаются"
+    for invalid in (b"{", b'{"value": NaN}'):
+        with pytest.raises(ParseError):
+            ORJSONParser().parse(io.BytesIO(invalid))
+
+
+def test_msgpack_round_trip(payload) -> None:
+    """
+    Test to check that MessagePack carries the values of JSON and rejects invalid bodies
+
+    Args:
+        payload: A fixture that builds data with the values the DRF encoder handles
+
+    Checks:
+        - Datetimes, dates, Decimals and lazy strings are decoded into the strings of JSON
+        - Integer keys stay integers
+        - Malformed and truncated bodies raise ParseError
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError
+    """
+    expected: dict = {**json.loads(JSONRenderer().render(payload)), "by_status": {1: 3, 2: 1}}
+
+    assert MessagePackParser().parse(io.BytesIO(MessagePackRenderer().render(payload))) == expected, "Данные отличаются"
+    for invalid in (b"\xc1", b"\x92\x01"):
+        with pytest.raises(ParseError):
+            MessagePackParser().parse(io.BytesIO(invalid))
+
+
+@pytest.mark.django_db
+def test_msgpack_api(authenticated_user, user, due_date) -> None:
+    """
+    Test to check that the API reads and answers with MessagePack chosen by the headers
+
+    Args:
+        authenticated_user: API client with authenticated user for testing
+        user: A fixture that creates a user instance
+        due_date: A fixture that creates a date with the timedelta from the current date
+
+    Checks:
+        - A goal is created from a MessagePack body
+        - The answer is MessagePack with the date and choices that were sent
+        - The goal read as MessagePack is the goal read as JSON
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError
+    """
+    category = GoalCategoryFactory()
+    BoardParticipantFactory(board=category.board, user=user)
+    create_data: dict = {"category": category.id, "title": "Цель", "due_date": due_date, "status": 2, "priority": 4}
+
+    response: Response = authenticated_user.post(
+        reverse("goal_create"),
+        data=msgpack.packb(create_data),
+        content_type="application/msgpack",
+        HTTP_ACCEPT="application/msgpack",
+    )
+    created: dict = msgpack.unpackb(response.content)
+    url: str = reverse("goal", kwargs={"pk": created["id"]})
+    retrieved: dict = msgpack.unpackb(authenticated_user.get(url, HTTP_ACCEPT="application/msgpack").content)
+
+    assert response.status_code == status.HTTP_201_CREATED, "Цель не создалась"
+    assert response["Content-Type"] == "application/msgpack", "Ответ не в MessagePack"
+    assert {key: created[key] for key in create_data} == create_data, "Данные цели изменились"
+    assert retrieved == authenticated_user.get(url).json(), "Данные отличаются от JSON"
+
+
+@pytest.mark.django_db
+def test_browsable_api_disabled(authenticated_user) -> None:
+    """
+    Test to check that without DEBUG the API answers a browser with JSON
+
+    Args:
+        authenticated_user: API client with authenticated user for testing
+
+    Checks:
+        - The orjson and MessagePack renderers are the only default renderers
+        - A browser request gets JSON
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError
+    """
+    response: Response = authenticated_user.get(
+        reverse("board_list"), HTTP_ACCEPT="text/html,application/xhtml+xml,*/*;q=0.8"
+    )
+
+    assert api_settings.DEFAULT_RENDERER_CLASSES == [ORJSONRenderer, MessagePackRenderer], "Включены другие рендереры"
+    assert response.status_code == status.HTTP_200_OK, "Запрос не прошел"
+    assert response["Content-Type"] == "application/json", "Ответ не в JSON"
@@ -0,0 +1,152 @@
+import logging
+import re
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+
+from core.timing import get_view_timing_stats
+from tests.factories import BoardParticipantFactory, GoalCategoryFactory, GoalFactory
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create helpers
+def parse_server_timing(header: str) -> dict:
+    """Returns the durations and descriptions of the metrics of a Server-Timing header"""
+    metrics: dict = {}
+    for entry in header.split(", "):
+        name, *params = entry.split(";")
+        values: dict = dict(param.split("=", 1) for param in params)
+        metrics[name] = {"dur": float(values["dur"]), "desc": values.get("desc", "").strip('"')}
+
+    return metrics
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tests
+@pytest.mark.django_db
+def test_server_timing_staff_header(authenticated_user, user, settings) -> None:
+    """
+    Test to check that only staff users logged in with a session get the Server-Timing header
+    for requests asking for it
+
+    Args:
+        authenticated_user: API client with authenticated user for testing
+        user: A fixture that creates a user instance
+        settings: A fixture with the Django settings
+
+    Checks:
+        - Requests without the header and requests of other users get no Server-Timing header
+        - Requests of other users are not measured
+        - The header of a staff user has the queries of the request and every measured section
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError
+    """
+    settings.SERVER_TIMING = False
+    category = GoalCategoryFactory()
+    BoardParticipantFactory(board=category.board, user=user)
+    goal = GoalFactory(category=category, user=user)
+    url: str = reverse("goal", kwargs={"pk": goal.id})
+    authenticated_user.force_login(user)
+    before: dict = get_view_timing_stats().get("goal", {"requests": 0})
+
+    assert "Server-Timing" not in authenticated_user.get(url), "Заголовок без запроса"
+    assert "Server-Timing" not in authenticated_user.get(url, HTTP_X_SERVER_TIMING="1"), "Заголовок не для персонала"
+    assert get_view_timing_stats().get("goal", {"requests": 0}) == before, "Измерен запрос не персонала"
+
+    user.is_staff = True
+    user.save()
+    with CaptureQueriesContext(connection) as queries:
+        response: Response = authenticated_user.get(url, HTTP_X_SERVER_TIMING="1")
+    metrics: dict = parse_server_timing(response["Server-Timing"])
+
+    assert response.status_code == status.HTTP_200_OK, "Запрос не прошел"
+    assert set(metrics) == {"db", "db-slowest", "serializer", "permissions", "total"}, "Неверные метрики"
+    # The session and the user are loaded by the staff check before the request is measured
+    assert metrics["db"]["desc"] == f"{len(queries) - 2} queries", "Неверное число запросов"
+    assert 0 < metrics["db-slowest"]["dur"] <= metrics["db"]["dur"] <= metrics["total"]["dur"], "Неверное время SQL"
+    assert metrics["serializer"]["dur"] > 0 and metrics["permissions"]["dur"] > 0, "Секции не измерены"
+
+
+@pytest.mark.django_db
+def test_server_timing_budgets(authenticated_user, user, settings, caplog) -> None:
+    """
+    Test to check that with SERVER_TIMING every request is measured and checked against the budgets of its view
+
+    Args:
+        authenticated_user: API client with authenticated user for testing
+        user: A fixture that creates a user instance
+        settings: A fixture with the Django settings
+        caplog: A fixture that captures log records
+
+    Checks:
+        - Every user gets the Server-Timing header
+        - A request over the budget of its view is logged with the exceeded metrics and the slowest query
+        - A view within its budgets is not logged
+        - The requests are added to the statistics of their views shown by the monitoring endpoint
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError
+    """
+    settings.SERVER_TIMING = True
+    settings.SERVER_TIMING_BUDGETS = {"queries": 100, "total": 60_000}
+    settings.SERVER_TIMING_VIEW_BUDGETS = {"goal_list": {"queries": 0}}
+    BoardParticipantFactory(user=user)
+    before: dict = get_view_timing_stats().get("goal_list", {"requests": 0, "over_budget": 0})
+
+    with caplog.at_level(logging.WARNING, logger="core.timing"):
+        response: Response = authenticated_user.get(reverse("goal_list"))
+        authenticated_user.get(reverse("board_list"))
+    stats: dict = get_view_timing_stats()["goal_list"]
+    user.is_staff = True
+    user.save()
+    monitoring: dict = authenticated_user.get(reverse("cache_stats")).json()
+
+    assert "Server-Timing" in response, "Нет заголовка"
+    assert len(caplog.records) == 1, "Неверное число предупреждений"
+    assert re.match(r"goal_list: превышен бюджет \(queries\)", caplog.records[0].getMessage()), "Нет предупреждения"
+    assert "SELECT" in caplog.records[0].getMessage(), "Нет самого медленного запроса"
+    assert stats["requests"] == before["requests"] + 1, "Запрос не учтен"
+    assert stats["over_budget"] == before["over_budget"] + 1, "Превышение не учтено"
+    assert monitoring["views"]["goal_list"]["requests"] == stats["requests"], "Нет статистики в мониторинге"
+
+
+@pytest.mark.django_db
+def test_server_timing_skips_streaming(authenticated_user, user, settings) -> None:
+    """
+    Test to check that streaming responses are not measured, their queries run after the headers are sent
+
+    Args:
+        authenticated_user: API client with authenticated user for testing
+        user: A fixture that creates a user instance
+        settings: A fixture with the Django settings
+
+    Checks:
+        - Streamed export gets no Server-Timing header
+        - The export is not added to the statistics
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError
+    """
+    settings.SERVER_TIMING = True
+    GoalFactory(category__board=BoardParticipantFactory(user=user).board)
+
+    response = authenticated_user.get(reverse("goal_export"), HTTP_ACCEPT="application/x-ndjson")
+    rows: list = b"".join(response.streaming_content).splitlines()
+
+    assert len(rows) == 1, "Экспорт не выполнен"
+    assert "Server-Timing" not in response, "Заголовок потокового ответа"
+    assert "goal_export" not in get_view_timing_stats(), "Потоковый ответ в статистике"
@@ -17,13 +17,14 @@ User = get_user_model()
 # Create factories
 class UserFactory(factory.django.DjangoModelFactory):
     """
-    Factory for creating User instances with randomized data
+    Factory for creating User instances with randomized data,
+    usernames are numbered, so tests creating many users do not get duplicates
 
     Returns:
         User instance with randomized data
     """
 
-    username = factory.Faker("user_name")
+    username = factory.Sequence(lambda number: f"factory_user_{number}")
     password = factory.Faker("password")
     email = factory.Faker("email")
     first_name = factory.Faker("first_name")
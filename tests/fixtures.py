@@ -1,5 +1,6 @@
 import datetime
 import pytest
+from django.core.cache import cache
 from rest_framework.test import APIClient
 
 from tests.factories import UserFactory
@@ -37,3 +38,9 @@ def due_date():
     """A fixture that creates a date with the timedelta from the current date"""
     due_date: datetime = datetime.date.today() + datetime.timedelta(days=7)
     return due_date.strftime("%Y-%m-%d")
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """A fixture that clears the cache before every test"""
+    cache.clear()
@@ -0,0 +1,58 @@
+import io
+import json
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from goals.models.goal import Goal
+from goals.models.goal_stat import GoalStat
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tests
+@pytest.mark.django_db
+def test_benchmark_api(tmp_path) -> None:
+    """
+    Test to check that the API benchmark measures every scenario, compares with a baseline and leaves no data
+
+    Args:
+        tmp_path: A fixture that creates a temporary directory
+
+    Checks:
+        - Every scenario is written to the results file with percentiles, queries and bytes
+        - The dataset is rolled back
+        - A run slower than the allowed regression of the baseline fails
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError
+    """
+    results, baseline = tmp_path / "results.json", tmp_path / "baseline.json"
+    sizes: tuple = ("--users", "3", "--boards", "2", "--categories", "2", "--goals", "2", "--comments", "2")
+
+    call_command("benchmark_api", *sizes, "--requests", "3", "--warmup", "1", "--output", results, stdout=io.StringIO())
+    report: dict = json.loads(results.read_text())
+
+    assert report["dataset"]["goals"] == 8, "Неверный размер данных"
+    assert len(report["results"]) == 15, "Не все сценарии выполнены"
+    assert all(
+        result["p50_ms"] <= result["p95_ms"] <= result["p99_ms"] and result["requests"] == 3
+        for result in report["results"].values()
+    ), "Неверные перцентили"
+    assert report["results"]["goal.detail"]["queries"] == 1, "Неверное число запросов"
+    assert report["results"]["goals.list"]["bytes"] > 0, "Размер ответа не подсчитан"
+    assert not Goal.objects.exists() and not GoalStat.objects.exists(), "Данные не удалены"
+
+    for result in report["results"].values():
+        result["p95_ms"] = 0.001
+    baseline.write_text(json.dumps(report))
+    with pytest.raises(CommandError, match="goal.detail"):
+        call_command(
+            "benchmark_api",
+            *sizes,
+            *("--requests", "3", "--warmup", "0", "--scenarios", "goal.detail"),
+            *("--baseline", baseline, "--max-regression", "0.5"),
+            stdout=io.StringIO(),
+        )
@@ -42,7 +42,7 @@ class TestBoardCreateView:
 
         created_board = Board.objects.filter(title=create_data["title"]).exists()
         created_board_participant = BoardParticipant.objects.filter(
-            board=created_board, user=user, role=BoardParticipant.Role.owner
+            board__title=create_data["title"], user=user, role=BoardParticipant.Role.owner
         ).exists()
 
         assert response.status_code == status.HTTP_201_CREATED, "Доска не создалась"
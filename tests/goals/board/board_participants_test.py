@@ -0,0 +1,356 @@
+import json
+from typing import Dict, List
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+
+from goals.models.board import BoardParticipant
+from goals.roles import get_board_role
+from goals.serializers.board import BoardSerializer
+from tests.factories import BoardFactory, BoardParticipantFactory, UserFactory
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create fixtures
+@pytest.fixture
+def board(user):
+    """A fixture that creates a board owned by the user"""
+    board = BoardFactory()
+    BoardParticipantFactory(board=board, user=user)
+    return board
+
+
+def _roles(board) -> Dict[str, int]:
+    """Returns the roles of the participants of a board by usernames"""
+    return dict(board.participants.values_list("user__username", "role"))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tests
+@pytest.mark.django_db
+class TestBoardParticipantsChange:
+    """Tests for the replacement and the partial changes of board participants"""
+
+    def test_replace_participants_diff(self, authenticated_user, user, board) -> None:
+        """
+        Test to check that the full list of participants is applied as a diff
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+            board: A fixture that creates a board owned by the user
+
+        Checks:
+            - Response status code is 200
+            - Unchanged participant is kept, changed one gets the new role,
+              missing one is removed and a new one is added
+            - Roles of the added user are not served from the cache
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        kept, changed, removed, added = UserFactory.create_batch(size=4)
+        BoardParticipantFactory(board=board, user=kept, role=BoardParticipant.Role.viewer)
+        BoardParticipantFactory(board=board, user=changed, role=BoardParticipant.Role.viewer)
+        BoardParticipantFactory(board=board, user=removed, role=BoardParticipant.Role.viewer)
+        assert get_board_role(added, board.id) is None
+
+        participants: List[dict] = [
+            {"user": kept.username, "role": BoardParticipant.Role.viewer},
+            {"user": changed.username, "role": BoardParticipant.Role.moderator},
+            {"user": added.username, "role": BoardParticipant.Role.viewer},
+        ]
+        response: Response = authenticated_user.put(
+            reverse("board", kwargs={"pk": board.id}),
+            data=json.dumps({"title": board.title, "participants": participants}),
+            content_type="application/json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK, "Запрос не прошел"
+        assert _roles(board) == {
+            user.username: BoardParticipant.Role.owner,
+            kept.username: BoardParticipant.Role.viewer,
+            changed.username: BoardParticipant.Role.moderator,
+            added.username: BoardParticipant.Role.viewer,
+        }, "Участники не совпадают"
+        assert get_board_role(added, board.id) == BoardParticipant.Role.viewer, "Роль из устаревшего кэша"
+
+    def test_replace_participants_queries(
+        self, authenticated_user, board, django_assert_max_num_queries, monkeypatch
+    ) -> None:
+        """
+        Test to check that replacing many participants takes a fixed number of queries
+        before the response is serialized
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            board: A fixture that creates a board owned by the user
+            django_assert_max_num_queries: A fixture that counts database queries
+            monkeypatch: A fixture that skips serialization of the response
+
+        Checks:
+            - Every participant is replaced with a bounded number of queries
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        old_users = UserFactory.create_batch(size=20)
+        for old_user in old_users[:10]:
+            BoardParticipantFactory(board=board, user=old_user, role=BoardParticipant.Role.viewer)
+
+        participants: List[dict] = [
+            {"user": new_user.username, "role": BoardParticipant.Role.moderator} for new_user in old_users[5:]
+        ]
+        data: str = json.dumps({"title": board.title, "participants": participants})
+
+        monkeypatch.setattr(BoardSerializer, "to_representation", lambda self, instance: {})
+
+        with django_assert_max_num_queries(11):
+            response: Response = authenticated_user.put(
+                reverse("board", kwargs={"pk": board.id}), data=data, content_type="application/json"
+            )
+
+        assert response.status_code == status.HTTP_200_OK, "Запрос не прошел"
+        assert board.participants.count() == 16, "Количество участников не совпадает"
+
+    def test_change_some_participants(self, authenticated_user, user, board) -> None:
+        """
+        Test to check that participants are added, removed and change roles without the full list
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+            board: A fixture that creates a board owned by the user
+
+        Checks:
+            - Response status code is 204
+            - Only the listed participants are changed
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        kept, changed, removed, added = UserFactory.create_batch(size=4)
+        for member in (kept, changed, removed):
+            BoardParticipantFactory(board=board, user=member, role=BoardParticipant.Role.viewer)
+
+        response: Response = authenticated_user.patch(
+            reverse("board_participants", kwargs={"pk": board.id}),
+            data=json.dumps(
+                {
+                    "add": [{"user": added.username, "role": BoardParticipant.Role.moderator}],
+                    "change_role": [{"user": changed.username, "role": BoardParticipant.Role.moderator}],
+                    "remove": [removed.username],
+                }
+            ),
+            content_type="application/json",
+        )
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT, "Запрос не прошел"
+        assert _roles(board) == {
+            user.username: BoardParticipant.Role.owner,
+            kept.username: BoardParticipant.Role.viewer,
+            changed.username: BoardParticipant.Role.moderator,
+            added.username: BoardParticipant.Role.moderator,
+        }, "Участники не совпадают"
+
+    @pytest.mark.parametrize(
+        "operation",
+        (
+            {"add": [{"user": "member", "role": BoardParticipant.Role.viewer}]},
+            {"change_role": [{"user": "username", "role": BoardParticipant.Role.viewer}]},
+            {"remove": ["unknown"]},
+            {},
+        ),
+        ids=("add_existing", "change_own_role", "remove_unknown", "empty"),
+    )
+    def test_change_participants_invalid(self, authenticated_user, board, operation) -> None:
+        """
+        Test to check that invalid changes of participants are rejected
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            board: A fixture that creates a board owned by the user
+            operation: Invalid change of participants
+
+        Checks:
+            - Response status code is 400
+            - Participants are not changed
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        BoardParticipantFactory(board=board, user=UserFactory(username="member"), role=BoardParticipant.Role.viewer)
+        roles: Dict[str, int] = _roles(board)
+
+        response: Response = authenticated_user.patch(
+            reverse("board_participants", kwargs={"pk": board.id}),
+            data=json.dumps(operation),
+            content_type="application/json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, "Изменение не отклонено"
+        assert _roles(board) == roles, "Участники изменены"
+
+    def test_change_participants_moderator(self, authenticated_user, user) -> None:
+        """
+        Test to check that a moderator cannot change participants
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+
+        Checks:
+            - Response status code is 403
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        BoardParticipantFactory(board=board, user=user, role=BoardParticipant.Role.moderator)
+
+        response: Response = authenticated_user.patch(
+            reverse("board_participants", kwargs={"pk": board.id}),
+            data=json.dumps({"remove": [user.username]}),
+            content_type="application/json",
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN, "Отказ в доступе не предоставлен"
+
+
+# ----------------------------------------------------------------
+@pytest.mark.django_db
+class TestBoardParticipantsList:
+    """Tests for the participants list and the lean board detail"""
+
+    def test_participants_list_search(self, authenticated_user, user) -> None:
+        """
+        Test to check that a viewer gets a page of participants searchable by username
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+
+        Checks:
+            - Response status code is 200
+            - Participants are ordered by role and username
+            - Search filters participants by username
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        BoardParticipantFactory(board=board, user=user, role=BoardParticipant.Role.viewer)
+        BoardParticipantFactory(board=board, user=UserFactory(username="owner"))
+        BoardParticipantFactory(board=board, user=UserFactory(username="alice"), role=BoardParticipant.Role.viewer)
+        url: str = reverse("board_participants", kwargs={"pk": board.id})
+
+        page: Response = authenticated_user.get(url, {"limit": 2})
+        found: Response = authenticated_user.get(url, {"search": "ali"})
+
+        assert page.status_code == status.HTTP_200_OK, "Запрос не прошел"
+        assert page.data["count"] == 3, "Количество участников не совпадает"
+        assert [item["user"] for item in page.data["results"]] == ["owner", "alice"], "Порядок не совпадает"
+        assert [item["user"] for item in found.data] == ["alice"], "Поиск не совпадает"
+
+    def test_participants_list_not_participant(self, authenticated_user) -> None:
+        """
+        Test to check that participants of a foreign board are not available
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+
+        Checks:
+            - Response status code is 404
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        BoardParticipantFactory(board=board)
+
+        response: Response = authenticated_user.get(reverse("board_participants", kwargs={"pk": board.id}))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND, "Получены чужие участники"
+
+    @pytest.mark.parametrize("query", ({}, {"lean": "true"}, {"limit": 50}), ids=("full", "lean", "list"))
+    def test_board_queries_fixed(self, authenticated_user, user, query, django_assert_max_num_queries) -> None:
+        """
+        Test to check that the board detail in both modes and the participants list
+        take a fixed number of queries however many participants the board has
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+            query: Query parameters of the request
+            django_assert_max_num_queries: A fixture that counts database queries
+
+        Checks:
+            - Response status code is 200
+            - Number of queries does not depend on the number of participants
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        BoardParticipantFactory(board=board, user=user)
+        for member in UserFactory.create_batch(size=20):
+            BoardParticipantFactory(board=board, user=member, role=BoardParticipant.Role.viewer)
+        url_name: str = "board_participants" if "limit" in query else "board"
+
+        with django_assert_max_num_queries(3):
+            response: Response = authenticated_user.get(reverse(url_name, kwargs={"pk": board.id}), query)
+
+        assert response.status_code == status.HTTP_200_OK, "Запрос не прошел"
+
+    def test_board_lean_counts(self, authenticated_user, user) -> None:
+        """
+        Test to check that the lean board detail returns the counts of participants by role
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+
+        Checks:
+            - Response contains the counts instead of the list of participants
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        BoardParticipantFactory(board=board, user=user)
+        BoardParticipantFactory.create_batch(size=2, board=board, role=BoardParticipant.Role.viewer)
+
+        response: Response = authenticated_user.get(reverse("board", kwargs={"pk": board.id}), {"lean": "true"})
+
+        assert "participants" not in response.data, "Получен список участников"
+        assert response.data["participants_count"] == 3, "Количество участников не совпадает"
+        assert response.data["roles_count"] == {"owner": 1, "moderator": 0, "viewer": 2}, "Роли не совпадают"
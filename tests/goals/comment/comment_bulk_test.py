@@ -0,0 +1,126 @@
+import json
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+
+from goals.models.board import BoardParticipant
+from goals.models.goal import Goal
+from goals.models.goal_comment import GoalComment
+from tests.factories import (
+    BoardFactory,
+    BoardParticipantFactory,
+    GoalCategoryFactory,
+    GoalCommentFactory,
+    GoalFactory,
+)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tests
+@pytest.mark.django_db
+class TestGoalCommentBulkViews:
+    """Tests for Comment bulk create and delete views"""
+
+    def test_comment_bulk_create(self, authenticated_user, user) -> None:
+        """
+        Test to check that comments are created on goals of editable boards
+        and comments on archived goals are reported
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+
+        Checks:
+            - Response status code is 201
+            - Comments are created on the board of the goal
+            - Comment on an archived goal is reported
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        BoardParticipantFactory(board=board, user=user)
+        category = GoalCategoryFactory(board=board)
+        goal = GoalFactory(category=category)
+        archived_goal = GoalFactory(category=category, status=Goal.Status.archived)
+
+        response: Response = authenticated_user.post(
+            reverse("comment_bulk_create"),
+            data=json.dumps(
+                [
+                    {"goal": goal.id, "text": "Первый"},
+                    {"goal": goal.id, "text": "Второй"},
+                    {"goal": archived_goal.id, "text": "Третий"},
+                ]
+            ),
+            content_type="application/json",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED, "Комментарии не создались"
+        assert GoalComment.objects.filter(goal=goal, board=board).count() == 2, "Комментарии не совпадают"
+        assert [error["index"] for error in response.data["errors"]] == [2], "Ошибки не совпадают"
+
+    def test_comment_bulk_create_invalid(self, authenticated_user) -> None:
+        """
+        Test to check that a request without a list of comments is rejected
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+
+        Checks:
+            - Response status code is 400
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        response: Response = authenticated_user.post(
+            reverse("comment_bulk_create"),
+            data=json.dumps({"goal": 1, "text": "Текст"}),
+            content_type="application/json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, "Запрос не отклонен"
+
+    def test_comment_bulk_delete(self, authenticated_user, user) -> None:
+        """
+        Test to check that comments on editable boards are deleted
+        and comments on a board where the user is a viewer are kept
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+
+        Checks:
+            - Response status code is 200
+            - Only editable comments are deleted
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        BoardParticipantFactory(board=board, user=user)
+        comments = GoalCommentFactory.create_batch(size=2, goal=GoalFactory(category=GoalCategoryFactory(board=board)))
+        viewer_board = BoardFactory()
+        BoardParticipantFactory(board=viewer_board, user=user, role=BoardParticipant.Role.viewer)
+        viewer_comment = GoalCommentFactory(goal=GoalFactory(category=GoalCategoryFactory(board=viewer_board)))
+
+        response: Response = authenticated_user.post(
+            reverse("comment_bulk_delete"),
+            data=json.dumps({"ids": [comment.id for comment in comments] + [viewer_comment.id]}),
+            content_type="application/json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK, "Запрос не прошел"
+        assert list(GoalComment.objects.values_list("id", flat=True)) == [viewer_comment.id], "Удаление не совпадает"
+        assert response.data["errors"] == [{"id": viewer_comment.id, "errors": ["Недостаточно прав"]}]
@@ -0,0 +1,91 @@
+import io
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from rest_framework.renderers import JSONRenderer
+
+from goals.compiled import compile_serializer
+from goals.management.commands.benchmark_serializers import get_benchmarks
+from goals.serializers.board import BoardSerializer
+from tests.factories import BoardParticipantFactory, GoalCommentFactory, GoalFactory
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create fixtures
+@pytest.fixture
+def objects() -> None:
+    """A fixture that creates goals with comments on several boards"""
+    for goal in (GoalFactory(description=""), GoalFactory(), GoalFactory(status=4, priority=4)):
+        BoardParticipantFactory(board=goal.board)
+        GoalCommentFactory.create_batch(size=2, goal=goal)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tests
+@pytest.mark.django_db
+class TestCompiledSerializer:
+    """Tests for the compiled read paths of the list serializers"""
+
+    def test_compiled_output_identical(self, objects) -> None:
+        """
+        Test to check that the compiled serializers render the same bytes as the serializers
+
+        Args:
+            objects: A fixture that creates goals with comments on several boards
+
+        Checks:
+            - Rendered goals, categories, comments and boards are identical
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        renderer = JSONRenderer()
+        for name, serializer_class, queryset in get_benchmarks():
+            compiled = compile_serializer(serializer_class)
+
+            expected: bytes = renderer.render(serializer_class(queryset, many=True).data)
+            actual: bytes = renderer.render(compiled.represent(compiled.values(queryset)))
+
+            assert actual == expected, f"Вывод отличается: {name}"
+
+    def test_unsupported_serializer(self) -> None:
+        """
+        Test to check that a serializer with nested lists is not compiled
+
+        Checks:
+            - ImproperlyConfigured is raised
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        with pytest.raises(ImproperlyConfigured):
+            compile_serializer(BoardSerializer)
+
+    def test_benchmark_command(self, objects) -> None:
+        """
+        Test to check that the benchmark compares every serializer at every page size
+
+        Args:
+            objects: A fixture that creates goals with comments on several boards
+
+        Checks:
+            - A line is reported for every serializer and page size
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        output = io.StringIO()
+
+        call_command("benchmark_serializers", "--sizes", "1", "10", "--repeat", "2", stdout=output)
+
+        assert len(output.getvalue().splitlines()) == 8, "Не все замеры выполнены"
@@ -0,0 +1,219 @@
+import json
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+
+from goals.serializers.category import GoalCategorySerializer
+from goals.serializers.comment import GoalCommentSerializer
+from goals.serializers.goal import GoalSerializer
+from tests.factories import (
+    BoardFactory, GoalCategoryFactory, BoardParticipantFactory, GoalCommentFactory, GoalFactory
+)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create fixtures
+@pytest.fixture
+def goal(user):
+    """A fixture that creates a goal on a board of the user"""
+    board = BoardFactory()
+    BoardParticipantFactory(board=board, user=user)
+    return GoalFactory(category=GoalCategoryFactory(board=board))
+
+
+@pytest.fixture
+def forbid_serialization(monkeypatch):
+    """A fixture that returns a function failing the test on further serialization of goals, categories or comments"""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Выполнена сериализация")
+
+    def forbid() -> None:
+        monkeypatch.setattr(GoalSerializer, "to_representation", fail)
+        monkeypatch.setattr(GoalCategorySerializer, "to_representation", fail)
+        monkeypatch.setattr(GoalCommentSerializer, "to_representation", fail)
+
+    return forbid
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tests
+@pytest.mark.django_db
+class TestConditionalRequests:
+    """Tests for ETag and Last-Modified conditional requests"""
+
+    def test_goal_detail_not_modified(self, authenticated_user, goal) -> None:
+        """
+        Test to check that a goal detail is answered with 304 for a matching ETag
+        and with 200 after the goal changes
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            goal: A fixture that creates a goal on a board of the user
+
+        Checks:
+            - Response carries ETag and Last-Modified headers
+            - Matching ETag gets 304 with an empty body
+            - Changed goal gets 200 with a new ETag
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        url: str = reverse("goal", kwargs={"pk": goal.id})
+
+        first: Response = authenticated_user.get(url)
+        cached: Response = authenticated_user.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        authenticated_user.patch(
+            url, data=json.dumps({"title": "Новое название"}), content_type="application/json"
+        )
+        changed: Response = authenticated_user.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        assert "Last-Modified" in first, "Нет заголовка Last-Modified"
+        assert cached.status_code == status.HTTP_304_NOT_MODIFIED, "Неизмененная цель отправлена"
+        assert not cached.content, "Ответ 304 содержит тело"
+        assert changed.status_code == status.HTTP_200_OK, "Измененная цель не отправлена"
+        assert changed["ETag"] != first["ETag"], "ETag не изменился"
+
+    def test_goal_list_not_modified(self, authenticated_user, goal, forbid_serialization) -> None:
+        """
+        Test to check that an unchanged goal list is answered with 304 without serialization
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            goal: A fixture that creates a goal on a board of the user
+            forbid_serialization: A fixture that fails the test on serialization
+
+        Checks:
+            - Matching ETag gets 304 without serialization
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        url: str = reverse("goal_list")
+        etag: str = authenticated_user.head(url)["ETag"]
+        forbid_serialization()
+
+        response: Response = authenticated_user.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED, "Неизмененный список отправлен"
+
+    def test_goal_list_etag_follows_changes(self, authenticated_user, goal) -> None:
+        """
+        Test to check that the goal list ETag depends on the parameters and the goals
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            goal: A fixture that creates a goal on a board of the user
+
+        Checks:
+            - Another page has another ETag
+            - New goal changes the ETag
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        url: str = reverse("goal_list")
+        etag: str = authenticated_user.get(url)["ETag"]
+
+        other_page: Response = authenticated_user.get(f"{url}?limit=1", HTTP_IF_NONE_MATCH=etag)
+        GoalFactory(category=goal.category)
+        changed: Response = authenticated_user.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert other_page.status_code == status.HTTP_200_OK, "ETag не зависит от параметров"
+        assert changed.status_code == status.HTTP_200_OK, "ETag не зависит от целей"
+
+    def test_category_list_not_modified_since(self, authenticated_user, goal, forbid_serialization) -> None:
+        """
+        Test to check that a category list is answered with 304 for a matching If-Modified-Since
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            goal: A fixture that creates a goal on a board of the user
+            forbid_serialization: A fixture that fails the test on serialization
+
+        Checks:
+            - Response status code is 304
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        url: str = reverse("category_list")
+        last_modified: str = authenticated_user.head(url)["Last-Modified"]
+        forbid_serialization()
+
+        response: Response = authenticated_user.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED, "Неизмененный список отправлен"
+
+    def test_list_etag_follows_removals(self, authenticated_user, goal) -> None:
+        """
+        Test to check that removing an object changes the list ETag
+        even when the newest update of the list stays the same
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            goal: A fixture that creates a goal on a board of the user
+
+        Checks:
+            - Archiving an older goal keeps Last-Modified and changes the ETag
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        GoalFactory(category=goal.category)
+        url: str = reverse("goal_list")
+        first: Response = authenticated_user.get(url)
+
+        authenticated_user.delete(reverse("goal", kwargs={"pk": goal.id}))
+        archived: Response = authenticated_user.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        assert archived["Last-Modified"] == first["Last-Modified"], "Изменилось время последнего обновления"
+        assert archived.status_code == status.HTTP_200_OK, "ETag не зависит от удаления"
+
+    def test_comment_list_not_modified(self, authenticated_user, goal, forbid_serialization) -> None:
+        """
+        Test to check that the uncached comment list is answered with 304 without serialization
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            goal: A fixture that creates a goal on a board of the user
+            forbid_serialization: A fixture that fails the test on serialization
+
+        Checks:
+            - Matching ETag gets 304 with a single query and without serialization
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        GoalCommentFactory(goal=goal)
+        url: str = reverse("comment_list")
+        etag: str = authenticated_user.get(url)["ETag"]
+        forbid_serialization()
+
+        with CaptureQueriesContext(connection) as queries:
+            response: Response = authenticated_user.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED, "Неизмененный список отправлен"
+        assert len(queries) == 1, "Выполнены лишние запросы"
@@ -0,0 +1,243 @@
+import json
+from typing import Iterator
+
+import pytest
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+
+from goals.events import STREAM_BUSY_RETRY, EventBroker, NotifyListener, broker, send_events
+from goals.models.board import BoardParticipant
+from tests.factories import BoardFactory, BoardParticipantFactory, GoalCategoryFactory, GoalFactory
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create fixtures
+@pytest.fixture
+def local_events(settings) -> None:
+    """A fixture that delivers events within the process with short heartbeats"""
+    settings.EVENTS_NOTIFY = False
+    settings.EVENTS_HEARTBEAT = 0.05
+
+
+@pytest.fixture
+def category(user):
+    """A fixture that creates a category on a board of the user"""
+    board = BoardFactory()
+    BoardParticipantFactory(board=board, user=user)
+    return GoalCategoryFactory(board=board)
+
+
+def _open_stream(client) -> tuple:
+    """Opens the event stream and reads its preamble"""
+    response: Response = client.get(reverse("events"), HTTP_ACCEPT="text/event-stream")
+    stream: Iterator[bytes] = iter(response.streaming_content)
+    assert next(stream).startswith(b"retry:"), "Поток не открыт"
+    return response, stream
+
+
+def _read_event(stream: Iterator[bytes]) -> dict:
+    """Reads the next event of the stream, skipping heartbeats"""
+    message: str = next(stream).decode()
+    while message.startswith(":"):
+        message = next(stream).decode()
+
+    fields: dict = dict(line.split(": ", 1) for line in message.strip().split("\n"))
+    return {"event": fields["event"], **json.loads(fields["data"])}
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tests
+@pytest.mark.django_db
+class TestEventStream:
+    """Tests for the Server-Sent Events stream of board changes"""
+
+    def test_stream_board_events(
+        self, authenticated_user, user, category, local_events, django_capture_on_commit_callbacks
+    ) -> None:
+        """
+        Test to check that the stream delivers events of the boards of the user once their changes commit
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+            category: A fixture that creates a category on a board of the user
+            local_events: A fixture that delivers events within the process with short heartbeats
+            django_capture_on_commit_callbacks: A fixture that runs the callbacks of the commit
+
+        Checks:
+            - Response status code is 200
+            - Events of foreign boards are not delivered
+            - A board the user joins is followed by the stream
+            - Closing the stream ends the subscription
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        goal = GoalFactory(category=category)
+        other_goal = GoalFactory()
+        response, stream = _open_stream(authenticated_user)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            GoalFactory(board=other_goal.board, category=other_goal.category)
+            authenticated_user.patch(
+                reverse("goal", kwargs={"pk": goal.id}),
+                data=json.dumps({"title": "Новое название"}),
+                content_type="application/json",
+            )
+        updated: dict = _read_event(stream)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            BoardParticipantFactory(board=other_goal.board, user=user, role=BoardParticipant.Role.viewer)
+            authenticated_user.delete(reverse("goal", kwargs={"pk": goal.id}))
+            other_goal.save()
+        joined, archived, followed = _read_event(stream), _read_event(stream), _read_event(stream)
+        response.close()
+
+        assert response.status_code == status.HTTP_200_OK, "Поток не открыт"
+        assert response["Content-Type"].startswith("text/event-stream"), "Неверный тип ответа"
+        assert updated == {
+            "event": "goal.updated",
+            "type": "goal.updated",
+            "board": category.board_id,
+            "ids": [goal.id],
+            "cursor": updated["cursor"],
+        }, "Событие не совпадает"
+        assert (joined["event"], joined["users"]) == ("participant.changed", [user.id]), "Нет события участника"
+        assert (archived["event"], archived["ids"]) == ("goal.archived", [goal.id]), "Нет события архивации"
+        assert (followed["board"], followed["ids"]) == (other_goal.board_id, [other_goal.id]), "Доска не отслежена"
+        assert not broker.subscriptions, "Подписка не закрыта"
+
+    def test_stream_heartbeat_and_overflow(self, authenticated_user, category, local_events, settings) -> None:
+        """
+        Test to check that an idle stream sends heartbeats and a slow client is told to resync
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            category: A fixture that creates a category on a board of the user
+            local_events: A fixture that delivers events within the process with short heartbeats
+            settings: A fixture that overrides the settings
+
+        Checks:
+            - An idle stream sends a heartbeat
+            - A full queue ends the stream with a resync event
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        settings.EVENTS_QUEUE_SIZE = 2
+        response, stream = _open_stream(authenticated_user)
+        heartbeat: bytes = next(stream)
+
+        send_events(
+            [{"type": "goal.updated", "board": category.board_id, "ids": [index], "cursor": "0"} for index in range(3)]
+        )
+
+        assert heartbeat == b": heartbeat\n\n", "Нет сигнала активности"
+        assert next(stream).startswith(b"event: resync"), "Нет запроса синхронизации"
+        assert next(stream, None) is None, "Поток не закрыт"
+        response.close()
+
+    def test_stream_limit(self, authenticated_user, category, local_events, settings) -> None:
+        """
+        Test to check that a worker refuses streams over EVENTS_MAX_STREAMS until a stream closes
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            category: A fixture that creates a category on a board of the user
+            local_events: A fixture that delivers events within the process with short heartbeats
+            settings: A fixture that overrides the settings
+
+        Checks:
+            - A stream over the limit gets 503 with Retry-After
+            - A stream opens again once another one is closed
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        settings.EVENTS_MAX_STREAMS = 1
+        settings.EVENTS_STREAM_TIMEOUT = 0
+        _, stream = _open_stream(authenticated_user)
+        refused: Response = authenticated_user.get(reverse("events"), HTTP_ACCEPT="text/event-stream")
+        # The stream times out and is closed by the client
+        list(stream)
+        reopened, stream = _open_stream(authenticated_user)
+        list(stream)
+
+        assert refused.status_code == status.HTTP_503_SERVICE_UNAVAILABLE, "Лимит потоков не соблюден"
+        assert refused["Retry-After"] == str(STREAM_BUSY_RETRY), "Нет заголовка Retry-After"
+        assert reopened.status_code == status.HTTP_200_OK, "Поток не открыт после закрытия"
+        assert not broker.subscriptions, "Подписка не закрыта"
+
+
+# ----------------------------------------------------------------
+@pytest.mark.django_db(transaction=True)
+def test_notify_bridge(settings) -> None:
+    """
+    Test to check that events sent through PostgreSQL reach the broker of the listener
+
+    Args:
+        settings: A fixture that overrides the settings
+
+    Checks:
+        - The first subscription starts the listener
+        - The event sent with NOTIFY is queued for the subscription of its board
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError
+    """
+    settings.EVENTS_NOTIFY = True
+    worker_broker = EventBroker()
+    subscription = worker_broker.subscribe(1, (7,))
+    listener: NotifyListener = worker_broker.listener
+    try:
+        assert listener.connected.wait(5), "Соединение не установлено"
+        event: dict = {"type": "goal.created", "board": 7, "ids": [1], "cursor": "0"}
+
+        send_events([event])
+
+        assert subscription.queue.get(timeout=5) == event, "Событие не доставлено"
+    finally:
+        listener.stop()
+        listener.join(5)
+
+
+# ----------------------------------------------------------------
+@pytest.mark.django_db(transaction=True)
+def test_stream_releases_connection(authenticated_user, category, local_events) -> None:
+    """
+    Test to check that an open stream does not keep the database connection of its request
+
+    Args:
+        authenticated_user: API client with authenticated user for testing
+        category: A fixture that creates a category on a board of the user
+        local_events: A fixture that delivers events within the process with short heartbeats
+
+    Checks:
+        - The connection is closed while the stream is open
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError
+    """
+    response, stream = _open_stream(authenticated_user)
+    closed: bool = connection.connection is None
+    next(stream)
+    response.close()
+
+    assert closed, "Соединение открыто во время потока"
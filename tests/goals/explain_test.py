@@ -0,0 +1,178 @@
+from types import SimpleNamespace
+
+import pytest
+from django.db import connection
+from django.db.models import QuerySet
+
+from goals.views.board import BoardListView
+from goals.views.category import GoalCategoryListView
+from goals.views.comment import GoalCommentListView
+from goals.views.goal import GoalListView
+from tests.factories import BoardFactory, GoalCategoryFactory, BoardParticipantFactory, GoalFactory, GoalCommentFactory
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Skip the module on databases without Postgres query plans
+pytestmark = pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="EXPLAIN plans are Postgres specific"
+)
+
+ANALYZED_TABLES: tuple = (
+    "goals_board",
+    "goals_boardparticipant",
+    "goals_goalcategory",
+    "goals_goal",
+    "goals_goalcomment",
+)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create fixtures
+@pytest.fixture
+def seeded_board(user):
+    """A fixture that creates a board with a category, a goal and a comment for the user"""
+    board = BoardFactory()
+    category = GoalCategoryFactory(board=board)
+    goal = GoalFactory(category=category)
+    GoalCommentFactory(goal=goal)
+    BoardParticipantFactory(board=board, user=user)
+    return board
+
+
+def _explain(view_class, user, *ordering: str, **filters) -> str:
+    """
+    Returns the plan of the list view queryset with fresh statistics and sequential scans discouraged,
+    so a sequential scan is left in the plan only when no index matches the predicates
+    """
+    view = view_class()
+    view.request = SimpleNamespace(user=user)
+    queryset: QuerySet = view.get_queryset().filter(**filters).order_by(*ordering)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {', '.join(ANALYZED_TABLES)}")
+        cursor.execute("SET LOCAL enable_seqscan = off")
+
+    return queryset.explain()
+
+
+def _assert_valid_index(name: str) -> None:
+    """
+    Checks that the index exists and is valid, the choice between matching indexes
+    depends on the statistics, so the plans are not checked for a particular index
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT indisvalid FROM pg_index JOIN pg_class ON pg_class.oid = pg_index.indexrelid WHERE relname = %s",
+            [name],
+        )
+        row = cursor.fetchone()
+
+    assert row is not None, f"Нет индекса {name}"
+    assert row[0], f"Индекс {name} не готов"
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tests
+@pytest.mark.django_db
+class TestVisibilityIndexes:
+    """Tests for the indexes used by the visibility queries of list views"""
+
+    def test_goal_list_plan(self, user, seeded_board) -> None:
+        """
+        Test to check that the goal list query is served by indexes
+        and the partial goal index is ready
+
+        Args:
+            user: A fixture that creates a user instance
+            seeded_board: A fixture that creates a board with goals
+
+        Checks:
+            - Plan has no sequential scans
+            - Index 'goal_active_board_idx' exists and is valid
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        plan: str = _explain(GoalListView, user, "-priority", "due_date")
+
+        assert "Seq Scan" not in plan, "Запрос целей сканирует таблицу"
+        _assert_valid_index("goal_active_board_idx")
+
+    def test_goal_filter_plan(self, user, seeded_board) -> None:
+        """
+        Test to check that the GoalDateFilter predicates are served by indexes
+
+        Args:
+            user: A fixture that creates a user instance
+            seeded_board: A fixture that creates a board with goals
+
+        Checks:
+            - Plan has no sequential scans
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        plan: str = _explain(
+            GoalListView,
+            user,
+            "-priority",
+            "due_date",
+            due_date__gte="2020-01-01",
+            due_date__lte="2030-12-31",
+            status__in=[1, 2],
+            priority__in=[3, 4],
+        )
+
+        assert "Seq Scan" not in plan, "Фильтр целей сканирует таблицу"
+
+    def test_comment_list_plan(self, user, seeded_board) -> None:
+        """
+        Test to check that the comment list query joins the board, the goal and its category by indexes
+
+        Args:
+            user: A fixture that creates a user instance
+            seeded_board: A fixture that creates a board with goals
+
+        Checks:
+            - Plan has no sequential scans
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        plan: str = _explain(GoalCommentListView, user, "-created")
+
+        assert "Seq Scan" not in plan, "Запрос комментариев сканирует таблицу"
+
+    def test_category_board_list_plans(self, user, seeded_board) -> None:
+        """
+        Test to check that category and board list queries are served by indexes
+        and the partial category index on non-deleted rows is ready
+
+        Args:
+            user: A fixture that creates a user instance
+            seeded_board: A fixture that creates a board with goals
+
+        Checks:
+            - Plans have no sequential scans
+            - Index 'category_active_board_idx' exists and is valid
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        category_plan: str = _explain(GoalCategoryListView, user, "title")
+        board_plan: str = _explain(BoardListView, user, "title")
+
+        assert "Seq Scan" not in category_plan, "Запрос категорий сканирует таблицу"
+        assert "Seq Scan" not in board_plan, "Запрос досок сканирует таблицу"
+        _assert_valid_index("category_active_board_idx")
@@ -0,0 +1,144 @@
+from types import SimpleNamespace
+
+import pytest
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+
+from goals.models.goal import Goal
+from tests.factories import (
+    BoardFactory,
+    GoalCategoryFactory,
+    BoardParticipantFactory,
+    GoalFactory,
+    GoalCommentFactory,
+)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create fixtures
+@pytest.fixture
+def searchable_board(user):
+    """A fixture that creates a board with a category, goals and a comment mentioning a flat"""
+    board = BoardFactory(title="Домашние дела")
+    BoardParticipantFactory(board=board, user=user)
+    category = GoalCategoryFactory(board=board, title="Ремонт квартиры")
+    goal = GoalFactory(category=category, title="Покрасить стены", description="Краска для квартиры")
+    GoalCommentFactory(goal=goal, text="Ждем мастера для квартиры")
+    GoalFactory(category=category, title="Квартира", status=Goal.Status.archived)
+    return board
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tests
+@pytest.mark.django_db
+class TestGlobalSearchView:
+    """Tests for the global search view"""
+
+    url: str = reverse("search")
+
+    @pytest.mark.skipif(connection.vendor != "postgresql", reason="Full-text search is Postgres specific")
+    def test_search_visible_objects(self, authenticated_user, searchable_board) -> None:
+        """
+        Test to check that the search finds every type of objects by a word form
+        and hides archived goals and boards of other users
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            searchable_board: A fixture that creates a board with searchable objects
+
+        Checks:
+            - Response status code is 200
+            - Category, goal and comment of the board are found, the category first
+            - Archived goal and foreign objects are not found
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        GoalCategoryFactory(title="Квартира соседа")
+
+        response: Response = authenticated_user.get(self.url, {"search": "квартира"})
+        results: list = response.data["results"]
+
+        assert response.status_code == status.HTTP_200_OK, "Запрос не прошел"
+        assert response.data["count"] == 3, "Количество результатов не совпадает"
+        assert results[0]["type"] == "category", "Ранжирование не совпадает"
+        assert {result["board"] for result in results} == {searchable_board.id}, "Получены чужие объекты"
+
+    @pytest.mark.skipif(connection.vendor != "postgresql", reason="Full-text search is Postgres specific")
+    def test_search_follows_updates(self, authenticated_user, searchable_board) -> None:
+        """
+        Test to check that the search vector is rebuilt when a board is renamed
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            searchable_board: A fixture that creates a board with searchable objects
+
+        Checks:
+            - Board is found by the new title and not by the old one
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        searchable_board.title = "Отпуск"
+        searchable_board.save(update_fields=("title",))
+
+        found: Response = authenticated_user.get(self.url, {"search": "отпуск"})
+        missing: Response = authenticated_user.get(self.url, {"search": "домашние"})
+
+        assert [result["id"] for result in found.data["results"]] == [searchable_board.id], "Доска не найдена"
+        assert missing.data["count"] == 0, "Найдено старое название"
+
+    def test_search_fallback(self, authenticated_user, searchable_board, monkeypatch) -> None:
+        """
+        Test to check that databases without full-text search fall back to a substring search
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            searchable_board: A fixture that creates a board with searchable objects
+            monkeypatch: A fixture that patches the database vendor
+
+        Checks:
+            - Response status code is 200
+            - Objects containing the query are found
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        monkeypatch.setattr("goals.views.search.connection", SimpleNamespace(vendor="sqlite"))
+
+        response: Response = authenticated_user.get(self.url, {"search": "кварти"})
+        found: set = {result["type"] for result in response.data["results"]}
+
+        assert response.status_code == status.HTTP_200_OK, "Запрос не прошел"
+        assert found == {"category", "goal", "comment"}, "Поиск не совпадает"
+
+    def test_search_deny(self, api_client) -> None:
+        """
+        Test that unauthenticated users cannot access the search API endpoint
+
+        Args:
+            api_client: API client without user for testing
+
+        Checks:
+            - Response status code is 403
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        response: Response = api_client.get(self.url, {"search": "квартира"})
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN, "Отказ в доступе не предоставлен"
@@ -0,0 +1,175 @@
+import json
+from typing import List
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+
+from goals.models.board import BoardParticipant
+from goals.models.goal import Goal
+from goals.models.goal_comment import GoalComment
+from tests.factories import (
+    BoardFactory,
+    BoardParticipantFactory,
+    GoalCategoryFactory,
+    GoalCommentFactory,
+    GoalFactory,
+)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tests
+@pytest.mark.django_db
+class TestGoalBulkViews:
+    """Tests for Goal bulk create, update and archive views"""
+
+    def test_goal_bulk_create(self, authenticated_user, user, due_date, django_assert_max_num_queries) -> None:
+        """
+        Test to check that valid goals are created with a fixed number of queries
+        and invalid ones are reported with their indexes
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+            due_date: A fixture that creates a date with the timedelta from the current date
+            django_assert_max_num_queries: A fixture that counts database queries
+
+        Checks:
+            - Response status code is 201
+            - Valid goals are created on the board of the category with timestamps
+            - Goals in a foreign category and without a title are reported
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        category = GoalCategoryFactory(board=board)
+        BoardParticipantFactory(board=board, user=user)
+        foreign_category = GoalCategoryFactory()
+
+        items: List[dict] = [
+            {"category": category.id, "title": f"Цель {number}", "due_date": due_date} for number in range(50)
+        ]
+        items += [
+            {"category": foreign_category.id, "title": "Чужая цель", "due_date": due_date},
+            {"category": category.id, "due_date": due_date},
+        ]
+
+        with django_assert_max_num_queries(6):
+            response: Response = authenticated_user.post(
+                reverse("goal_bulk_create"), data=json.dumps(items), content_type="application/json"
+            )
+        goals = Goal.objects.filter(category=category)
+
+        assert response.status_code == status.HTTP_201_CREATED, "Цели не создались"
+        assert len(response.data["created"]) == goals.count() == 50, "Количество целей не совпадает"
+        assert not goals.exclude(board=board).exists(), "Доска целей не совпадает"
+        assert not goals.filter(created__isnull=True).exists(), "Дата создания не установлена"
+        assert not goals.filter(search_vector__isnull=True).exists(), "Поисковый вектор не установлен"
+        assert [error["index"] for error in response.data["errors"]] == [50, 51], "Ошибки не совпадают"
+
+    def test_goal_bulk_update(self, authenticated_user, user, django_assert_max_num_queries) -> None:
+        """
+        Test to check that status and priority of editable goals are changed with a single update
+        and the other goals are reported
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+            django_assert_max_num_queries: A fixture that counts database queries
+
+        Checks:
+            - Response status code is 200
+            - Editable goals are changed
+            - Goals of a board where the user is a viewer and of a foreign board are not changed
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        BoardParticipantFactory(board=board, user=user)
+        goals = GoalFactory.create_batch(size=3, category=GoalCategoryFactory(board=board))
+        viewer_board = BoardFactory()
+        BoardParticipantFactory(board=viewer_board, user=user, role=BoardParticipant.Role.viewer)
+        viewer_goal = GoalFactory(category=GoalCategoryFactory(board=viewer_board))
+        foreign_goal = GoalFactory()
+
+        data: dict = {
+            "ids": [goal.id for goal in goals] + [viewer_goal.id, foreign_goal.id],
+            "status": Goal.Status.done,
+            "priority": Goal.Priority.critical,
+        }
+
+        with django_assert_max_num_queries(7):
+            response: Response = authenticated_user.patch(
+                reverse("goal_bulk_update"), data=json.dumps(data), content_type="application/json"
+            )
+
+        assert response.status_code == status.HTTP_200_OK, "Запрос не прошел"
+        assert response.data["updated"] == [goal.id for goal in goals], "Измененные цели не совпадают"
+        assert Goal.objects.filter(status=Goal.Status.done, priority=Goal.Priority.critical).count() == 3
+        assert [error["id"] for error in response.data["errors"]] == [viewer_goal.id, foreign_goal.id]
+
+    def test_goal_bulk_update_archive_denied(self, authenticated_user) -> None:
+        """
+        Test to check that goals cannot be archived through the bulk update
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+
+        Checks:
+            - Response status code is 400
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        response: Response = authenticated_user.patch(
+            reverse("goal_bulk_update"),
+            data=json.dumps({"ids": [1], "status": Goal.Status.archived}),
+            content_type="application/json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, "Архивирование не запрещено"
+
+    def test_goal_bulk_archive(self, authenticated_user, user) -> None:
+        """
+        Test to check that goals are archived and their comments are deleted
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+
+        Checks:
+            - Response status code is 200
+            - Goals are archived and their comments are deleted
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        BoardParticipantFactory(board=board, user=user)
+        goals = GoalFactory.create_batch(size=2, category=GoalCategoryFactory(board=board))
+        GoalCommentFactory(goal=goals[0])
+
+        response: Response = authenticated_user.post(
+            reverse("goal_bulk_archive"),
+            data=json.dumps({"ids": [goal.id for goal in goals]}),
+            content_type="application/json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK, "Запрос не прошел"
+        assert Goal.objects.filter(status=Goal.Status.archived).count() == 2, "Цели не архивированы"
+        assert not GoalComment.objects.exists(), "Комментарии не удалены"
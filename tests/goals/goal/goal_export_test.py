@@ -0,0 +1,127 @@
+import csv
+import gzip
+import io
+import json
+from typing import List
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from goals.export import GOAL_EXPORT_FIELDS
+from goals.models.goal import Goal
+from goals.serializers.goal import GoalSerializer
+from tests.factories import BoardFactory, BoardParticipantFactory, GoalCategoryFactory, GoalFactory
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tests
+@pytest.mark.django_db
+class TestGoalExportView:
+    """Tests for Goal export view"""
+
+    url: str = reverse("goal_export")
+
+    def test_export_ndjson(self, authenticated_user, user, settings) -> None:
+        """
+        Test to check that goals the user can see are streamed as NDJSON
+        in the order of the goal list, in several chunks
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+            settings: A fixture that overrides Django settings
+
+        Checks:
+            - Response is streamed in chunks
+            - Foreign and archived goals are not exported
+            - Values match the goal serializer
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        settings.EXPORT_CHUNK_SIZE = 2
+        board = BoardFactory()
+        category = GoalCategoryFactory(board=board)
+        BoardParticipantFactory(board=board, user=user)
+        goals: List[Goal] = GoalFactory.create_batch(size=5, category=category)
+        GoalFactory(category=category, status=Goal.Status.archived)
+        GoalFactory()
+
+        response = authenticated_user.get(self.url, HTTP_ACCEPT="application/x-ndjson")
+        chunks: List[bytes] = list(response.streaming_content)
+        rows: List[dict] = [json.loads(line) for line in b"".join(chunks).decode().splitlines()]
+        expected: dict = {goal["id"]: goal for goal in GoalSerializer(goals, many=True).data}
+
+        assert response.status_code == status.HTTP_200_OK, "Запрос не прошел"
+        assert response["Content-Type"].startswith("application/x-ndjson"), "Формат не совпадает"
+        assert len(chunks) == 3, "Выгрузка не разбита на части"
+        assert sorted(row["id"] for row in rows) == sorted(expected), "Цели не совпадают"
+        assert [row["priority"] for row in rows] == sorted(row["priority"] for row in expected.values())[::-1]
+        for row in rows:
+            assert row["title"] == expected[row["id"]]["title"], "Заголовок не совпадает"
+            assert row["updated"] == expected[row["id"]]["updated"], "Дата изменения не совпадает"
+            assert row["username"] == expected[row["id"]]["user"]["username"], "Автор не совпадает"
+
+    def test_export_csv_filtered_gzip(self, authenticated_user, user) -> None:
+        """
+        Test to check that the export accepts the filters and search of the goal list
+        and is compressed with gzip when the client accepts it
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+
+        Checks:
+            - Response is gzip-compressed CSV with a header line
+            - Only goals matching the filter and the search are exported
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        category = GoalCategoryFactory(board=board)
+        BoardParticipantFactory(board=board, user=user)
+        goal = GoalFactory(category=category, title="Выгрузка отчета", priority=Goal.Priority.high)
+        GoalFactory(category=category, title="Выгрузка отчета", priority=Goal.Priority.low)
+        GoalFactory(category=category, title="Другая цель", priority=Goal.Priority.high)
+
+        response = authenticated_user.get(
+            self.url,
+            {"format": "csv", "priority": Goal.Priority.high, "search": "выгрузка"},
+            HTTP_ACCEPT_ENCODING="gzip, deflate",
+        )
+        content: str = gzip.decompress(b"".join(response.streaming_content)).decode()
+        rows: List[list] = list(csv.reader(io.StringIO(content)))
+
+        assert response.status_code == status.HTTP_200_OK, "Запрос не прошел"
+        assert response["Content-Encoding"] == "gzip", "Выгрузка не сжата"
+        assert rows[0] == list(GOAL_EXPORT_FIELDS), "Заголовок не совпадает"
+        assert [int(row[0]) for row in rows[1:]] == [goal.id], "Цели не совпадают"
+        assert rows[1][GOAL_EXPORT_FIELDS.index("title")] == goal.title, "Заголовок цели не совпадает"
+
+    def test_export_unauthenticated(self, api_client) -> None:
+        """
+        Test to check that unauthenticated user cannot export goals
+
+        Args:
+            api_client: API client without authentication
+
+        Checks:
+            - Response status code is 403
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        response = api_client.get(self.url)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN, "Отказ в доступе не предоставлен"
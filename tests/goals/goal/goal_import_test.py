@@ -0,0 +1,131 @@
+import io
+
+import pytest
+from django.contrib.postgres.search import SearchQuery
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+
+from goals.models.board import BoardParticipant
+from goals.models.goal import Goal
+from goals.models.mixins import SEARCH_CONFIG
+from goals.stats import verify_goal_stats
+from tests.factories import BoardFactory, BoardParticipantFactory, GoalCategoryFactory
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tests
+@pytest.mark.django_db
+class TestGoalImport:
+    """Tests for Goal import view and command"""
+
+    url: str = reverse("goal_import")
+
+    def test_goal_import(self, authenticated_user, user, due_date, django_assert_max_num_queries) -> None:
+        """
+        Test to check that valid rows of a CSV file are imported with a fixed number of queries
+        and invalid rows are reported with their line numbers
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+            due_date: A fixture that creates a date with the timedelta from the current date
+            django_assert_max_num_queries: A fixture that counts database queries
+
+        Checks:
+            - Response status code is 201
+            - Valid goals are created on the board of the category with timestamps and search vectors
+            - Rows with a foreign category, a read-only category and without a title are reported
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        category = GoalCategoryFactory(board=board)
+        BoardParticipantFactory(board=board, user=user)
+        viewer_board = BoardFactory()
+        viewer_category = GoalCategoryFactory(board=viewer_board)
+        BoardParticipantFactory(board=viewer_board, user=user, role=BoardParticipant.Role.viewer)
+        foreign_category = GoalCategoryFactory()
+
+        lines: list = ["category,title,description,priority,due_date"]
+        lines += [f"{category.id},Цель {number},Описание,4,{due_date}" for number in range(100)]
+        lines += [
+            f"{foreign_category.id},Чужая цель,,,{due_date}",
+            f"{viewer_category.id},Цель зрителя,,,{due_date}",
+            f"{category.id},,,,{due_date}",
+        ]
+        file = io.BytesIO("\n".join(lines).encode())
+        file.name = "goals.csv"
+
+        with django_assert_max_num_queries(10):
+            response: Response = authenticated_user.post(self.url, {"file": file}, format="multipart")
+        goals = Goal.objects.filter(category=category)
+
+        assert response.status_code == status.HTTP_201_CREATED, "Цели не импортировались"
+        assert response.data["imported"] == goals.count() == 100, "Количество целей не совпадает"
+        assert not goals.exclude(board=board, user=user, priority=Goal.Priority.critical).exists()
+        assert not goals.filter(created__isnull=True).exists(), "Дата создания не установлена"
+        query = SearchQuery("описание", config=SEARCH_CONFIG)
+        assert goals.filter(search_vector=query).count() == 100, "Поисковый вектор не установлен"
+        assert [error["line"] for error in response.data["errors"]] == [102, 103, 104], "Ошибки не совпадают"
+        assert response.data["rows_per_second"] > 0, "Скорость импорта не указана"
+        assert verify_goal_stats(Goal.objects.all()) == {}, "Статистика расходится с целями"
+
+    def test_goal_import_missing_columns(self, authenticated_user) -> None:
+        """
+        Test to check that a file without required columns is rejected
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+
+        Checks:
+            - Response status code is 400
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        file = io.BytesIO("title\nЦель".encode())
+        file.name = "goals.csv"
+
+        response: Response = authenticated_user.post(self.url, {"file": file}, format="multipart")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, "Файл принят"
+
+    def test_goal_import_command(self, user, due_date, tmp_path) -> None:
+        """
+        Test to check that the management command imports goals and reports the speed
+
+        Args:
+            user: A fixture that creates a user instance
+            due_date: A fixture that creates a date with the timedelta from the current date
+            tmp_path: A fixture that creates a temporary directory
+
+        Checks:
+            - Goals are created
+            - Output reports the number of imported goals
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        category = GoalCategoryFactory(board=board)
+        BoardParticipantFactory(board=board, user=user)
+        path = tmp_path / "goals.csv"
+        path.write_text(f"category,title,due_date\n{category.id},Цель,{due_date}\n", encoding="utf-8")
+        output = io.StringIO()
+
+        call_command("import_goals", str(path), user=user.username, stdout=output)
+
+        assert Goal.objects.filter(category=category, title="Цель").exists(), "Цель не импортировалась"
+        assert "Импортировано целей: 1" in output.getvalue(), "Результат не выведен"
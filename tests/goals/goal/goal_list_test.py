@@ -5,9 +5,11 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.response import Response
 
+from goals.models.board import Board
 from goals.models.goal import Goal
+from goals.models.goal_category import GoalCategory
 from goals.serializers.goal import GoalSerializer
-from tests.factories import BoardFactory, GoalCategoryFactory, BoardParticipantFactory, GoalFactory
+from tests.factories import BoardFactory, BoardParticipantFactory, GoalCategoryFactory, GoalCommentFactory, GoalFactory
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -85,6 +87,54 @@ class TestGoalListView:
         assert response.status_code == status.HTTP_200_OK, "Запрос не прошел"
         assert not response.data == unexpected_response, "Получены удаленные цели"
 
+    # ----------------------------------------------------------------
+    @pytest.mark.django_db
+    def test_goals_of_deleted_containers_hidden(self, authenticated_user, user) -> None:
+        """
+        Test to check that goals of boards and categories deleted without the views stay hidden,
+        even though the goals were not archived
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+
+        Checks:
+            - Goals of a deleted board or category are not in the goal list
+            - Such goals and their comments cannot be retrieved
+            - Goals of the other boards stay visible
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board, deleted_board = BoardFactory(), BoardFactory()
+        visible_goal = GoalFactory(category__board=board)
+        hidden_goals = [
+            GoalFactory(category__board=deleted_board),
+            GoalFactory(category=GoalCategoryFactory(board=board)),
+        ]
+        comments = [GoalCommentFactory(goal=goal) for goal in hidden_goals]
+        BoardParticipantFactory(board=board, user=user)
+        BoardParticipantFactory(board=deleted_board, user=user)
+
+        Board.objects.filter(id=deleted_board.id).update(is_deleted=True)
+        GoalCategory.objects.filter(id=hidden_goals[1].category_id).update(is_deleted=True)
+        response: Response = authenticated_user.get(self.url)
+
+        assert [goal["id"] for goal in response.data] == [visible_goal.id], "Получены скрытые цели"
+        assert not authenticated_user.get(reverse("comment_list")).data, "Получены комментарии скрытых целей"
+        for goal, comment in zip(hidden_goals, comments):
+            assert (
+                authenticated_user.get(reverse("goal", kwargs={"pk": goal.id})).status_code
+                == status.HTTP_404_NOT_FOUND
+            ), "Получена скрытая цель"
+            assert (
+                authenticated_user.get(reverse("comment", kwargs={"pk": comment.id})).status_code
+                == status.HTTP_404_NOT_FOUND
+            ), "Получен комментарий скрытой цели"
+
     # ----------------------------------------------------------------
     @pytest.mark.django_db
     def test_goal_list_not_participant(self, authenticated_user) -> None:
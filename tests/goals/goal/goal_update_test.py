@@ -7,7 +7,7 @@ from rest_framework.response import Response
 
 from goals.models.board import BoardParticipant
 from goals.models.goal import Goal
-from tests.factories import BoardFactory, GoalCategoryFactory, BoardParticipantFactory, GoalFactory
+from tests.factories import BoardFactory, GoalCategoryFactory, BoardParticipantFactory, GoalFactory, GoalCommentFactory
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -102,3 +102,76 @@ class TestGoalUpdateView:
             response.status_code == status.HTTP_403_FORBIDDEN
         ), "Отказ в доступе не предоставлен"
         assert not unexpected_goal, "Цель обновлена"
+
+    # ----------------------------------------------------------------
+    @pytest.mark.django_db
+    def test_goal_move_to_another_board(self, authenticated_user, user) -> None:
+        """
+        Test to check that moving a goal to a category of another board
+        moves the goal and its comments to that board
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+
+        Checks:
+            - Response status code is 200
+            - Goal board is the board of the new category
+            - Comment board is the board of the new category
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board, new_board = BoardFactory.create_batch(size=2)
+        goal = GoalFactory(category=GoalCategoryFactory(board=board))
+        comment = GoalCommentFactory(goal=goal)
+        new_category = GoalCategoryFactory(board=new_board)
+        BoardParticipantFactory(board=board, user=user)
+        BoardParticipantFactory(board=new_board, user=user)
+        url: str = reverse("goal", kwargs={"pk": goal.id})
+
+        response: Response = authenticated_user.patch(url, data={"category": new_category.id})
+
+        goal.refresh_from_db()
+        comment.refresh_from_db()
+
+        assert response.status_code == status.HTTP_200_OK, "Запрос не прошел"
+        assert goal.board_id == new_board.id, "Доска цели не обновлена"
+        assert comment.board_id == new_board.id, "Доска комментария не обновлена"
+
+    # ----------------------------------------------------------------
+    @pytest.mark.django_db
+    def test_goal_move_to_foreign_board(self, authenticated_user, user) -> None:
+        """
+        Test to check that authenticated user cannot move a goal
+        to a category of a board where user is not a participant
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+
+        Checks:
+            - Response status code is 400
+            - Goal stays on its board
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        goal = GoalFactory(category=GoalCategoryFactory(board=board))
+        foreign_category = GoalCategoryFactory()
+        BoardParticipantFactory(board=board, user=user)
+        url: str = reverse("goal", kwargs={"pk": goal.id})
+
+        response: Response = authenticated_user.patch(url, data={"category": foreign_category.id})
+
+        goal.refresh_from_db()
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, "Запрос прошел"
+        assert goal.board_id == board.id, "Цель перемещена на чужую доску"
@@ -0,0 +1,190 @@
+import io
+import json
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+
+from goals.models.goal import Goal
+from goals.models.goal_category import GoalCategory
+from goals.models.goal_stat import GoalStat
+from goals.stats import verify_goal_stats
+from tests.factories import BoardFactory, BoardParticipantFactory, GoalCategoryFactory, GoalFactory
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create fixtures
+@pytest.fixture
+def category(user):
+    """A fixture that creates a category on a board of the user"""
+    board = BoardFactory()
+    BoardParticipantFactory(board=board, user=user)
+    return GoalCategoryFactory(board=board)
+
+
+def _assert_stats_exact() -> None:
+    """Checks that the stored statistics match a recount of the goals"""
+    assert verify_goal_stats(Goal.objects.all()) == {}, "Статистика расходится с целями"
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tests
+@pytest.mark.django_db
+class TestGoalStats:
+    """Tests for the goal statistics by board, category, status and priority"""
+
+    def test_stats_follow_goal_writes(self, authenticated_user, user, category, due_date) -> None:
+        """
+        Test to check that the statistics follow every way goals are written
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+            category: A fixture that creates a category on a board of the user
+            due_date: A fixture that creates a date with the timedelta from the current date
+
+        Checks:
+            - Statistics match a recount after creating, updating, moving and archiving goals
+              one by one, in bulk and together with their categories and boards
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        other_category = GoalCategoryFactory(board=category.board)
+        goals = GoalFactory.create_batch(size=3, category=category)
+        _assert_stats_exact()
+
+        moved: Response = authenticated_user.patch(
+            reverse("goal", kwargs={"pk": goals[0].id}),
+            data=json.dumps({"status": Goal.Status.done, "category": other_category.id}),
+            content_type="application/json",
+        )
+        assert moved.status_code == status.HTTP_200_OK, "Цель не изменена"
+        _assert_stats_exact()
+
+        authenticated_user.delete(reverse("goal", kwargs={"pk": goals[1].id}))
+        _assert_stats_exact()
+
+        created: Response = authenticated_user.post(
+            reverse("goal_bulk_create"),
+            data=json.dumps([{"category": category.id, "title": "Цель", "due_date": due_date}] * 2),
+            content_type="application/json",
+        )
+        updated: Response = authenticated_user.patch(
+            reverse("goal_bulk_update"),
+            data=json.dumps({"ids": [goal.id for goal in goals], "priority": Goal.Priority.critical}),
+            content_type="application/json",
+        )
+        assert created.status_code == status.HTTP_201_CREATED, "Цели не созданы"
+        assert len(updated.data["updated"]) == 2, "Цели не изменены"
+        _assert_stats_exact()
+
+        authenticated_user.post(
+            reverse("goal_bulk_archive"), data=json.dumps({"ids": [goals[2].id]}), content_type="application/json"
+        )
+        _assert_stats_exact()
+
+        authenticated_user.delete(reverse("category", kwargs={"pk": other_category.id}))
+        _assert_stats_exact()
+
+        authenticated_user.delete(reverse("board", kwargs={"pk": category.board_id}))
+        _assert_stats_exact()
+        assert not Goal.objects.exclude(status=Goal.Status.archived).exists(), "Цели не заархивированы"
+
+        Goal.objects.filter(category=category).delete()
+        _assert_stats_exact()
+
+    def test_board_stats(self, authenticated_user, category, django_assert_max_num_queries) -> None:
+        """
+        Test to check that the numbers of active goals of a board are answered
+        from the statistics with a fixed number of queries
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            category: A fixture that creates a category on a board of the user
+            django_assert_max_num_queries: A fixture that counts database queries
+
+        Checks:
+            - Response status code is 200
+            - Numbers by status and priority match the active goals overall and per category
+            - Goals of a deleted category are left out
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        GoalFactory.create_batch(size=3, category=category, priority=Goal.Priority.high)
+        GoalFactory(category=category, status=Goal.Status.done, priority=Goal.Priority.low)
+        GoalFactory(category=category, status=Goal.Status.archived)
+        deleted_category = GoalCategoryFactory(board=category.board)
+        GoalFactory(category=deleted_category)
+        GoalCategory.objects.filter(id=deleted_category.id).update(is_deleted=True)
+
+        with django_assert_max_num_queries(3):
+            response: Response = authenticated_user.get(reverse("board_stats", kwargs={"pk": category.board_id}))
+
+        assert response.status_code == status.HTTP_200_OK, "Запрос не прошел"
+        assert response.data["total"] == 4, "Количество целей не совпадает"
+        assert response.data["by_status"] == {Goal.Status.to_do: 3, Goal.Status.done: 1}, "Статусы не совпадают"
+        assert response.data["by_priority"] == {Goal.Priority.high: 3, Goal.Priority.low: 1}
+        assert [item["category"] for item in response.data["categories"]] == [category.id], "Категории не совпадают"
+
+    def test_board_stats_not_participant(self, authenticated_user) -> None:
+        """
+        Test to check that the numbers of goals of a foreign board are not available
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+
+        Checks:
+            - Response status code is 404
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        BoardParticipantFactory(board=board)
+
+        response: Response = authenticated_user.get(reverse("board_stats", kwargs={"pk": board.id}))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND, "Получена чужая статистика"
+
+    def test_stats_command(self, category) -> None:
+        """
+        Test to check that the command detects statistics that drifted from the goals and rebuilds them
+
+        Args:
+            category: A fixture that creates a category on a board of the user
+
+        Checks:
+            - Verify fails on a drifted counter
+            - Verify passes after the rebuild
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        GoalFactory.create_batch(size=2, category=category)
+        GoalStat.objects.update(count=5)
+
+        with pytest.raises(CommandError):
+            call_command("goal_stats", "verify", stdout=io.StringIO(), stderr=io.StringIO())
+
+        call_command("goal_stats", "rebuild", stdout=io.StringIO())
+        output = io.StringIO()
+        call_command("goal_stats", "verify", stdout=output)
+
+        assert "совпадает" in output.getvalue(), "Статистика не пересчитана"
+        assert GoalStat.objects.get().count == 2, "Количество целей не совпадает"
@@ -0,0 +1,207 @@
+import json
+import time
+from typing import Callable
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+
+from goals.compiled import CompiledListMixin
+from goals.list_cache import get_list_cache_stats
+from goals.models.goal import Goal
+from tests.factories import BoardFactory, GoalCategoryFactory, BoardParticipantFactory, GoalFactory
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create fixtures
+@pytest.fixture
+def category(user):
+    """A fixture that creates a category on a board of the user"""
+    board = BoardFactory()
+    BoardParticipantFactory(board=board, user=user)
+    return GoalCategoryFactory(board=board)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tests
+@pytest.mark.django_db
+class TestListCache:
+    """Tests for the versioned cache of board, category and goal lists"""
+
+    url: str = reverse("goal_list")
+
+    def test_repeated_list_served_from_cache(
+        self, authenticated_user, category, django_assert_num_queries
+    ) -> None:
+        """
+        Test to check that a repeated request with the same parameters in any order
+        is served from the cache with the conditional request validators query only
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            category: A fixture that creates a category on a board of the user
+            django_assert_num_queries: A fixture that counts database queries
+
+        Checks:
+            - First response is a miss, second one is a hit with the same data
+            - Hit is counted in the cache stats
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        GoalFactory.create_batch(size=3, category=category)
+        hits: int = get_list_cache_stats()["hits"]
+
+        first: Response = authenticated_user.get(f"{self.url}?ordering=due_date&limit=2")
+        with django_assert_num_queries(1):
+            second: Response = authenticated_user.get(f"{self.url}?limit=2&ordering=due_date")
+
+        assert first["X-Cache"] == "MISS", "Первый запрос не промах"
+        assert second["X-Cache"] == "HIT", "Повторный запрос не из кэша"
+        assert second.data == first.data, "Данные из кэша не совпадают"
+        assert get_list_cache_stats()["hits"] == hits + 1, "Попадание в кэш не учтено"
+
+    def test_writes_expire_cached_lists(self, authenticated_user, category, due_date) -> None:
+        """
+        Test to check that creating a goal through the API or the ORM
+        and deleting the category expire the cached goal list
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            category: A fixture that creates a category on a board of the user
+            due_date: A fixture that creates a date for the goal
+
+        Checks:
+            - Every write is visible in the next response
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        assert authenticated_user.get(self.url).data == [], "Список не пуст"
+
+        authenticated_user.post(
+            reverse("goal_create"),
+            data=json.dumps({"title": "Цель", "category": category.id, "due_date": due_date}),
+            content_type="application/json",
+        )
+        assert len(authenticated_user.get(self.url).data) == 1, "Создание через API не учтено"
+
+        Goal.objects.create(user=category.user, category=category, title="Цель", due_date=due_date)
+        assert len(authenticated_user.get(self.url).data) == 2, "Создание через ORM не учтено"
+
+        authenticated_user.delete(reverse("category", kwargs={"pk": category.id}))
+        assert authenticated_user.get(self.url).data == [], "Архивирование не учтено"
+
+    def test_stale_list_revalidated_once(
+        self, authenticated_user, category, settings, monkeypatch
+    ) -> None:
+        """
+        Test to check that a stale list is refreshed by the request taking the lock
+        and served stale to the requests coming while the lock is held
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            category: A fixture that creates a category on a board of the user
+            settings: A fixture that overrides Django settings
+            monkeypatch: A fixture that holds the revalidation lock
+
+        Checks:
+            - Stale list is revalidated by the first request
+            - Stale list is served while another request revalidates it
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        settings.LIST_CACHE_STALE_AFTER = 0
+        url: str = reverse("category_list")
+
+        authenticated_user.get(url)
+        revalidated: Response = authenticated_user.get(url)
+
+        monkeypatch.setattr(cache, "add", lambda *args, **kwargs: False)
+        stale: Response = authenticated_user.get(url)
+
+        assert revalidated["X-Cache"] == "MISS", "Устаревший список не обновлен"
+        assert stale["X-Cache"] == "STALE", "Устаревший список не выдан"
+        assert stale.status_code == status.HTTP_200_OK, "Запрос не прошел"
+
+    def test_profile_update_expires_cached_lists(self, authenticated_user, user, category) -> None:
+        """
+        Test to check that updating the profile of a user shown in a cached list expires the list
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+            category: A fixture that creates a category on a board of the user
+
+        Checks:
+            - The list shows the updated username
+            - Saving the last login keeps the cached list
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        GoalFactory(category=category, user=user)
+        authenticated_user.get(self.url)
+
+        authenticated_user.patch(
+            reverse("profile"), data=json.dumps({"username": "renamed"}), content_type="application/json"
+        )
+        response: Response = authenticated_user.get(self.url)
+        user.save(update_fields=("last_login",))
+
+        assert response.data[0]["user"]["username"] == "renamed", "Список не обновлен"
+        assert authenticated_user.get(self.url)["X-Cache"] == "HIT", "Вход сбросил кэш"
+
+    def test_lock_released_on_error(self, authenticated_user, category, settings, monkeypatch) -> None:
+        """
+        Test to check that a request failing to revalidate a stale list releases the lock
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            category: A fixture that creates a category on a board of the user
+            settings: A fixture that overrides Django settings
+            monkeypatch: A fixture that ages the list and makes the revalidation fail once
+
+        Checks:
+            - The next request revalidates the list instead of serving it stale
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        settings.LIST_CACHE_STALE_AFTER = 60
+        url: str = reverse("category_list")
+        authenticated_user.get(url)
+
+        now: Callable[[], float] = time.time
+        monkeypatch.setattr(time, "time", lambda: now() + 120)
+        list_page: Callable = CompiledListMixin.list
+        failures: list = [RuntimeError]
+
+        def fail_once(view, *args, **kwargs) -> Response:
+            if failures:
+                raise failures.pop()
+            return list_page(view, *args, **kwargs)
+
+        monkeypatch.setattr(CompiledListMixin, "list", fail_once)
+        with pytest.raises(RuntimeError):
+            authenticated_user.get(url)
+
+        assert authenticated_user.get(url)["X-Cache"] == "MISS", "Блокировка не снята"
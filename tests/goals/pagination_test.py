@@ -0,0 +1,132 @@
+from typing import List
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+
+from goals.models.goal import Goal
+from tests.factories import BoardFactory, GoalCategoryFactory, BoardParticipantFactory, GoalFactory, GoalCommentFactory
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tests
+class TestKeysetPagination:
+    """Tests for the opt-in keyset pagination of list views"""
+
+    @staticmethod
+    def _walk(client, url: str) -> List[int]:
+        """Follows 'next' links from the first keyset page and collects ids"""
+        ids: List[int] = []
+        while url:
+            response: Response = client.get(url)
+            assert response.status_code == status.HTTP_200_OK, "Запрос не прошел"
+            assert "count" not in response.data, "Курсорная страница содержит count"
+            ids.extend(item["id"] for item in response.data["results"])
+            url = response.data["next"]
+
+        return ids
+
+    @pytest.mark.django_db
+    def test_goal_list_keyset_order(self, authenticated_user, user) -> None:
+        """
+        Test to check that walking the goal list by cursor returns
+        every goal once in the default list order
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+
+        Checks:
+            - Every goal is returned exactly once
+            - Order matches '-priority, due_date, id'
+            - No COUNT query is executed apart from the conditional request validators
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        category = GoalCategoryFactory(board=board)
+        for priority in Goal.Priority.values:
+            GoalFactory.create_batch(size=3, category=category, priority=priority)
+        BoardParticipantFactory(board=board, user=user)
+
+        url: str = reverse("goal_list")
+        expected_ids: List[int] = list(
+            Goal.objects.order_by("-priority", "due_date", "id").values_list("id", flat=True)
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            keyset_ids: List[int] = self._walk(authenticated_user, f"{url}?cursor=&limit=5")
+
+        assert keyset_ids == expected_ids, "Порядок целей не совпадает"
+        assert not any(
+            "COUNT(" in query["sql"] and "MAX(" not in query["sql"]
+            for query in queries.captured_queries
+        ), "Выполнен запрос COUNT"
+
+    # ----------------------------------------------------------------
+    @pytest.mark.django_db
+    def test_comment_list_keyset_previous(self, authenticated_user, user) -> None:
+        """
+        Test to check that the 'previous' link of a keyset page
+        returns the page the client came from
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+
+        Checks:
+            - Previous page of the second page equals the first page
+            - First page has no previous link
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        category = GoalCategoryFactory(board=board)
+        goal = GoalFactory(category=category)
+        GoalCommentFactory.create_batch(size=6, goal=goal)
+        BoardParticipantFactory(board=board, user=user)
+
+        url: str = f"{reverse('comment_list')}?cursor=&limit=3"
+        first_page: Response = authenticated_user.get(url)
+        second_page: Response = authenticated_user.get(first_page.data["next"])
+        previous_page: Response = authenticated_user.get(second_page.data["previous"])
+
+        assert first_page.data["previous"] is None, "У первой страницы есть предыдущая"
+        assert (
+            previous_page.data["results"] == first_page.data["results"]
+        ), "Предыдущая страница не совпадает с первой"
+
+    # ----------------------------------------------------------------
+    @pytest.mark.django_db
+    def test_keyset_invalid_cursor(self, authenticated_user) -> None:
+        """
+        Test to check that a malformed cursor is rejected
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+
+        Checks:
+            - Response status code is 404
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        response: Response = authenticated_user.get(
+            f"{reverse('board_list')}?cursor=not-a-cursor"
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND, "Запрос дал результат"
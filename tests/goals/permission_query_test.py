@@ -0,0 +1,123 @@
+import json
+from typing import Dict, List
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+
+from goals.permissions import BoardPermission, GoalCategoryPermission, GoalCommentPermission, GoalPermission
+from tests.factories import BoardFactory, GoalCategoryFactory, BoardParticipantFactory, GoalFactory, GoalCommentFactory
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create fixtures
+@pytest.fixture
+def board_objects(user) -> Dict:
+    """A fixture that creates a board owned by the user with a category, a goal and a comment"""
+    board = BoardFactory()
+    category = GoalCategoryFactory(board=board)
+    goal = GoalFactory(category=category)
+    comment = GoalCommentFactory(goal=goal)
+    BoardParticipantFactory(board=board, user=user)
+    return {"board": board, "category": category, "goal": goal, "comment": comment}
+
+
+@pytest.fixture
+def authorization_queries(monkeypatch) -> Dict[str, List]:
+    """
+    A fixture that records the queries run before and inside
+    the object permission checks of every request
+    """
+    recorded: Dict[str, List] = {"before": [], "inside": []}
+
+    for permission_class in (
+        BoardPermission,
+        GoalCategoryPermission,
+        GoalPermission,
+        GoalCommentPermission,
+    ):
+        original = permission_class.has_object_permission
+
+        def spy(self, request, view, obj, original=original) -> bool:
+            recorded["before"].append(len(connection.queries))
+            with CaptureQueriesContext(connection) as queries:
+                result: bool = original(self, request, view, obj)
+            recorded["inside"].extend(queries.captured_queries)
+            return result
+
+        monkeypatch.setattr(permission_class, "has_object_permission", spy)
+
+    return recorded
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tests
+@pytest.mark.django_db
+class TestObjectPermissionQueries:
+    """Tests for the number of queries needed to authorize detail requests"""
+
+    @pytest.mark.parametrize(
+        "url_name, object_name, update_method, update_data",
+        (
+            ("board", "board", "put", {"title": "New title", "participants": []}),
+            ("category", "category", "patch", {"title": "New title"}),
+            ("goal", "goal", "patch", {"title": "New title"}),
+            ("comment", "comment", "patch", {"text": "New text"}),
+        ),
+    )
+    @pytest.mark.parametrize("method", ("get", "update", "delete"))
+    def test_detail_authorization_single_query(
+        self,
+        authenticated_user,
+        board_objects,
+        authorization_queries,
+        url_name,
+        object_name,
+        update_method,
+        update_data,
+        method,
+    ) -> None:
+        """
+        Test to check that detail, update and delete endpoints authorize
+        the user with the single query that fetches the object
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            board_objects: A fixture that creates a board with related objects
+            authorization_queries: A fixture that records authorization queries
+            url_name: Name of the detail url
+            object_name: Name of the requested object
+            update_method: HTTP method of the update request
+            update_data: Data for the update request
+            method: Kind of the request
+
+        Checks:
+            - Response status code is successful
+            - Only one query runs before the permission check
+            - Permission check runs no queries
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        url: str = reverse(url_name, kwargs={"pk": board_objects[object_name].id})
+
+        request_data: Dict = {}
+        if method == "update":
+            method = update_method
+            request_data = {"data": json.dumps(update_data), "content_type": "application/json"}
+
+        with CaptureQueriesContext(connection) as queries:
+            response: Response = getattr(authenticated_user, method)(url, **request_data)
+
+        assert status.is_success(response.status_code), "Запрос не прошел"
+        assert authorization_queries["before"], "Права доступа не проверялись"
+        assert (
+            authorization_queries["before"][0] - queries.initial_queries == 1
+        ), "Перед проверкой прав выполнено больше одного запроса"
+        assert not authorization_queries["inside"], "Проверка прав обращается к базе"
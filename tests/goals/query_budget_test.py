@@ -0,0 +1,418 @@
+import datetime
+import io
+import json
+from types import SimpleNamespace
+from typing import Callable, List, Tuple
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, reverse
+from rest_framework.response import Response
+
+from bot.models import TelegramUser
+from bot.tg.client import TgClient
+from bot.urls import urlpatterns as bot_urls
+from core.urls import urlpatterns as core_urls
+from goals.models.board import BoardParticipant
+from goals.urls import urlpatterns as goals_urls
+from tests.factories import (
+    BoardFactory,
+    BoardParticipantFactory,
+    GoalCategoryFactory,
+    GoalCommentFactory,
+    GoalFactory,
+    UserFactory,
+)
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Query budget settings
+# Page sizes, numbers of items of bulk requests and numbers of added rows every budget is checked with
+SIZES: Tuple[int, ...] = (5, 25)
+SEARCH_WORD: str = "budget"
+PASSWORD: str = "testp@ssword"
+DUE_DATE: str = (datetime.date.today() + datetime.timedelta(days=7)).isoformat()
+
+Prepare = Callable[[SimpleNamespace, int], dict]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create fixtures
+@pytest.fixture
+def world(user, monkeypatch, settings) -> SimpleNamespace:
+    """
+    A fixture that seeds a board of the user with many participants, categories, goals and comments
+    and a board where the user is a viewer
+    """
+    settings.EVENTS_NOTIFY = False
+    settings.EVENTS_STREAM_TIMEOUT = 0
+    # Hashing the passwords of the seeded users would take most of the time of the suite
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+    reset_password(SimpleNamespace(user=user))
+    monkeypatch.setattr(TgClient, "send_message", lambda *args, **kwargs: None)
+
+    board = BoardFactory()
+    BoardParticipantFactory(board=board, user=user)
+    members: list = [UserFactory(username=f"participant_{number}") for number in range(30)]
+    for member in members:
+        BoardParticipantFactory(board=board, user=member, role=BoardParticipant.Role.moderator)
+    categories: list = [
+        GoalCategoryFactory(board=board, user=members[number % 30]) for number in range(30)
+    ]
+    goals: list = [
+        GoalFactory(category=categories[number % 3], user=members[number % 30], title=f"{SEARCH_WORD} {number}")
+        for number in range(60)
+    ]
+    comments: list = [GoalCommentFactory(goal=goals[number % 10], user=members[number % 30]) for number in range(60)]
+
+    viewer_board = BoardFactory()
+    BoardParticipantFactory(board=viewer_board, user=user, role=BoardParticipant.Role.viewer)
+    GoalFactory.create_batch(size=5, user=user, category=GoalCategoryFactory(board=viewer_board, user=user))
+
+    return SimpleNamespace(
+        user=user, board=board, categories=categories, goals=goals, comments=comments, category=categories[0]
+    )
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create helpers
+def add_goals(world: SimpleNamespace, size: int) -> None:
+    """Adds goals matching the search word, so an unpaginated request reads more rows for a larger size"""
+    GoalFactory.create_batch(size=size, user=world.user, category=world.category, title=f"{SEARCH_WORD} added")
+
+
+def owned_board(world: SimpleNamespace, size: int) -> int:
+    """Creates a board of the user with goals and returns its id"""
+    category = GoalCategoryFactory(board=BoardParticipantFactory(user=world.user).board, user=world.user)
+    GoalFactory.create_batch(size=size, user=world.user, category=category)
+    return category.board_id
+
+
+def new_users(size: int) -> List[str]:
+    """Returns the usernames of new users"""
+    return [UserFactory(username=f"member_{size}_{number}").username for number in range(size)]
+
+
+def import_file(world: SimpleNamespace, size: int) -> io.BytesIO:
+    """Returns a CSV file with goals to import"""
+    lines: List[str] = ["category,title,due_date"]
+    lines += [f"{world.category.id},Цель {number},{DUE_DATE}" for number in range(size)]
+    file = io.BytesIO("\n".join(lines).encode())
+    file.name = "goals.csv"
+    return file
+
+
+def reset_password(world: SimpleNamespace) -> None:
+    """Sets the password the request changes"""
+    world.user.set_password(PASSWORD)
+    world.user.save(update_fields=("password",))
+
+
+def create_telegram_user(size: int) -> str:
+    """Creates a Telegram user waiting for verification and returns its code"""
+    telegram_user = TelegramUser.objects.create(tg_chat_id=size, verification_code=f"{size:06d}")
+    return telegram_user.verification_code
+
+
+def list_request(route: str, **params) -> Prepare:
+    """Returns the preparation of a page of a list with the size as the limit"""
+    return lambda world, size: {"path": reverse(route), "data": {**params, "limit": size}}
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Query budgets
+# Route name, method, exact number of queries and the preparation of the request for a size
+CASES: List[Tuple[str, str, int, Prepare]] = [
+    # Boards
+    ("board_create", "post", 2, lambda world, size: {"path": reverse("board_create"), "data": {"title": "Доска"}}),
+    ("board_list", "get", 4, list_request("board_list")),
+    ("board", "get", 2, lambda world, size: {"path": reverse("board", kwargs={"pk": world.board.id})}),
+    (
+        "board",
+        "put",
+        11,
+        lambda world, size: {
+            "path": reverse("board", kwargs={"pk": world.board.id}),
+            "data": {
+                "title": "Доска",
+                "participants": [
+                    {"user": username, "role": BoardParticipant.Role.moderator} for username in new_users(size)
+                ],
+            },
+            "format": "json",
+        },
+    ),
+    (
+        "board",
+        "delete",
+        8,
+        lambda world, size: {"path": reverse("board", kwargs={"pk": owned_board(world, size)})},
+    ),
+    (
+        "board_participants",
+        "get",
+        3,
+        lambda world, size: {
+            "path": reverse("board_participants", kwargs={"pk": world.board.id}), "data": {"limit": size}
+        },
+    ),
+    (
+        "board_participants",
+        "patch",
+        7,
+        lambda world, size: {
+            "path": reverse("board_participants", kwargs={"pk": world.board.id}),
+            "data": {"add": [{"user": username, "role": BoardParticipant.Role.viewer} for username in new_users(size)]},
+            "format": "json",
+        },
+    ),
+    ("board_stats", "get", 2, lambda world, size: {"path": reverse("board_stats", kwargs={"pk": world.board.id})}),
+    # Categories
+    (
+        "category_create",
+        "post",
+        3,
+        lambda world, size: {
+            "path": reverse("category_create"), "data": {"board": world.board.id, "title": "Категория"}
+        },
+    ),
+    ("category_list", "get", 4, list_request("category_list")),
+    ("category", "get", 1, lambda world, size: {"path": reverse("category", kwargs={"pk": world.category.id})}),
+    (
+        "category",
+        "patch",
+        2,
+        lambda world, size: {
+            "path": reverse("category", kwargs={"pk": world.category.id}), "data": {"title": "Категория"}
+        },
+    ),
+    (
+        "category",
+        "delete",
+        5,
+        lambda world, size: {"path": reverse("category", kwargs={"pk": world.categories[size].id})},
+    ),
+    # Goals
+    (
+        "goal_create",
+        "post",
+        6,
+        lambda world, size: {
+            "path": reverse("goal_create"),
+            "data": {"category": world.category.id, "title": "Цель", "due_date": DUE_DATE},
+        },
+    ),
+    ("goal_list", "get", 4, list_request("goal_list")),
+    ("goal", "get", 1, lambda world, size: {"path": reverse("goal", kwargs={"pk": world.goals[0].id})}),
+    (
+        "goal",
+        "patch",
+        5,
+        lambda world, size: {"path": reverse("goal", kwargs={"pk": world.goals[0].id}), "data": {"title": "Цель"}},
+    ),
+    (
+        "goal",
+        "delete",
+        11,
+        lambda world, size: {"path": reverse("goal", kwargs={"pk": world.goals[size // 5].id})},
+    ),
+    (
+        "goal_export",
+        "get",
+        1,
+        lambda world, size: add_goals(world, size) or {"path": reverse("goal_export"), "data": {"format": "csv"}},
+    ),
+    (
+        "goal_import",
+        "post",
+        9,
+        lambda world, size: {"path": reverse("goal_import"), "data": {"file": import_file(world, size)}},
+    ),
+    (
+        "goal_bulk_create",
+        "post",
+        6,
+        lambda world, size: {
+            "path": reverse("goal_bulk_create"),
+            "data": [
+                {"category": world.category.id, "title": f"Цель {number}", "due_date": DUE_DATE}
+                for number in range(size)
+            ],
+            "format": "json",
+        },
+    ),
+    (
+        "goal_bulk_update",
+        "patch",
+        7,
+        lambda world, size: {
+            "path": reverse("goal_bulk_update"),
+            "data": {"ids": [goal.id for goal in world.goals[:size]], "priority": 4},
+            "format": "json",
+        },
+    ),
+    (
+        "goal_bulk_archive",
+        "post",
+        8,
+        lambda world, size: {
+            "path": reverse("goal_bulk_archive"),
+            "data": {"ids": [goal.id for goal in world.goals[-size:]]},
+            "format": "json",
+        },
+    ),
+    # Comments
+    (
+        "comment_create",
+        "post",
+        3,
+        lambda world, size: {"path": reverse("comment_create"), "data": {"goal": world.goals[0].id, "text": "Текст"}},
+    ),
+    ("comment_list", "get", 3, list_request("comment_list")),
+    ("comment", "get", 1, lambda world, size: {"path": reverse("comment", kwargs={"pk": world.comments[0].id})}),
+    (
+        "comment",
+        "patch",
+        2,
+        lambda world, size: {
+            "path": reverse("comment", kwargs={"pk": world.comments[0].id}), "data": {"text": "Текст"}
+        },
+    ),
+    (
+        "comment",
+        "delete",
+        4,
+        lambda world, size: {"path": reverse("comment", kwargs={"pk": world.comments[size].id})},
+    ),
+    (
+        "comment_bulk_create",
+        "post",
+        5,
+        lambda world, size: {
+            "path": reverse("comment_bulk_create"),
+            "data": [{"goal": world.goals[0].id, "text": f"Текст {number}"} for number in range(size)],
+            "format": "json",
+        },
+    ),
+    (
+        "comment_bulk_delete",
+        "post",
+        7,
+        lambda world, size: {
+            "path": reverse("comment_bulk_delete"),
+            "data": {"ids": [comment.id for comment in world.comments[-size:]]},
+            "format": "json",
+        },
+    ),
+    # Search, sync, events and monitoring
+    ("search", "get", 2, list_request("search", search=SEARCH_WORD)),
+    ("sync", "get", 6, lambda world, size: add_goals(world, size) or {"path": reverse("sync")}),
+    ("events", "get", 1, lambda world, size: {"path": reverse("events"), "HTTP_ACCEPT": "text/event-stream"}),
+    (
+        "cache_stats",
+        "get",
+        0,
+        lambda world, size: setattr(world.user, "is_staff", True) or {"path": reverse("cache_stats")},
+    ),
+    # Users
+    (
+        "signup",
+        "post",
+        3,
+        lambda world, size: {
+            "path": reverse("signup"),
+            "data": {"username": f"new_user_{size}", "password": PASSWORD, "password_repeat": PASSWORD},
+        },
+    ),
+    (
+        "login",
+        "post",
+        10,
+        lambda world, size: {"path": reverse("login"), "data": {"username": world.user.username, "password": PASSWORD}},
+    ),
+    ("profile", "get", 0, lambda world, size: {"path": reverse("profile")}),
+    ("profile", "patch", 2, lambda world, size: {"path": reverse("profile"), "data": {"first_name": "Имя"}}),
+    ("profile", "delete", 0, lambda world, size: {"path": reverse("profile")}),
+    (
+        "update_password",
+        "put",
+        1,
+        lambda world, size: reset_password(world) or {
+            "path": reverse("update_password"), "data": {"old_password": PASSWORD, "new_password": f"N3w-p@ss-{size}"}
+        },
+    ),
+    # Bot
+    (
+        "verify",
+        "patch",
+        2,
+        lambda world, size: {"path": reverse("verify"), "data": {"verification_code": create_telegram_user(size)}},
+    ),
+]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tests
+def test_every_route_has_budget() -> None:
+    """
+    Test to check that every route of the goals, core and bot apps has a query budget
+
+    Checks:
+        - The names of the budgeted routes are the names of all routes
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError
+    """
+    routes: set = {pattern.name for pattern in (*goals_urls, *core_urls, *bot_urls) if isinstance(pattern, URLPattern)}
+
+    assert {case[0] for case in CASES} == routes, "Не у всех маршрутов есть бюджет запросов"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("route, method, budget, prepare", CASES, ids=[f"{case[0]}-{case[1]}" for case in CASES])
+def test_query_budget(authenticated_user, world, route, method, budget, prepare) -> None:
+    """
+    Test to check that a request runs exactly its number of queries whatever the page size or the number of items
+
+    Args:
+        authenticated_user: API client with authenticated user for testing
+        world: A fixture that seeds boards with many participants, categories, goals and comments
+        route: Name of the route
+        method: HTTP method of the request
+        budget: Exact number of queries of the request
+        prepare: Function building the request for a size
+
+    Checks:
+        - The request succeeds with every size
+        - The number of queries equals the budget with every size
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError
+    """
+    counts: List[int] = []
+    for size in SIZES:
+        request: dict = prepare(world, size)
+        if "format" in request:
+            request["data"] = json.dumps(request["data"])
+            request["content_type"] = f"application/{request.pop('format')}"
+        # Every request starts with empty caches and without a session
+        cache.clear()
+        authenticated_user.cookies.clear()
+
+        with CaptureQueriesContext(connection) as queries:
+            response: Response = getattr(authenticated_user, method)(request.pop("path"), **request)
+            # Streamed responses run their queries while their content is read
+            if response.streaming:
+                b"".join(response.streaming_content)
+
+        assert response.status_code < 400, f"Запрос не прошел: {response.status_code}"
+        counts.append(len(queries))
+
+    assert counts == [budget] * len(SIZES), f"Число запросов {counts} вместо {budget}"
@@ -0,0 +1,114 @@
+import logging
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+
+from goals.models.board import Board
+from goals.models.goal import Goal
+from goals.related import plan_related, watch_lazy_loads
+from goals.serializers.board import BoardSerializer
+from goals.serializers.goal import GoalSerializer
+from tests.factories import BoardParticipantFactory, GoalCommentFactory, GoalFactory
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create fixtures
+@pytest.fixture
+def goal(user):
+    """A fixture that creates a goal with a comment on a board of the user"""
+    goal = GoalFactory()
+    BoardParticipantFactory(board=goal.board, user=user)
+    GoalCommentFactory(goal=goal)
+    return goal
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tests
+def test_plan_related() -> None:
+    """
+    Test to check that the lookups are derived from the field tree of the serializers
+
+    Checks:
+        - A nested user is joined and primary key relations are skipped
+        - Nested participants are prefetched with their users joined
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError
+    """
+    select, prefetch = plan_related(BoardSerializer)
+
+    assert plan_related(GoalSerializer) == (("user",), ()), "Неверный план цели"
+    assert (select, len(prefetch)) == ((), 1), "Неверный план доски"
+    assert prefetch[0].prefetch_to == "participants", "Участники не загружаются"
+    assert prefetch[0].queryset.query.select_related == {"user": {}}, "Пользователи участников не загружаются"
+
+
+@pytest.mark.django_db
+def test_detail_views_without_lazy_loads(authenticated_user, goal, settings, caplog) -> None:
+    """
+    Test to check that the detail views load the relations of their serializers along with the objects
+
+    Args:
+        authenticated_user: API client with authenticated user for testing
+        goal: A fixture that creates a goal with a comment on a board of the user
+        settings: A fixture that overrides the settings
+        caplog: A fixture that captures the log records
+
+    Checks:
+        - Goal, category, comment and participant responses are successful
+        - No lazy load is logged with DEBUG
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError
+    """
+    settings.DEBUG = True
+    urls: tuple = (
+        reverse("goal", kwargs={"pk": goal.id}),
+        reverse("category", kwargs={"pk": goal.category_id}),
+        reverse("comment", kwargs={"pk": goal.comments.get().id}),
+        reverse("board_participants", kwargs={"pk": goal.board_id}),
+    )
+
+    with caplog.at_level(logging.WARNING, logger="goals.related"):
+        responses: list[Response] = [authenticated_user.get(url) for url in urls]
+
+    assert all(response.status_code == status.HTTP_200_OK for response in responses), "Запрос не прошел"
+    assert not caplog.records, "Связи загружаются лениво"
+
+
+@pytest.mark.django_db
+def test_lazy_load_warning(goal, caplog) -> None:
+    """
+    Test to check that a relation loaded lazily during serialization is logged
+
+    Args:
+        goal: A fixture that creates a goal with a comment on a board of the user
+        caplog: A fixture that captures the log records
+
+    Checks:
+        - A goal fetched without its user logs a warning
+        - A goal fetched with its user logs nothing
+        - A board loading its participants in a batched load logs nothing
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError
+    """
+    with caplog.at_level(logging.WARNING, logger="goals.related"):
+        watch_lazy_loads(GoalSerializer().to_representation, "lazy")(Goal.objects.get(id=goal.id))
+        watch_lazy_loads(GoalSerializer().to_representation, "joined")(
+            Goal.objects.select_related(*plan_related(GoalSerializer)[0]).get(id=goal.id)
+        )
+        watch_lazy_loads(BoardSerializer().to_representation, "batched")(Board.objects.get(id=goal.board_id))
+
+    assert [record.getMessage().split(":")[0] for record in caplog.records] == ["lazy"], "Загрузка не отмечена"
@@ -0,0 +1,173 @@
+import json
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+
+from goals.models.board import BoardParticipant
+from goals.roles import get_board_role, get_board_roles, get_role_cache_stats
+from tests.factories import BoardFactory, BoardParticipantFactory, UserFactory
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tests
+@pytest.mark.django_db
+class TestBoardRoleCache:
+    """Tests for the cross-request board role cache"""
+
+    def test_roles_cached_between_calls(self, user, django_assert_num_queries) -> None:
+        """
+        Test to check that roles are loaded once and then served from the cache
+
+        Args:
+            user: A fixture that creates a user instance
+            django_assert_num_queries: A fixture that counts database queries
+
+        Checks:
+            - First call runs one query
+            - Second call runs no queries and counts a hit
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        BoardParticipantFactory(board=board, user=user, role=BoardParticipant.Role.moderator)
+        hits: int = get_role_cache_stats()["hits"]
+
+        with django_assert_num_queries(1):
+            get_board_roles(user.id)
+        with django_assert_num_queries(0):
+            role = get_board_role(user, board.id)
+
+        assert role == BoardParticipant.Role.moderator, "Роль не совпадает"
+        assert get_role_cache_stats()["hits"] == hits + 1, "Попадание в кэш не учтено"
+
+    def test_roles_invalidated_on_participant_changes(self, user) -> None:
+        """
+        Test to check that creating, updating and deleting a participant
+        drops the cached roles of the user
+
+        Args:
+            user: A fixture that creates a user instance
+
+        Checks:
+            - Cached role follows every change of the participant
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        assert get_board_role(user, board.id) is None, "Роль у неучастника"
+
+        participant = BoardParticipantFactory(board=board, user=user)
+        assert get_board_role(user, board.id) == BoardParticipant.Role.owner, "Создание не учтено"
+
+        participant.role = BoardParticipant.Role.viewer
+        participant.save()
+        assert get_board_role(user, board.id) == BoardParticipant.Role.viewer, "Изменение не учтено"
+
+        BoardParticipant.objects.filter(id=participant.id).delete()
+        assert get_board_role(user, board.id) is None, "Удаление не учтено"
+
+    def test_roles_read_before_change_not_cached(self, user, monkeypatch) -> None:
+        """
+        Test to check that roles read before a participant change are not served after it,
+        even when they are written to the cache after the invalidation
+
+        Args:
+            user: A fixture that creates a user instance
+            monkeypatch: A fixture that patches objects for the test
+
+        Checks:
+            - Roles written after the invalidation are not read by the next call
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        participant = BoardParticipantFactory(board=board, user=user)
+
+        def set_after_change(key, value, *args, **kwargs) -> None:
+            # The participant is removed between the query and the write of the roles
+            monkeypatch.undo()
+            participant.delete()
+            cache.set(key, value, *args, **kwargs)
+
+        monkeypatch.setattr(cache, "set", set_after_change)
+        get_board_roles(user.id)
+
+        assert get_board_role(user, board.id) is None, "Прочитаны устаревшие роли"
+
+    def test_roles_invalidated_on_board_update(self, authenticated_user, user) -> None:
+        """
+        Test to check that removing a participant through the board update
+        drops the cached roles of the removed user
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+
+        Checks:
+            - Response status code is 200
+            - Removed participant has no cached role
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        BoardParticipantFactory(board=board, user=user)
+        member = UserFactory()
+        BoardParticipantFactory(board=board, user=member, role=BoardParticipant.Role.moderator)
+        assert get_board_role(member, board.id) == BoardParticipant.Role.moderator
+
+        response: Response = authenticated_user.put(
+            reverse("board", kwargs={"pk": board.id}),
+            data=json.dumps({"title": board.title, "participants": []}),
+            content_type="application/json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK, "Запрос не прошел"
+        assert get_board_role(member, board.id) is None, "Роль удаленного участника в кэше"
+
+    def test_cache_stats_admin_only(self, authenticated_user, user) -> None:
+        """
+        Test to check that cache counters are available only to staff users
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+
+        Checks:
+            - Response status code is 403 for a regular user
+            - Response contains role cache counters for a staff user
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        url: str = reverse("cache_stats")
+
+        forbidden: Response = authenticated_user.get(url)
+        user.is_staff = True
+        user.save()
+        response: Response = authenticated_user.get(url)
+
+        assert forbidden.status_code == status.HTTP_403_FORBIDDEN, "Отказ в доступе не предоставлен"
+        assert response.status_code == status.HTTP_200_OK, "Запрос не прошел"
+        assert "hit_rate" in response.data["board_roles"], "Нет счетчиков кэша ролей"
@@ -0,0 +1,119 @@
+import pytest
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+
+from tests.factories import BoardFactory, GoalCategoryFactory, BoardParticipantFactory, GoalFactory
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Skip the module on databases without pg_trgm
+pytestmark = pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Trigram search is Postgres specific"
+)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tests
+@pytest.mark.django_db
+class TestTrigramSearch:
+    """Tests for fuzzy search of goals and categories"""
+
+    def test_goal_search_tolerates_typos(self, authenticated_user, user) -> None:
+        """
+        Test to check that goals are found by a misspelled query
+        and ordered by similarity of the title or description
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+
+        Checks:
+            - Response status code is 200
+            - Goals similar to the query are found, the closest one first
+            - Unrelated goals are not found
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        category = GoalCategoryFactory(board=board)
+        BoardParticipantFactory(board=board, user=user)
+        exact = GoalFactory(category=category, title="Изучить программирование", priority=1)
+        described = GoalFactory(
+            category=category, title="Курс", description="Основы программирования", priority=4
+        )
+        GoalFactory(category=category, title="Купить молоко", description="")
+
+        response: Response = authenticated_user.get(
+            reverse("goal_list"), {"search": "програмирование"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK, "Запрос не прошел"
+        assert [goal["id"] for goal in response.data] == [exact.id, described.id], "Поиск не совпадает"
+
+    def test_goal_search_matches_substring(self, authenticated_user, user) -> None:
+        """
+        Test to check that a short query contained in a title is still found
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+
+        Checks:
+            - Response status code is 200
+            - Goal containing the query is found
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        category = GoalCategoryFactory(board=board)
+        BoardParticipantFactory(board=board, user=user)
+        goal = GoalFactory(category=category, title="Прочитать книгу", description="")
+        GoalFactory(category=category, title="Купить молоко", description="")
+
+        response: Response = authenticated_user.get(reverse("goal_list"), {"search": "ниг"})
+
+        assert response.status_code == status.HTTP_200_OK, "Запрос не прошел"
+        assert [goal["id"] for goal in response.data] == [goal.id], "Поиск не совпадает"
+
+    def test_category_search_with_cursor(self, authenticated_user, user) -> None:
+        """
+        Test to check that ranked category search works with keyset pagination
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+
+        Checks:
+            - Response status code is 200
+            - Pages contain every matching category once, the closest one first
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = BoardFactory()
+        BoardParticipantFactory(board=board, user=user)
+        closest = GoalCategoryFactory(board=board, title="Работа")
+        others = [GoalCategoryFactory(board=board, title=f"Работа {number}") for number in range(3)]
+        GoalCategoryFactory(board=board, title="Отдых")
+
+        url: str = reverse("category_list")
+        first: Response = authenticated_user.get(url, {"search": "Робота", "cursor": "", "limit": 2})
+        second: Response = authenticated_user.get(first.data["next"])
+
+        found: list = [category["id"] for category in first.data["results"] + second.data["results"]]
+
+        assert first.status_code == status.HTTP_200_OK, "Запрос не прошел"
+        assert found[0] == closest.id, "Ближайшая категория не первая"
+        assert sorted(found) == sorted([closest.id] + [category.id for category in others]), "Поиск не совпадает"
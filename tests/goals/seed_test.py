@@ -0,0 +1,75 @@
+import io
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db.models import Count, F, Q
+
+from core.models import User
+from goals.models.board import Board, BoardParticipant
+from goals.models.goal import Goal
+from goals.models.goal_category import GoalCategory
+from goals.models.goal_comment import GoalComment
+from goals.stats import verify_goal_stats
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tests
+@pytest.mark.django_db
+def test_seed_todolist() -> None:
+    """
+    Test to check that the seed command creates a consistent dataset of the requested size
+
+    Checks:
+        - Every model gets the requested number of rows
+        - Every board has a single owner and every user shares the password
+        - Goals and comments belong to the boards of their categories and goals
+        - Goals of deleted boards and categories are archived
+        - Comments are created after their goals and search vectors are stored
+        - The goal statistics match the goals
+        - A second run with the same prefix fails
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError
+    """
+    options: tuple = (
+        *("--users", "30", "--boards", "6", "--participants", "12", "--categories", "15"),
+        *("--goals", "200", "--comments", "300", "--chunk-size", "40"),
+        # The seed gives a deleted category with goals
+        *("--seed", "4"),
+    )
+    call_command("seed_todolist", *options, stdout=io.StringIO())
+
+    assert (
+        User.objects.count(),
+        Board.objects.count(),
+        BoardParticipant.objects.count(),
+        GoalCategory.objects.count(),
+        Goal.objects.count(),
+        GoalComment.objects.count(),
+    ) == (30, 6, 18, 15, 200, 300), "Неверный размер данных"
+    assert set(
+        BoardParticipant.objects.filter(role=BoardParticipant.Role.owner)
+        .values("board")
+        .annotate(owners=Count("id"))
+        .values_list("owners", flat=True)
+    ) == {1}, "У доски не один владелец"
+    assert User.objects.get(username="seed_0").check_password("seedp@ssword"), "Неверный пароль"
+    assert len(set(User.objects.values_list("password", flat=True))) == 1, "Пароль хеширован не один раз"
+    assert not Goal.objects.exclude(category__board=F("board")).exists(), "Цель не на доске категории"
+    assert not GoalComment.objects.exclude(goal__board=F("board")).exists(), "Комментарий не на доске цели"
+    assert Goal.objects.filter(category__is_deleted=True).exists(), "Нет целей удаленных категорий"
+    assert not GoalCategory.objects.filter(board__is_deleted=True, is_deleted=False).exists(), "Категория не удалена"
+    assert not (
+        Goal.objects.filter(Q(board__is_deleted=True) | Q(category__is_deleted=True))
+        .exclude(status=Goal.Status.archived)
+        .exists()
+    ), "Цель удаленной категории не в архиве"
+    assert not GoalComment.objects.filter(created__lt=F("goal__created")).exists(), "Комментарий раньше цели"
+    assert not Goal.objects.filter(search_vector=None).exists(), "Поисковые векторы не заполнены"
+    assert not verify_goal_stats(Goal.objects.all()), "Статистика не совпадает"
+
+    with pytest.raises(CommandError):
+        call_command("seed_todolist", *options, stdout=io.StringIO())
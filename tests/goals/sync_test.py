@@ -0,0 +1,190 @@
+import json
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+
+from goals.models.board import BoardParticipant
+from goals.models.goal import Goal
+from tests.factories import (
+    BoardFactory,
+    BoardParticipantFactory,
+    GoalCategoryFactory,
+    GoalCommentFactory,
+    GoalFactory,
+    UserFactory,
+)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create fixtures
+@pytest.fixture(autouse=True)
+def no_cursor_lag(settings) -> None:
+    """A fixture that issues cursors at the moment of the response"""
+    settings.SYNC_CURSOR_LAG = 0
+
+
+@pytest.fixture
+def category(user):
+    """A fixture that creates a category on a board of the user"""
+    board = BoardFactory()
+    BoardParticipantFactory(board=board, user=user)
+    return GoalCategoryFactory(board=board)
+
+
+def _ids(items: list) -> list:
+    """Returns the ids of serialized objects"""
+    return [item["id"] for item in items]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Create tests
+@pytest.mark.django_db
+class TestSyncView:
+    """Tests for the delta sync of boards, categories, goals, comments and participants"""
+
+    url: str = reverse("sync")
+
+    def test_full_sync(self, authenticated_user, category) -> None:
+        """
+        Test to check that a sync without a cursor returns everything the user can see
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            category: A fixture that creates a category on a board of the user
+
+        Checks:
+            - Response status code is 200
+            - Archived goals, deleted categories and foreign objects are left out
+            - Response contains a cursor
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        goal = GoalFactory(category=category)
+        comment = GoalCommentFactory(goal=goal)
+        GoalFactory(category=category, status=Goal.Status.archived)
+        GoalCategoryFactory(board=category.board, is_deleted=True)
+        GoalFactory()
+
+        response: Response = authenticated_user.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK, "Запрос не прошел"
+        assert _ids(response.data["boards"]) == [category.board_id], "Доски не совпадают"
+        assert _ids(response.data["categories"]) == [category.id], "Категории не совпадают"
+        assert _ids(response.data["goals"]) == [goal.id], "Цели не совпадают"
+        assert _ids(response.data["comments"]) == [comment.id], "Комментарии не совпадают"
+        assert response.data["cursor"], "Курсор не получен"
+
+    def test_delta_sync(self, authenticated_user, user, category, django_assert_max_num_queries) -> None:
+        """
+        Test to check that a sync with a cursor returns only the changes
+        with tombstones of deleted comments and participants
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+            category: A fixture that creates a category on a board of the user
+            django_assert_max_num_queries: A fixture that counts database queries
+
+        Checks:
+            - Unchanged objects are not returned
+            - Changed and archived goals are returned
+            - Comments of the archived goal and the removed participant are returned as deleted
+            - Removed participant gets the board as revoked
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        board = category.board
+        changed_goal, archived_goal, unchanged_goal = GoalFactory.create_batch(size=3, category=category)
+        comment = GoalCommentFactory(goal=archived_goal)
+        GoalCommentFactory(goal=unchanged_goal)
+        member = UserFactory()
+        participant = BoardParticipantFactory(board=board, user=member, role=BoardParticipant.Role.viewer)
+        member_client = APIClient()
+        member_client.force_authenticate(member)
+
+        cursor: str = authenticated_user.get(self.url).data["cursor"]
+        member_cursor: str = member_client.get(self.url).data["cursor"]
+
+        authenticated_user.patch(
+            reverse("goal", kwargs={"pk": changed_goal.id}),
+            data=json.dumps({"title": "Новое название"}),
+            content_type="application/json",
+        )
+        authenticated_user.delete(reverse("goal", kwargs={"pk": archived_goal.id}))
+        authenticated_user.put(
+            reverse("board", kwargs={"pk": board.id}),
+            data=json.dumps({"title": board.title, "participants": []}),
+            content_type="application/json",
+        )
+
+        with django_assert_max_num_queries(9):
+            response: Response = authenticated_user.get(self.url, {"since": cursor})
+        revoked: Response = member_client.get(self.url, {"since": member_cursor})
+
+        assert response.status_code == status.HTTP_200_OK, "Запрос не прошел"
+        assert _ids(response.data["boards"]) == [board.id], "Доски не совпадают"
+        assert _ids(response.data["categories"]) == [], "Категории не совпадают"
+        assert _ids(response.data["goals"]) == [changed_goal.id, archived_goal.id], "Цели не совпадают"
+        assert response.data["goals"][1]["status"] == Goal.Status.archived, "Цель не в архиве"
+        assert _ids(response.data["comments"]) == [], "Комментарии не совпадают"
+        assert response.data["deleted"] == {"comments": [comment.id], "participants": [participant.id]}
+        assert response.data["revoked_boards"] == [], "Получены чужие отзывы доступа"
+        assert revoked.data["revoked_boards"] == [board.id], "Отзыв доступа не получен"
+        assert revoked.data["goals"] == [], "Получены цели доски без доступа"
+
+    def test_sync_joined_board(self, authenticated_user, user) -> None:
+        """
+        Test to check that a board the user joined after the cursor is returned in full
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+            user: A fixture that creates a user instance
+
+        Checks:
+            - Goals of the board created before the cursor are returned
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        goal = GoalFactory()
+        cursor: str = authenticated_user.get(self.url).data["cursor"]
+        BoardParticipantFactory(board=goal.board, user=user, role=BoardParticipant.Role.viewer)
+
+        response: Response = authenticated_user.get(self.url, {"since": cursor})
+
+        assert _ids(response.data["boards"]) == [goal.board_id], "Доски не совпадают"
+        assert _ids(response.data["goals"]) == [goal.id], "Цели не совпадают"
+
+    def test_sync_invalid_cursor(self, authenticated_user) -> None:
+        """
+        Test to check that an invalid cursor is rejected
+
+        Args:
+            authenticated_user: API client with authenticated user for testing
+
+        Checks:
+            - Response status code is 400
+
+        Returns:
+            None
+
+        Raises:
+            AssertionError
+        """
+        response: Response = authenticated_user.get(self.url, {"since": "вчера"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, "Курсор принят"